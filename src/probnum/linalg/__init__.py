@@ -15,8 +15,18 @@ __all__ = [
     "AsymmetricMatrixBasedSolver",
     "SymmetricMatrixBasedSolver",
     "SolutionBasedSolver",
+    "DirectSolver",
+    "RecycledSubspace",
+    "JacobiPreconditioner",
+    "IncompleteCholeskyPreconditioner",
+    "DeflationPreconditioner",
 ]
 
 # Set correct module paths. Corrects links and module paths in documentation.
 ProbabilisticLinearSolver.__module__ = "probnum.linalg"
 MatrixBasedSolver.__module__ = "probnum.linalg"
+DirectSolver.__module__ = "probnum.linalg"
+RecycledSubspace.__module__ = "probnum.linalg"
+JacobiPreconditioner.__module__ = "probnum.linalg"
+IncompleteCholeskyPreconditioner.__module__ = "probnum.linalg"
+DeflationPreconditioner.__module__ = "probnum.linalg"
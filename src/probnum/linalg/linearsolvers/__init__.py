@@ -1,3 +1,6 @@
 from probnum.linalg.linearsolvers.linearsolvers import *
 from probnum.linalg.linearsolvers.matrixbased import *
 from probnum.linalg.linearsolvers.solutionbased import *
+from probnum.linalg.linearsolvers.direct import *
+from probnum.linalg.linearsolvers.recycling import *
+from probnum.linalg.linearsolvers.preconditioners import *
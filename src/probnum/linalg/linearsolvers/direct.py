@@ -0,0 +1,245 @@
+"""
+Direct probabilistic linear solvers.
+
+For moderately sized (sparse) linear systems a single factorization of the system matrix is often cheaper than any
+Krylov iteration. This module implements a solver which factorizes the system matrix once and returns beliefs over the
+solution, the matrix and its inverse whose means are backed by the factorization and whose covariances reflect the
+rounding error of a backward stable direct solver.
+"""
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+
+from probnum import prob
+from probnum.linalg import linops
+from probnum.linalg.linearsolvers.matrixbased import ProbabilisticLinearSolver
+
+
+class DirectSolver(ProbabilisticLinearSolver):
+    """
+    Direct solver based on a factorization of the system matrix.
+
+    Factorizes the system matrix once, via a (sparse) Cholesky decomposition if it is symmetric positive definite and
+    an (sparse) LU decomposition otherwise, and solves for all right hand sides with the factorization. The computed
+    solution :math:`x` is the exact solution of a perturbed system :math:`(A+E)x=b`, where the backward error is
+    modelled as :math:`E \\sim \\mathcal{N}(0, W_0 \\otimes_s W_0)` with :math:`W_0 = \\delta I` for a symmetric matrix
+    (:math:`W_0 \\otimes W_0` otherwise) and :math:`\\delta = \\varepsilon \\max_{ij} \\lvert A_{ij} \\rvert` the
+    machine precision relative to the largest entry of :math:`A`. The beliefs over the inverse :math:`H=A^{-1}` and the
+    solution follow from first-order error propagation, e.g. for a symmetric matrix
+
+    .. math::
+        H \\sim \\mathcal{N}(A^{-1}, \\delta^2 H^2 \\otimes_s H^2), \\qquad
+        x \\sim \\mathcal{N}\\Big(A^{-1}b, \\frac{\\delta^2}{2}\\big(\\lVert x \\rVert^2 H^2 + Hxx^\\top H\\big)\\Big).
+
+    The means and covariances are linear operators which apply the factorization, such that no dense inverse is
+    formed. The factorization is cached in the returned posterior mean of :math:`A` and reused if it is passed as the
+    system matrix of a subsequent solve.
+
+    Parameters
+    ----------
+    A : array-like or scipy.sparse.spmatrix or MatrixMult, shape=(n,n)
+        The square system matrix given explicitly. A :class:`~probnum.linalg.linops.MatrixMult` with a cached
+        factorization is used as is.
+    b : array_like, shape=(n,) or (n, nrhs)
+        Right-hand side vector or matrix in :math:`A x = b`.
+    assume_A : str, default="sympos"
+        Assumptions on the system matrix, which determine the factorization, see :func:`problinsolve`.
+
+    See Also
+    --------
+    problinsolve : Solve linear systems in a Bayesian framework.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import scipy.sparse
+    >>> from probnum.linalg import DirectSolver
+    >>> A = scipy.sparse.diags([-1., 2., -1.], offsets=[-1, 0, 1], shape=(5, 5))
+    >>> x, A_post, Ainv_post, info = DirectSolver(A=A, b=np.ones(5)).solve()
+    >>> x.mean()
+    array([2.5, 4. , 4.5, 4. , 2.5])
+    >>> info["conv_crit"]
+    'direct'
+    """
+
+    def __init__(self, A, b, assume_A="sympos"):
+        if isinstance(b, prob.RandomVariable):
+            b = b.mean()
+        b = np.asarray(b)
+        if b.ndim == 1:
+            b = b[:, None]
+        self.A_op = self._factorizable_operator(A=A, assume_A=assume_A)
+        super().__init__(A=self.A_op, b=b)
+        self.symmetric = self.A_op.symmetric
+
+    @staticmethod
+    def _factorizable_operator(A, assume_A):
+        """Linear operator defined via the matrix of the linear system which caches its factorization."""
+        if isinstance(A, linops.MatrixMult) and A.cache_factorization:
+            return A
+        elif isinstance(A, linops.MatrixMult):
+            A = A.A
+        elif isinstance(A, prob.RandomVariable) or isinstance(
+            A, scipy.sparse.linalg.LinearOperator
+        ):
+            raise TypeError(
+                "The direct solver requires the system matrix to be given explicitly as a (sparse) matrix or "
+                "matrix-based linear operator."
+            )
+        if not np.issubdtype(A.dtype, np.inexact):
+            A = A.astype(float)
+
+        op_kwargs = {
+            "symmetric": "sym" in assume_A,
+            "positive_definite": "sym" in assume_A and "pos" in assume_A,
+            "cache_factorization": True,
+        }
+        if scipy.sparse.issparse(A):
+            return linops.SparseMatrixMult(A=A, **op_kwargs)
+        return linops.MatrixMult(A=np.asarray(A), **op_kwargs)
+
+    def _backward_error_scale(self):
+        """Scale of the backward error of the factorization relative to the largest entry of the matrix."""
+        A = self.A_op.A
+        if scipy.sparse.issparse(A):
+            maxabs = abs(A).max() if A.nnz > 0 else 0.0
+        else:
+            maxabs = np.max(np.abs(A))
+        return np.finfo(self.dtype).eps * maxabs
+
+    def solve(self, callback=None, **kwargs):
+        """
+        Solve the linear system :math:`Ax=b` via a factorization of :math:`A`.
+
+        Parameters
+        ----------
+        callback : function, optional
+            Not used, since the direct solver performs no iterations.
+        kwargs
+            Not used, since the direct solver has no convergence criteria.
+
+        Returns
+        -------
+        x : RandomVariable, shape=(n,) or (n, nrhs)
+            Solution :math:`x` to the linear system. Shape of the return matches the shape of ``b``.
+        A : RandomVariable, shape=(n,n)
+            Posterior belief over the linear operator with the factorization-backed mean.
+        Ainv : RandomVariable, shape=(n,n)
+            Posterior belief over the linear operator inverse :math:`H=A^{-1}` applied via the factorization.
+        info : dict
+            Information on the solve.
+
+        Raises
+        ------
+        LinAlgError
+            If the matrix ``A`` is singular or, assumed to be positive definite, not positive definite.
+        """
+        # Factorize once (or reuse a cached factorization) and solve for all right hand sides
+        try:
+            Ainv_mean = self.A_op.inv()
+        except RuntimeError as err:
+            # Raised by the sparse LU decomposition for singular matrices
+            raise scipy.linalg.LinAlgError("The system matrix A is singular.") from err
+        X = np.asarray(Ainv_mean @ self.b.astype(self.dtype, copy=False))
+        resid = self.A_op @ X - self.b
+
+        # Beliefs over the matrix and its inverse given the backward error of the factorization
+        delta = self._backward_error_scale()
+        A_covfactor = linops.ScalarMult(shape=(self.n, self.n), scalar=delta)
+        if self.symmetric:
+            A_cov = linops.SymmetricKronecker(A=A_covfactor)
+            Ainv_cov = linops.SymmetricKronecker(A=delta * (Ainv_mean @ Ainv_mean))
+        else:
+            A_cov = linops.Kronecker(A=A_covfactor, B=A_covfactor)
+            Ainv_cov = linops.Kronecker(
+                A=delta * (Ainv_mean @ Ainv_mean.T), B=delta * (Ainv_mean.T @ Ainv_mean)
+            )
+        A = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(mean=self.A_op, cov=A_cov),
+        )
+        Ainv = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(mean=Ainv_mean, cov=Ainv_cov),
+        )
+
+        # Belief over the solution
+        x_cov = _DirectSolutionCovariance(
+            Ainv=Ainv_mean, X=X, scale=delta ** 2, symmetric=self.symmetric
+        )
+        x_mean = X[:, 0] if X.shape[1] == 1 else X
+        x = prob.RandomVariable(
+            shape=x_mean.shape,
+            dtype=self.dtype,
+            distribution=prob.Normal(mean=x_mean, cov=x_cov),
+        )
+
+        info = {
+            "iter": 0,
+            "maxiter": 0,
+            "resid_l2norm": np.linalg.norm(resid),
+            "trace_sol_cov": None,
+            "conv_crit": "direct",
+            "rel_cond": None,
+            "factorization": self.A_op.factorize().kind,
+        }
+
+        return x, A, Ainv, info
+
+
+class _DirectSolutionCovariance(linops.LinearOperator):
+    """
+    Covariance of the solution(s) :math:`X = HB` of a direct solve induced by the backward error of the factorization.
+
+    For the backward error :math:`E \\sim \\mathcal{N}(0, \\delta^2 I \\otimes_s I)` of a symmetric matrix the
+    covariance of :math:`\\operatorname{vec}(HEX)` acts as
+
+    .. math::
+        \\operatorname{vec}(V) \\mapsto \\frac{\\delta^2}{2} \\operatorname{vec}\\big(H^2 V X^\\top X + HX V^\\top HX\\big)
+
+    and for :math:`E \\sim \\mathcal{N}(0, \\delta^2 I \\otimes I)` as
+    :math:`\\operatorname{vec}(V) \\mapsto \\delta^2 \\operatorname{vec}(HH^\\top V X^\\top X)`.
+
+    Parameters
+    ----------
+    Ainv : LinearOperator, shape=(n,n)
+        Inverse :math:`H` of the system matrix.
+    X : np.ndarray, shape=(n, nrhs)
+        Solutions of the linear system.
+    scale : float
+        Variance :math:`\\delta^2` of the entries of the backward error.
+    symmetric : bool
+        Whether the system matrix and its backward error are symmetric.
+    """
+
+    def __init__(self, Ainv, X, scale, symmetric):
+        self.Ainv = Ainv
+        self.X = X
+        self.scale = scale
+        self.symmetric = symmetric
+        self._XtX = X.T @ X
+        self._AinvX = np.asarray(Ainv @ X) if symmetric else None
+        dim = X.shape[0] * X.shape[1]
+        super().__init__(
+            dtype=np.result_type(Ainv.dtype, X.dtype), shape=(dim, dim),
+        )
+
+    def _matvec(self, v):
+        V = np.reshape(v, self.X.shape)
+        if self.symmetric:
+            Cv = 0.5 * (
+                self.Ainv @ (self.Ainv @ V) @ self._XtX
+                + self._AinvX @ V.T @ self._AinvX
+            )
+        else:
+            Cv = self.Ainv @ (self.Ainv.T @ V) @ self._XtX
+        return self.scale * np.reshape(Cv, v.shape)
+
+    def _transpose(self):
+        return self
+
+    def _adjoint(self):
+        return self
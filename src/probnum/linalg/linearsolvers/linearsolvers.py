@@ -16,10 +16,12 @@ from probnum.linalg import linops
 from probnum import utils
 from probnum.linalg.linearsolvers.matrixbased import (
     AsymmetricMatrixBasedSolver,
+    BlockSymmetricMatrixBasedSolver,
     NoisySymmetricMatrixBasedSolver,
     SymmetricMatrixBasedSolver,
 )
 from probnum.linalg.linearsolvers.solutionbased import SolutionBasedSolver
+from probnum.linalg.linearsolvers.direct import DirectSolver
 
 
 def problinsolve(
@@ -33,6 +35,10 @@ def problinsolve(
     atol=10 ** -6,
     rtol=10 ** -6,
     callback=None,
+    precision="double",
+    recycle=None,
+    M=None,
+    method="iterative",
     **kwargs
 ):
     """
@@ -50,12 +56,14 @@ def problinsolve(
 
     Parameters
     ----------
-    A : array-like or LinearOperator, shape=(n,n)
-        A square linear operator (or matrix). Only matrix-vector products :math:`Av` are used internally.
+    A : array-like or LinearOperator or RandomVariable, shape=(n,n)
+        A square linear operator (or matrix). Only matrix-vector products :math:`Av` are used internally. If ``A`` is
+        assumed to be noisy, it is either a linear operator whose products return noisy realizations :math:`(A+E)v`,
+        e.g. a kernel matrix evaluated on a random subset of the data, or a random variable.
     b : array_like or RandomVariable, shape=(n,) or (n, nrhs)
         Right-hand side vector, matrix or random variable in :math:`A x = b`. For multiple right hand sides, ``nrhs``
         problems are solved sequentially with the posteriors over the matrices acting as priors for subsequent solves.
-        If the right-hand-side is assumed to be noisy, every iteration of the solver samples a realization from ``b``.
+        If the right-hand-side is a random variable, the solver uses its mean.
     A0 : array-like or LinearOperator or RandomVariable, shape=(n,n), optional
         A square matrix, linear operator or random variable representing the prior belief over the linear operator
         :math:`A`. If an array or linear operator is given, a prior distribution is chosen automatically.
@@ -86,8 +94,47 @@ def problinsolve(
         User-supplied function called after each iteration of the linear solver. It is called as
         ``callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs)`` and can be used to return quantities from the
         iteration. Note that depending on the function supplied, this can slow down the solver considerably.
+    precision : str, default="double"
+        Floating point precision of the solver iteration. The available options are
+
+        =======================================================  ==========
+         double precision                                         ``double``
+         single precision                                         ``single``
+         single precision with double precision refinement        ``mixed``
+        =======================================================  ==========
+
+        In mixed precision the solver iterates in single precision on the correction equation
+        :math:`Ad_i = b - Ax_i`, while the residual and the refined solution :math:`x_{i+1} = x_i + \\mathbb{E}[d_i]`
+        are computed in double precision until the tolerances are met (iterative refinement). The callback is called
+        with the quantities of the current correction equation in this case.
+    recycle : RecycledSubspace, optional
+        Subspace recycled from previous solves of related linear systems, e.g. in a Newton iteration or in implicit
+        time stepping. If given, the matrix priors are deflated by the recycled subspace and the subspace is updated
+        in-place with the search directions of this solve. Cannot be combined with ``A0`` or ``Ainv0`` and requires a
+        symmetric positive definite ``A``.
+    M : LinearOperator, shape=(n,n), optional
+        Symmetric positive definite preconditioner :math:`M \\approx A^{-1}`, e.g. a :class:`JacobiPreconditioner`,
+        :class:`IncompleteCholeskyPreconditioner` or :class:`DeflationPreconditioner`. The preconditioner is the prior
+        mean and covariance factor of the inverse :math:`H`, such that the solver recovers the preconditioned conjugate
+        gradient method. If ``M`` implements ``inv()``, the resulting approximation of :math:`A` is the prior mean of
+        :math:`A`. Cannot be combined with ``A0``, ``Ainv0`` or ``recycle``.
+    method : str, default="iterative"
+        Solution method. The available options are
+
+        ==============================================  =============
+         matrix-based probabilistic linear solver        ``iterative``
+         factorization of an explicitly given ``A``      ``direct``
+        ==============================================  =============
+
+        The direct method factorizes ``A`` once via a (sparse) Cholesky or LU decomposition depending on
+        ``assume_A`` and solves for all right hand sides with the factorization, see :class:`DirectSolver`. The
+        returned beliefs have factorization-backed means and covariances at the level of the rounding error. Passing
+        the mean of the returned belief over :math:`A` as ``A`` to a subsequent solve reuses the factorization. It
+        cannot be combined with prior information, a recycled subspace, a preconditioner, noise or mixed precision and
+        ignores ``x0``.
     kwargs : optional
-        Optional keyword arguments passed onto the solver iteration.
+        Optional keyword arguments passed onto the solver iteration, e.g. ``noise_scale`` and ``batch_size`` for noisy
+        linear systems, where each observation is the average of ``batch_size`` noisy matrix-vector products.
 
     Returns
     -------
@@ -103,7 +150,11 @@ def problinsolve(
     Raises
     ------
     ValueError
-        If size mismatches detected or input matrices are not square.
+        If size mismatches detected, input matrices are not square, the precision or method is not recognized or a
+        recycled subspace or a preconditioner is combined with matrix priors or a recycled subspace is used with
+        assumptions other than a symmetric positive definite ``A``.
+    TypeError
+        If the direct method is used with a matrix-free ``A``.
     LinAlgError
         If the matrix ``A`` is singular.
     LinAlgWarning
@@ -123,6 +174,9 @@ def problinsolve(
     See Also
     --------
     bayescg : Solve linear systems with prior information on the solution.
+    DirectSolver : Direct solver based on a factorization of the system matrix.
+    RecycledSubspace : Recycled deflation subspace for sequences of linear systems.
+    JacobiPreconditioner : Jacobi (diagonal) preconditioner.
 
     Examples
     --------
@@ -135,11 +189,42 @@ def problinsolve(
     >>> x, A, Ainv, info = problinsolve(A=A, b=b)
     >>> print(info["iter"])
     9
+
+    Sparse systems of moderate size can be solved by a single factorization, which is reused for further right hand
+    sides.
+
+    >>> import scipy.sparse
+    >>> A = scipy.sparse.diags([-1., 2., -1.], offsets=[-1, 0, 1], shape=(n, n))
+    >>> x, A, Ainv, info = problinsolve(A=A, b=b, method="direct")
+    >>> x2, _, _, _ = problinsolve(A=A.mean(), b=np.ones(n), method="direct")
+    >>> np.allclose(Ainv.mean() @ np.ones(n), x2.mean())
+    True
     """
 
+    # Check solution method
+    if method not in ["iterative", "direct"]:
+        raise ValueError("Method '{}' not recognized.".format(method))
+    if method == "direct" and (
+        A0 is not None or Ainv0 is not None or recycle is not None or M is not None
+    ):
+        raise ValueError(
+            "The direct method cannot be combined with prior information on A or Ainv, a recycled subspace or a "
+            "preconditioner."
+        )
+
     # Check linear system for type and dimension mismatch
+    if M is not None:
+        if A0 is not None or Ainv0 is not None or recycle is not None:
+            raise ValueError(
+                "A preconditioner cannot be combined with prior information on A or Ainv or a recycled subspace."
+            )
+        Ainv0 = M
     _check_linear_system(A=A, b=b, A0=A0, Ainv0=Ainv0, x0=x0)
 
+    # Inverse of the preconditioner as prior mean of A
+    if M is not None:
+        A0 = _preconditioner_prior_mean(M=M, A=A)
+
     # Check matrix assumptions for correctness
     assume_A = assume_A.lower()
     _assume_A_tmp = assume_A
@@ -152,9 +237,28 @@ def problinsolve(
             )
         )
 
+    # Check floating point precision
+    if precision not in ["double", "single", "mixed"]:
+        raise ValueError("Precision '{}' not recognized.".format(precision))
+    if precision == "single":
+        A, b = _astype(A, np.float32), _astype(b, np.float32)
+        if x0 is not None:
+            x0 = _astype(x0, np.float32)
+
     # Transform the linear system to an appropriate form
     A, b, x0 = _preprocess_linear_system(A=A, b=b, x0=x0)
 
+    # Solve via a factorization of the system matrix
+    if method == "direct":
+        if "noise" in assume_A or precision == "mixed":
+            raise ValueError(
+                "The direct method is only available for linear systems without noise in single or double "
+                "precision."
+            )
+        x, A0, Ainv0, info = DirectSolver(A=A, b=b, assume_A=assume_A).solve()
+        _postprocess(info=info, A=A)
+        return x, A0, Ainv0, info
+
     # Parameter initialization
     n = A.shape[0]
     nrhs = b.shape[1]
@@ -165,38 +269,77 @@ def problinsolve(
     if maxiter is None:
         maxiter = n * 10
 
-    if nrhs > 1:
+    # Deflate the matrix priors by the recycled subspace and record the actions of the solver
+    if recycle is not None:
+        if A0 is not None or Ainv0 is not None:
+            raise ValueError(
+                "A recycled subspace cannot be combined with prior information on A or Ainv."
+            )
+        if "sym" not in assume_A or "pos" not in assume_A or "noise" in assume_A:
+            raise ValueError(
+                "Subspace recycling requires a symmetric positive definite matrix A."
+            )
+        A0, Ainv0 = recycle.prior(A)
+        search_dirs = []
+        observations = []
+        _callback = callback
+
+        def callback(sk, yk, **cb_kwargs):
+            search_dirs.append(np.reshape(sk, (n, -1)).astype(np.float64))
+            observations.append(np.reshape(yk, (n, -1)).astype(np.float64))
+            if _callback is not None:
+                _callback(sk=sk, yk=yk, **cb_kwargs)
+
+    if nrhs > 1 and _is_block_solvable(
+        A=A, b=b, x0=x, assume_A=assume_A, precision=precision, **kwargs
+    ):
+        # Solve for all right hand sides simultaneously
+        x, A0, Ainv0, info = BlockSymmetricMatrixBasedSolver(
+            A=A, b=b, A0=A0, Ainv0=Ainv0, x0=x
+        ).solve(maxiter=maxiter, atol=atol, rtol=rtol, callback=callback)
+    elif nrhs > 1:
         # Iteratively solve for multiple right hand sides (with posteriors as new priors)
         for i in range(nrhs):
             if i > 0:
                 x = None  # Only use prior information on Ainv for multiple rhs
-            # Select and initialize solver
-            linear_solver = _init_solver(
+            # Solve linear system
+            x, A0, Ainv0, info = _solve(
                 A=A,
                 b=utils.as_colvec(b[:, i]),
                 A0=A0,
                 Ainv0=Ainv0,
                 x0=x,
                 assume_A=assume_A,
-            )
-
-            # Solve linear system
-            x, A0, Ainv0, info = linear_solver.solve(
-                maxiter=maxiter, atol=atol, rtol=rtol, callback=callback, **kwargs
+                maxiter=maxiter,
+                atol=atol,
+                rtol=rtol,
+                callback=callback,
+                precision=precision,
+                **kwargs
             )
 
         # Return Ainv @ b for multiple rhs
         x = Ainv0 @ b
     else:
         # Single right hand side
-        linear_solver = _init_solver(
-            A=A, b=b, A0=A0, Ainv0=Ainv0, x0=x, assume_A=assume_A
+        x, A0, Ainv0, info = _solve(
+            A=A,
+            b=b,
+            A0=A0,
+            Ainv0=Ainv0,
+            x0=x,
+            assume_A=assume_A,
+            maxiter=maxiter,
+            atol=atol,
+            rtol=rtol,
+            callback=callback,
+            precision=precision,
+            **kwargs
         )
 
-        # Solve linear system
-        x, A0, Ainv0, info = linear_solver.solve(
-            maxiter=maxiter, atol=atol, rtol=rtol, callback=callback, **kwargs
-        )
+    # Compress the recycled subspace and the actions of this solve
+    if recycle is not None and len(search_dirs) > 0:
+        recycle.update(S=np.hstack(search_dirs), Y=np.hstack(observations))
 
     # Check result and issue warnings (e.g. singular or ill-conditioned matrix)
     _postprocess(info=info, A=A)
@@ -204,7 +347,16 @@ def problinsolve(
     return x, A0, Ainv0, info
 
 
-def bayescg(A, b, x0=None, maxiter=None, atol=None, rtol=None, callback=None):
+def bayescg(
+    A,
+    b,
+    x0=None,
+    maxiter=None,
+    atol=None,
+    rtol=None,
+    callback=None,
+    reorthogonalize=False,
+):
     """
     Conjugate Gradients using prior information on the solution of the linear system.
 
@@ -234,6 +386,17 @@ def bayescg(A, b, x0=None, maxiter=None, atol=None, rtol=None, callback=None):
         User-supplied function called after each iteration of the linear solver. It is called as
         ``callback(xk, sk, yk, alphak, resid, **kwargs)`` and can be used to return quantities from the iteration. Note
         that depending on the function supplied, this can slow down the solver.
+    reorthogonalize : bool, default=False
+        Whether to reorthogonalize each search direction against all previous ones to counteract the loss of conjugacy
+        in finite precision.
+
+    Returns
+    -------
+    x : RandomVariable, shape=(n,)
+        Approximate solution :math:`x` to the linear system with posterior covariance encoding the uncertainty
+        about the solution.
+    info : dict
+        Information on convergence of the solver.
 
     References
     ----------
@@ -257,7 +420,11 @@ def bayescg(A, b, x0=None, maxiter=None, atol=None, rtol=None, callback=None):
 
     # Solve linear system
     x, info = SolutionBasedSolver(A=A, b=b, x0=x0).solve(
-        callback=callback, maxiter=maxiter, atol=atol, rtol=rtol
+        callback=callback,
+        maxiter=maxiter,
+        atol=atol,
+        rtol=rtol,
+        reorthogonalize=reorthogonalize,
     )
 
     # Check result and issue warnings (e.g. singular or ill-conditioned matrix)
@@ -346,6 +513,40 @@ def _check_linear_system(A, b, A0=None, Ainv0=None, x0=None):
         raise ValueError("The inverse of A must be square.")
 
 
+def _preconditioner_prior_mean(M, A):
+    """
+    Prior mean of the linear operator :math:`A` given by the inverse of a preconditioner :math:`M \\approx A^{-1}`.
+
+    Parameters
+    ----------
+    M : array-like or LinearOperator, shape=(n,n)
+        Symmetric positive definite preconditioner.
+    A : array-like or LinearOperator or RandomVariable, shape=(n,n)
+        System matrix.
+
+    Returns
+    -------
+    A0 : LinearOperator, shape=(n,n)
+        Inverse of the preconditioner or the identity if the preconditioner implements no inverse.
+
+    Raises
+    ------
+    ValueError
+        If the inverse of the preconditioner is not a linear operator matching the dimensions of ``A``.
+    """
+    try:
+        A0 = linops.aslinop(M).inv()
+    except (AttributeError, NotImplementedError):
+        return linops.Identity(shape=A.shape[0], dtype=M.dtype)
+    if not isinstance(A0, scipy.sparse.linalg.LinearOperator):
+        raise ValueError("The inverse of the preconditioner must be a linear operator.")
+    if A0.shape != A.shape:
+        raise ValueError(
+            "Dimension mismatch. The dimensions of A and the inverse of the preconditioner must match."
+        )
+    return A0
+
+
 def _preprocess_linear_system(A, b, x0=None):
     """
     Transform the linear system to an appropriate form.
@@ -371,12 +572,166 @@ def _preprocess_linear_system(A, b, x0=None):
     # Transform linear system to correct dimensions
     if not isinstance(b, prob.RandomVariable):
         b = utils.as_colvec(b)  # (n,) -> (n, 1)
-    if x0 is not None:
+    if x0 is not None and not isinstance(x0, prob.RandomVariable):
         x0 = utils.as_colvec(x0)  # (n,) -> (n, 1)
 
     return A, b, x0
 
 
+def _astype(A, dtype):
+    """
+    Represent an array, sparse matrix or linear operator in the given floating point precision.
+
+    Random variables are returned unchanged.
+    """
+    if isinstance(A, prob.RandomVariable):
+        return A
+    elif isinstance(A, scipy.sparse.linalg.LinearOperator):
+        return linops.aslinop(A).astype(dtype)
+    else:
+        return A.astype(dtype)
+
+
+def _is_block_solvable(A, b, x0, assume_A, precision, **kwargs):
+    """
+    Check whether a linear system with multiple right hand sides can be solved by the block solver.
+
+    The block solver handles deterministic symmetric positive definite systems. Noisy systems, priors on the solution,
+    mixed precision and further keyword arguments of the solver iteration are handled by solving for one right hand
+    side after another.
+    """
+    return (
+        "sym" in assume_A
+        and "pos" in assume_A
+        and "noise" not in assume_A
+        and precision != "mixed"
+        and not isinstance(A, prob.RandomVariable)
+        and not isinstance(b, prob.RandomVariable)
+        and not isinstance(x0, prob.RandomVariable)
+        and len(kwargs) == 0
+    )
+
+
+def _solve(
+    A, b, A0, Ainv0, x0, assume_A, maxiter, atol, rtol, callback, precision, **kwargs
+):
+    """
+    Select and initialize a solver and solve a linear system with a single right hand side.
+
+    Returns the solution and the posteriors over the linear operator and its inverse as well as convergence
+    information, see :func:`problinsolve`.
+    """
+    if precision == "mixed":
+        return _solve_mixed_precision(
+            A=A,
+            b=b,
+            A0=A0,
+            Ainv0=Ainv0,
+            x0=x0,
+            assume_A=assume_A,
+            maxiter=maxiter,
+            atol=atol,
+            rtol=rtol,
+            callback=callback,
+            **kwargs
+        )
+
+    linear_solver = _init_solver(A=A, b=b, A0=A0, Ainv0=Ainv0, x0=x0, assume_A=assume_A)
+    return linear_solver.solve(
+        maxiter=maxiter, atol=atol, rtol=rtol, callback=callback, **kwargs
+    )
+
+
+def _solve_mixed_precision(
+    A, b, A0, Ainv0, x0, assume_A, maxiter, atol, rtol, callback, **kwargs
+):
+    """
+    Solve a linear system via iterative refinement in mixed precision.
+
+    The solver iterates in single precision on the correction equation :math:`A d_i = r_i` with the residual
+    :math:`r_i = b - Ax_i`. The residual and the refined solution :math:`x_{i+1} = x_i + \\mathbb{E}[d_i]` are computed
+    in double precision. Since :math:`x = x_i + d_i`, the uncertainty about the solution is the uncertainty about the
+    most recent correction. The posteriors over the linear operator and its inverse of one refinement step are the
+    priors of the next.
+    """
+    if isinstance(A, prob.RandomVariable) or isinstance(b, prob.RandomVariable):
+        raise NotImplementedError(
+            "Mixed precision is only implemented for linear systems without noise."
+        )
+
+    # Single precision linear operator for the solver iteration
+    A_single = _astype(A, np.float32)
+
+    # Double precision solution and residual
+    b = np.asarray(b, dtype=np.float64)
+    x = np.zeros_like(b) if x0 is None else np.asarray(x0, dtype=np.float64)
+    resid = b - A @ x
+    resid_norm = np.linalg.norm(resid)
+    tol = max(atol, rtol * np.linalg.norm(b))
+
+    # The correction equation only needs to be solved to the accuracy attainable in single precision
+    rtol_single = np.sqrt(np.finfo(np.float32).eps)
+
+    niter = 0
+    nrefinements = 0
+    while True:
+        # Solve correction equation in single precision
+        linear_solver = _init_solver(
+            A=A_single,
+            b=resid.astype(np.float32),
+            A0=A0,
+            Ainv0=Ainv0,
+            x0=None,
+            assume_A=assume_A,
+        )
+        d, A0, Ainv0, info = linear_solver.solve(
+            maxiter=max(maxiter - niter, 0),
+            atol=tol,
+            rtol=rtol_single,
+            callback=callback,
+            **kwargs
+        )
+        niter += info["iter"]
+        nrefinements += 1
+
+        # Refine solution and compute residual in double precision
+        x_refined = x + np.reshape(d.mean(), x.shape).astype(np.float64)
+        resid_refined = b - A @ x_refined
+        resid_refined_norm = np.linalg.norm(resid_refined)
+        if resid_refined_norm >= resid_norm:
+            # No progress beyond the attainable accuracy of the single precision iteration
+            break
+        x, resid, resid_norm = x_refined, resid_refined, resid_refined_norm
+        if resid_norm <= tol or niter >= maxiter:
+            break
+
+    # Solution with the uncertainty of the most recent correction
+    x = prob.RandomVariable(
+        shape=(x.shape[0],),
+        dtype=np.float64,
+        distribution=prob.Normal(mean=x.ravel(), cov=d.cov()),
+    )
+
+    # Convergence information of the refinement
+    if resid_norm <= atol:
+        conv_crit = "resid_atol"
+    elif resid_norm <= tol:
+        conv_crit = "resid_rtol"
+    else:
+        conv_crit = info["conv_crit"]
+    info.update(
+        {
+            "iter": niter,
+            "maxiter": maxiter,
+            "resid_l2norm": resid_norm,
+            "conv_crit": conv_crit,
+            "refinement_steps": nrefinements,
+        }
+    )
+
+    return x, A0, Ainv0, info
+
+
 def _init_solver(A, b, A0, Ainv0, x0, assume_A):
     """
     Selects and initializes an appropriate instance of the probabilistic linear solver based on the system properties
@@ -451,8 +806,8 @@ def _init_solver(A, b, A0, Ainv0, x0, assume_A):
                 )
             else:
                 return SymmetricMatrixBasedSolver(A=A, b=b, x0=x0, A0=A0, Ainv0=Ainv0)
-        elif "sym" not in assume_A and "pos" in assume_A:
-            return AsymmetricMatrixBasedSolver(A=A, b=b, x0=x0)
+        elif "sym" not in assume_A and "noise" not in assume_A:
+            return AsymmetricMatrixBasedSolver(A=A, b=b, x0=x0, A0=A0, Ainv0=Ainv0)
         else:
             raise NotImplementedError
 
@@ -6,11 +6,14 @@ observations.
 """
 import warnings
 import abc
+import copy
 
 import numpy as np
+import scipy.linalg
 import scipy.sparse
 import scipy.sparse.linalg
-import GPy
+import scipy.special
+import scipy.stats
 
 from probnum import prob
 from probnum.linalg import linops
@@ -38,6 +41,11 @@ class ProbabilisticLinearSolver(abc.ABC):
         self.b = b
         self.n = A.shape[1]
 
+        # Floating point precision of the solver iteration
+        self.dtype = np.result_type(A.dtype, b.dtype)
+        if not np.issubdtype(self.dtype, np.inexact):
+            self.dtype = np.dtype(float)
+
     def has_converged(self, iter, maxiter, **kwargs):
         """
         Check convergence of a linear solver.
@@ -205,23 +213,378 @@ class AsymmetricMatrixBasedSolver(ProbabilisticLinearSolver):
     """
     Asymmetric matrix-based probabilistic linear solver.
 
+    Probabilistic linear solver for general (non-symmetric) linear systems, which infers the matrix :math:`A` and its
+    inverse :math:`H=A^{-1}` under Kronecker-structured Gaussian priors :math:`\\mathcal{N}(H_0, V \\otimes W)` given
+    observations :math:`HY = S` of the inverse, where :math:`Y=AS`. The posterior remains Kronecker-structured
+
+    .. math::
+        H_k = H_0 + (S - H_0Y)(Y^\\top W Y)^{-1} Y^\\top W, \\qquad
+        \\operatorname{Cov}(H) = V \\otimes (W - WY(Y^\\top W Y)^{-1} Y^\\top W).
+
+    Search directions :math:`s = -H_k r` are :math:`W`-orthonormalized in observation space, such that the posterior
+    mean of the solution is the iterate of the generalized conjugate residual method, which minimizes the
+    :math:`W`-norm of the residual over a Krylov subspace and is mathematically equivalent to GMRES [1]_ for
+    :math:`W=I`. The belief about :math:`A` under the prior :math:`\\mathcal{N}(A_0, V^A \\otimes W^A)` is only
+    constructed when the output random variables are requested.
+
+    Memory is bounded by restarting the iteration after a fixed number of search directions. On restart the current
+    solution estimate becomes the initial guess and the beliefs about :math:`A` and :math:`H` are reset to their priors,
+    i.e. the output belief reflects the observations of the most recent cycle.
+
     Parameters
     ----------
-    A : array-like or LinearOperator or RandomVariable, shape=(n,n)
+    A : array-like or LinearOperator, shape=(n,n)
         The square matrix or linear operator of the linear system.
-    b : array_like, shape=(n,) or (n, nrhs)
-        Right-hand side vector or matrix in :math:`A x = b`.
+    b : array_like, shape=(n,) or (n, 1)
+        Right-hand side vector in :math:`A x = b`.
+    x0 : array-like, shape=(n,) or (n, 1), optional
+        Initial guess for the solution of the linear system. Defaults to :math:`H_0 b`.
+    A0 : array-like or LinearOperator or RandomVariable, shape=(n,n), optional
+        Prior mean of the linear operator :math:`A` or prior belief with :class:`~probnum.linalg.linops.Kronecker`
+        covariance :math:`V^A \\otimes W^A`. Defaults to the identity with covariance :math:`I \\otimes I`.
+    Ainv0 : array-like or LinearOperator or RandomVariable, shape=(n,n), optional
+        Prior mean of the inverse :math:`H=A^{-1}` or prior belief with :class:`~probnum.linalg.linops.Kronecker`
+        covariance :math:`V \\otimes W`, where :math:`W` is symmetric positive definite. Defaults to the identity with
+        covariance :math:`I \\otimes I`.
+
+    References
+    ----------
+    .. [1] Saad, Y. and Schultz, M. H., GMRES: A Generalized Minimal Residual Algorithm for Solving Nonsymmetric Linear
+           Systems, *SIAM Journal on Scientific and Statistical Computing*, 1986, 7, 856-869
+    .. [2] Hennig, P., Probabilistic Interpretation of Linear Solvers, *SIAM Journal on Optimization*, 2015, 25, 234-260
+
+    See Also
+    --------
+    SymmetricMatrixBasedSolver : Class implementing the symmetric probabilistic linear solver.
     """
 
-    def __init__(self, A, b, x0):
-        self.x0 = x0
+    def __init__(self, A, b, x0=None, A0=None, Ainv0=None):
+        if isinstance(A, prob.RandomVariable) or isinstance(b, prob.RandomVariable):
+            raise NotImplementedError(
+                "The asymmetric solver is only implemented for deterministic linear systems."
+            )
         super().__init__(A=A, b=b)
 
-    def has_converged(self, iter, maxiter, **kwargs):
-        raise NotImplementedError
+        # Prior parameters
+        self.A_mean0, self.A_covfactors0 = self._get_prior_params(A0)
+        self.Ainv_mean0, self.Ainv_covfactors0 = self._get_prior_params(Ainv0)
+        self.trace_Ainv_rowcov = self.Ainv_covfactors0[0].trace()
 
-    def solve(self, callback=None, maxiter=None, atol=None):
-        raise NotImplementedError
+        # Initial guess
+        if x0 is None:
+            self.x0 = self.Ainv_mean0 @ self.b
+        elif isinstance(x0, np.ndarray):
+            self.x0 = x0
+        else:
+            raise NotImplementedError
+        self.x_mean = self.x0
+        self.iter_ = 0
+
+    def _get_prior_params(self, M0):
+        """
+        Get the prior mean and Kronecker covariance factors :math:`(V, W)` of a matrix prior.
+
+        Parameters
+        ----------
+        M0 : array-like or LinearOperator or RandomVariable, shape=(n,n), optional
+            Prior mean or prior belief with :class:`~probnum.linalg.linops.Kronecker` covariance.
+        """
+        if isinstance(M0, prob.RandomVariable):
+            cov = M0.cov()
+            if not isinstance(cov, linops.Kronecker):
+                raise ValueError(
+                    "The prior covariance must be a Kronecker product of linear operators."
+                )
+            return linops.aslinop(M0.mean()), (cov.A, cov.B)
+        elif M0 is None:
+            M0 = linops.Identity(shape=self.n, dtype=self.dtype)
+        return (
+            linops.aslinop(M0),
+            (
+                linops.Identity(shape=self.n, dtype=self.dtype),
+                linops.Identity(shape=self.n, dtype=self.dtype),
+            ),
+        )
+
+    def has_converged(self, iter, maxiter, resid=None, atol=None, rtol=None):
+        """
+        Check convergence of a linear solver.
+
+        Evaluates a set of convergence criteria based on its input arguments to decide whether the iteration has converged.
+
+        Parameters
+        ----------
+        iter : int
+            Current iteration of solver.
+        maxiter : int
+            Maximum number of iterations
+        resid : array-like
+            Residual vector :math:`\\lVert r_i \\rVert = \\lVert Ax_i - b \\rVert` of the current iteration.
+        atol : float
+            Absolute residual tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{atol}`.
+        rtol : float
+            Relative residual tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{rtol} \\lVert b \\rVert`.
+
+        Returns
+        -------
+        has_converged : bool
+            True if the method has converged.
+        convergence_criterion : str
+            Convergence criterion which caused termination.
+        """
+        # maximum iterations
+        if iter >= maxiter:
+            warnings.warn(
+                message="Iteration terminated. Solver reached the maximum number of iterations."
+            )
+            return True, "maxiter"
+        # residual below error tolerance
+        resid_norm = np.linalg.norm(resid)
+        b_norm = np.linalg.norm(self.b)
+        if resid_norm <= atol:
+            return True, "resid_atol"
+        elif resid_norm <= rtol * b_norm:
+            return True, "resid_rtol"
+        # uncertainty-based
+        if np.sqrt(self.trace_sol_cov) <= atol:
+            return True, "tracecov_atol"
+        elif np.sqrt(self.trace_sol_cov) <= rtol * b_norm:
+            return True, "tracecov_rtol"
+        else:
+            return False, ""
+
+    def _restart(self, resid, maxrank):
+        """Start a new cycle from the current solution estimate with beliefs reset to the priors."""
+        self.resid0 = resid
+        capacity = _initial_capacity(maxrank)
+        self.Ainv_mean = linops.LowRankUpdate(A=self.Ainv_mean0, maxrank=capacity)
+        self.Ainv_covfactor = linops.LowRankUpdate(
+            A=self.Ainv_covfactors0[1], maxrank=capacity
+        )
+        self.workspace = _KrylovWorkspace(n=self.n, capacity=capacity, dtype=self.dtype)
+
+        # Weighted squared norm r_0'W_k r_0 of the initial residual of the cycle
+        self.resid0_sqnorm = _inner_product(resid, self.Ainv_covfactors0[1] @ resid)
+        self.trace_sol_cov = self.resid0_sqnorm * self.trace_Ainv_rowcov
+
+    def _get_A_posterior_params(self):
+        """Return the posterior mean and covariance factor :math:`W^A_k` of the belief about :math:`A`."""
+        S = self.workspace.search_dirs
+        Y = self.workspace.observations
+        if S.shape[1] == 0:
+            return self.A_mean0, self.A_covfactors0[1]
+
+        WS = self.A_covfactors0[1] @ S
+        SWS_inv_SW = np.linalg.solve(S.T @ WS, WS.T)
+        A_mean = linops.LowRankUpdate(
+            A=self.A_mean0, U=Y - self.A_mean0 @ S, V=SWS_inv_SW.T
+        )
+        A_covfactor = linops.LowRankUpdate(
+            A=self.A_covfactors0[1], U=-WS, V=SWS_inv_SW.T
+        )
+        return A_mean, A_covfactor
+
+    def _get_output_randvars(self):
+        """Return output random variables x, A, Ainv from their means and covariances."""
+        A_mean, A_covfactor = self._get_A_posterior_params()
+        A = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=A_mean,
+                cov=linops.Kronecker(A=self.A_covfactors0[0], B=A_covfactor),
+            ),
+        )
+        Ainv = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=self.Ainv_mean,
+                cov=linops.Kronecker(A=self.Ainv_covfactors0[0], B=self.Ainv_covfactor),
+            ),
+        )
+        # Induced distribution on x = x_0 + H r_0 via Ainv: Cov(x) = (r_0' W_k r_0) V
+        x = prob.RandomVariable(
+            shape=(self.n,),
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=self.x_mean.ravel(),
+                cov=self.dtype.type(self.resid0_sqnorm)
+                * linops.aslinop(self.Ainv_covfactors0[0]),
+            ),
+        )
+        return x, A, Ainv
+
+    def _get_lazy_output_randvars(self):
+        """
+        Return proxies of the output random variables x, A, Ainv in the current state of the solver.
+
+        The random variables are only constructed once the distribution of one of the proxies is accessed.
+        """
+        # Quantities are not modified in place during the iteration, such that a shallow copy suffices.
+        state = copy.copy(self)
+        state.workspace = copy.copy(self.workspace)
+        randvars = []
+
+        def _get_distribution(i):
+            if not randvars:
+                randvars.extend(state._get_output_randvars())
+            return randvars[i].distribution
+
+        return tuple(
+            prob.randomvariable._LazyRandomVariable(
+                shape=shape,
+                dtype=self.dtype,
+                distribution_factory=lambda i=i: _get_distribution(i),
+            )
+            for i, shape in enumerate([(self.n,), (self.n, self.n), (self.n, self.n)])
+        )
+
+    def solve(self, callback=None, maxiter=None, atol=None, rtol=None, restart=None):
+        """
+        Solve the linear system :math:`Ax=b`.
+
+        Parameters
+        ----------
+        callback : function, optional
+            User-supplied function called after each iteration of the linear solver. It is called as
+            ``callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs)`` and can be used to return quantities from the
+            iteration. Note that depending on the function supplied, this can slow down the solver.
+        maxiter : int
+            Maximum number of iterations
+        atol : float
+            Absolute residual tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{atol}`.
+        rtol : float
+            Relative residual tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{rtol} \\lVert b \\rVert`.
+        restart : int, optional
+            Number of search directions after which the iteration is restarted. Bounds the memory to
+            :math:`\\mathcal{O}(n \\cdot \\text{restart})`. By default, the iteration is only restarted once :math:`n`
+            search directions have been collected, and storage grows with the number of iterations.
+
+        Returns
+        -------
+        x : RandomVariable, shape=(n,)
+            Approximate solution :math:`x` to the linear system.
+        A : RandomVariable, shape=(n,n)
+            Posterior belief over the linear operator.
+        Ainv : RandomVariable, shape=(n,n)
+            Posterior belief over the linear operator inverse :math:`H=A^{-1}`.
+        info : dict
+            Information on convergence of the solver.
+        """
+        # Default arguments
+        if maxiter is None:
+            maxiter = self.n * 10
+        if atol is None:
+            atol = 10 ** -6
+        if rtol is None:
+            rtol = 10 ** -6
+        _maxrank = min(maxiter, self.n)
+        if restart is not None:
+            if restart < 1:
+                raise ValueError("The restart length must be a positive integer.")
+            _maxrank = min(_maxrank, restart)
+
+        # Initial residual
+        self.x_mean = self.x0
+        self.iter_ = 0
+        resid = self.A @ self.x_mean - self.b
+        self._restart(resid=resid, maxrank=_maxrank)
+        nrestarts = 0
+
+        # Iteration with stopping criteria
+        while True:
+            # Check convergence
+            _has_converged, _conv_crit = self.has_converged(
+                iter=self.iter_, maxiter=maxiter, resid=resid, atol=atol, rtol=rtol
+            )
+            if _has_converged:
+                break
+
+            # Restart if the workspace is exhausted
+            if self.workspace.size == _maxrank:
+                self._restart(resid=resid, maxrank=_maxrank)
+                nrestarts += 1
+
+            # Compute search direction via policy and observe
+            search_dir = -self.Ainv_mean @ resid
+            obs = self.A @ search_dir
+            obs_norm = np.linalg.norm(obs)
+
+            # W-orthonormalize observations (classical Gram-Schmidt with reorthogonalization)
+            S = self.workspace.search_dirs
+            Y = self.workspace.observations
+            WY = self.Ainv_covfactor.V
+            for _ in range(2):
+                coeffs = WY.T @ obs
+                obs = obs - Y @ coeffs
+                search_dir = search_dir - S @ coeffs
+            if np.linalg.norm(obs) <= np.finfo(self.dtype).eps * obs_norm:
+                # Observation in the span of previous observations, no further progress possible
+                _conv_crit = "breakdown"
+                break
+            Wy = self.Ainv_covfactors0[1] @ obs
+            obs_norm = np.sqrt(_inner_product(obs, Wy))
+            search_dir = search_dir / obs_norm
+            obs = obs / obs_norm
+            Wy = Wy / obs_norm
+            self.workspace.append(
+                s=search_dir, y=obs, sy=_inner_product(search_dir, obs)
+            )
+
+            # Step size minimizing the W-norm of the residual
+            step_size = -_inner_product(Wy, resid)
+            self.x_mean = self.x_mean + step_size * search_dir
+            resid = resid + step_size * obs
+
+            # Rank 1 mean update (+= (s - H_0 y)(Wy)') and covariance factor update (-= Wy Wy')
+            self.Ainv_mean = self.Ainv_mean.update(
+                U=search_dir - self.Ainv_mean0 @ obs, V=Wy
+            )
+            self.Ainv_covfactor = self.Ainv_covfactor.update(U=-Wy, V=Wy)
+
+            # Trace of solution covariance: tr(Cov(x)) = r_0' W_k r_0 tr(V)
+            self.resid0_sqnorm = (
+                self.resid0_sqnorm - _inner_product(Wy, self.resid0) ** 2
+            )
+            self.trace_sol_cov = max(self.resid0_sqnorm, 0.0) * self.trace_Ainv_rowcov
+
+            # Callback function used to extract quantities from iteration. Output random variables are only
+            # constructed if accessed by the callback.
+            if callback is not None:
+                x, A, Ainv = self._get_lazy_output_randvars()
+                callback(
+                    xk=x,
+                    Ak=A,
+                    Ainvk=Ainv,
+                    sk=search_dir,
+                    yk=obs,
+                    alphak=step_size,
+                    resid=resid,
+                )
+
+            # Iteration increment
+            self.iter_ += 1
+
+        # Create output random variables
+        x, A, Ainv = self._get_output_randvars()
+
+        # Log information on solution
+        info = {
+            "iter": self.iter_,
+            "maxiter": maxiter,
+            "resid_l2norm": np.linalg.norm(resid, ord=2),
+            "trace_sol_cov": self.trace_sol_cov,
+            "conv_crit": _conv_crit,
+            "restarts": nrestarts,
+            "rel_cond": None,
+        }
+
+        return x, A, Ainv, info
 
 
 class SymmetricMatrixBasedSolver(MatrixBasedSolver):
@@ -299,10 +662,24 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             raise NotImplementedError
         self.x0 = self.x_mean
 
-        # Computed search directions and observations
-        self.search_dir_list = []
-        self.obs_list = []
-        self.sy = []
+        # Computed search directions, observations and their inner products
+        self.workspace = _KrylovWorkspace(n=self.n, capacity=0, dtype=self.dtype)
+        self.rayleigh_quotients = _LogRayleighQuotients()
+        self._init_calibration_factors()
+
+    def _init_calibration_factors(self):
+        """
+        Initialize the incrementally updated factorizations of the calibration covariance class.
+
+        These are the QR factorizations of the search directions :math:`S` and observations :math:`Y` and the Cholesky
+        factorization of :math:`Y^\\top A_0^{-1} Y`. They are only extended by the columns collected since their last
+        use.
+        """
+        self.S_factor = _IncrementalQR(n=self.n, dtype=self.dtype)
+        self.Y_factor = _IncrementalQR(n=self.n, dtype=self.dtype)
+        self.Ainv_gram_factor = _IncrementalGramCholesky(
+            M=self.Ainv_mean0, dtype=self.dtype
+        )
 
     def _get_prior_params(self, A0, Ainv0, x0, b):
         """
@@ -344,10 +721,10 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             self.is_calib_covclass = True
             # No prior information given
             if x0 is None:
-                Ainv0_mean = linops.Identity(shape=self.n)
-                Ainv0_covfactor = linops.Identity(shape=self.n)
+                Ainv0_mean = linops.Identity(shape=self.n, dtype=self.dtype)
+                Ainv0_covfactor = linops.Identity(shape=self.n, dtype=self.dtype)
                 # Symmetric posterior correspondence
-                A0_mean = linops.Identity(shape=self.n)
+                A0_mean = linops.Identity(shape=self.n, dtype=self.dtype)
                 A0_covfactor = self.A
                 return A0_mean, A0_covfactor, Ainv0_mean, Ainv0_covfactor
             # Construct matrix priors from initial guess x0
@@ -385,7 +762,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 )
                 A0_mean = np.linalg.inv(Ainv0.mean())
             except NotImplementedError:
-                A0_mean = linops.Identity(self.n)
+                A0_mean = linops.Identity(self.n, dtype=self.dtype)
                 warnings.warn(
                     message="Prior specified only for Ainv. Automatic prior mean inversion not implemented, "
                     + "falling back to standard normal prior."
@@ -417,7 +794,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 )
                 Ainv0_mean = np.linalg.inv(A0.mean())
             except NotImplementedError:
-                Ainv0_mean = linops.Identity(self.n)
+                Ainv0_mean = linops.Identity(self.n, dtype=self.dtype)
                 warnings.warn(
                     message="Prior specified only for A. "
                     + "Automatic prior mean inversion failed, falling back to standard normal prior."
@@ -470,13 +847,8 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         else:
             # General prior mean
             if self.is_calib_covclass and k > 0 and (not unc_scale == 0):
-                # General prior mean with calibration covariance class
-                _trace = np.trace(
-                    np.linalg.solve(
-                        Y.T @ self.Ainv_mean0 @ Y,
-                        Y.T @ self.Ainv_mean0 @ self.Ainv_mean0 @ Y,
-                    )
-                )
+                # General prior mean with calibration covariance class: tr(A_0^{-1}Y(Y'A_0^{-1}Y)^{-1}Y'A_0^{-1})
+                _trace = self.Ainv_gram_factor.trace(Y)
             else:
                 _trace = self.Ainv_covfactor0.trace()
         if self.is_calib_covclass:
@@ -484,6 +856,21 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             _trace += unc_scale * (self.n - k)
         return _trace
 
+    def _update_trace_Ainv_covfactor(self, psi):
+        """
+        Update the trace of the posterior covariance factor of the inverse view.
+
+        Parameters
+        ----------
+        psi : float
+            Uncertainty scale :math:`\\psi` of the inverse view.
+        """
+        Y = self.workspace.observations if self.workspace.size > 0 else None
+        self.trace_Ainv_covfactor = np.real_if_close(
+            self._compute_trace_Ainv_covfactor0(Y=Y, unc_scale=psi)
+            - self._trace_Ainv_covfactor_update
+        ).item()
+
     def _compute_trace_solution_covariance(self, bWb, Wb):
         """
         Computes the trace of the solution covariance :math:`\\tr(\\operatorname{Cov}[x])`
@@ -552,7 +939,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         else:
             return False, ""
 
-    def _calibrate_uncertainty(self, S, sy, method):
+    def _calibrate_uncertainty(self, method):
         """
         Calibrate uncertainty based on the Rayleigh coefficients
 
@@ -562,15 +949,12 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         Parameters
         ----------
-        S : np.ndarray, shape=(n, k)
-            Array of search directions
-        sy : np.ndarray
-            Array of inner products ``s_i'As_i``
         method : str
             Type of calibration method to use based on the Rayleigh quotient. Available calibration procedures are
             ====================================  ==================
              Most recent Rayleigh quotient         ``adhoc``
              Running (weighted) mean               ``weightedmean``
+             Least-squares regression              ``lstsq``
              GP regression for kernel matrices     ``gpkern``
             ====================================  ==================
 
@@ -581,22 +965,34 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         psi : float
             Uncertainty scale of the null space of span(Y) for the Ainv view
         """
-
-        # Rayleigh quotient
-        iters = np.arange(self.iter_ + 1)
-        logR = np.log(sy) - np.log(np.einsum("nk,nk->k", S, S))
+        logR = self.rayleigh_quotients
 
         if (
-            self.iter_ > 1
+            logR.size > 2
         ):  # only calibrate if enough iterations for a regression model have been performed
             if method == "adhoc":
-                logR_pred = logR[-1]
+                logR_pred = logR.last
             elif method == "weightedmean":
-                deprecation_rate = 0.9
-                logR_pred = logR * np.repeat(
-                    deprecation_rate, self.iter_ + 1
-                ) ** np.arange(self.iter_ + 1)
+                logR_pred = logR.weighted_mean()
+            elif method == "lstsq":
+                # Least-squares fit of the mean function of the GP model below
+                logR_pred = logR.predict_mean(n=self.n)
             elif method == "gpkern":
+                try:
+                    import GPy
+                except ImportError as err:
+                    raise ImportError(
+                        "Calibration method 'gpkern' requires GPy. Install GPy or use the native calibration "
+                        "method 'lstsq' instead."
+                    ) from err
+
+                # Log-Rayleigh quotients of all iterations
+                S = self.workspace.search_dirs
+                logR_obs = np.log(self.workspace.inner_products) - np.log(
+                    np.einsum("nk,nk->k", S, S)
+                )
+                iters = np.arange(logR_obs.shape[0])
+
                 # GP mean function via Weyl's result on spectra of Gram matrices for differentiable kernels
                 #   ln(sigma(n)) ~= theta_0 - theta_1 ln(n)
                 lnmap = GPy.core.Mapping(1, 1)
@@ -608,12 +1004,12 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 )
                 k = GPy.kern.RBF(input_dim=1, lengthscale=1, variance=1)
                 m = GPy.models.GPRegression(
-                    iters[:, None] + 1, logR[:, None], kernel=k, mean_function=mf
+                    iters[:, None] + 1, logR_obs[:, None], kernel=k, mean_function=mf
                 )
                 m.optimize(messages=False)
 
                 # Predict Rayleigh quotient
-                remaining_dims = np.arange(self.iter_, self.A.shape[0])[:, None]
+                remaining_dims = np.arange(logR_obs.shape[0], self.n)[:, None]
                 logR_pred = m.predict(remaining_dims + 1)[0].ravel()
             else:
                 raise ValueError("Calibration method not recognized.")
@@ -623,7 +1019,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             Psi = (np.exp(-np.mean(logR_pred))).item()
         else:
             # For too few iterations take the most recent Rayleigh quotient
-            Phi = np.exp(logR[-1])
+            Phi = np.exp(logR.last)
             Psi = 1 / Phi
 
         return Phi, Psi
@@ -633,82 +1029,54 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         For the calibration covariance class set the calibration update terms of the covariance in the null spaces
         of span(S) and span(Y) based on the degrees of freedom.
         """
-        # Search directions and observations as arrays
-        S = np.hstack(self.search_dir_list)
-        Y = np.hstack(self.obs_list)
+        # Search directions and observations (views of the workspace)
+        S = self.workspace.search_dirs
+        Y = self.workspace.observations
 
-        def get_null_space_map(V, unc_scale):
+        def get_null_space_map(V, factor, unc_scale):
             """Returns a function mapping to the null space of span(V), scaling with a single degree of freedom
              and mapping back."""
 
+            # Orthonormal basis of span(V) from the incrementally updated QR factorization
+            Q = factor.basis(V)
+
             def null_space_proj(x):
-                try:
-                    VVinvVx = np.linalg.solve(V.T @ V, V.T @ x)
-                    return x - V @ VVinvVx
-                except np.linalg.LinAlgError:
-                    return np.zeros_like(x)
+                return x - Q @ (Q.T @ x)
 
             # For a scalar uncertainty scale projecting to the null space twice is equivalent to projecting once
             return lambda y: unc_scale * null_space_proj(y)
 
         # Compute calibration term in the A view as a linear operator with scaling from degrees of freedom
+        null_space_map_A = get_null_space_map(V=S, factor=self.S_factor, unc_scale=phi)
         calibration_term_A = linops.LinearOperator(
-            shape=(self.n, self.n), matvec=get_null_space_map(V=S, unc_scale=phi)
+            shape=(self.n, self.n), matvec=null_space_map_A, matmat=null_space_map_A
         )
 
         # Compute calibration term in the Ainv view as a linear operator with scaling from degrees of freedom
+        null_space_map_Ainv = get_null_space_map(
+            V=Y, factor=self.Y_factor, unc_scale=psi
+        )
         calibration_term_Ainv = linops.LinearOperator(
-            shape=(self.n, self.n), matvec=get_null_space_map(V=Y, unc_scale=psi)
+            shape=(self.n, self.n),
+            matvec=null_space_map_Ainv,
+            matmat=null_space_map_Ainv,
         )
 
         return calibration_term_A, calibration_term_Ainv
 
-    def _get_output_randvars(self, Y_list, sy_list, phi=None, psi=None):
-        """Return output random variables x, A, Ainv from their means and covariances."""
+    def _get_posterior_covfactors(self, phi=None, psi=None):
+        """Return the (possibly calibrated) covariance factors of the posteriors over A and Ainv."""
 
         if self.iter_ > 0:
-            # Observations and inner products in A-space between actions
-            Y = np.hstack(Y_list)
-            sy = np.vstack(sy_list).ravel()
-
             # Posterior covariance factors
             if self.is_calib_covclass and (not phi is None) and (not psi is None):
-                # Ensure prior covariance class only acts in span(S) like A
-                def _matvec(x):
-                    # First term of calibration covariance class: AS(S'AS)^{-1}S'A
-                    return (Y * sy ** -1) @ (Y.T @ x.ravel())
-
-                _A_covfactor0 = linops.LinearOperator(
-                    shape=(self.n, self.n), matvec=_matvec
-                )
-
-                def _matvec(x):
-                    # Term in covariance class: A_0^{-1}Y(Y'A_0^{-1}Y)^{-1}Y'A_0^{-1}
-                    # TODO: for efficiency ensure that we dont have to compute (Y.T Y)^{-1} two times! For a scalar mean
-                    #  this is the same as in the null space projection
-                    YAinv0Y_inv_YAinv0x = np.linalg.solve(
-                        Y.T @ (self.Ainv_mean0 @ Y), Y.T @ (self.Ainv_mean0 @ x)
-                    )
-                    return self.Ainv_mean0 @ (Y @ YAinv0Y_inv_YAinv0x)
-
-                _Ainv_covfactor0 = linops.LinearOperator(
-                    shape=(self.n, self.n), matvec=_matvec
-                )
-
-                # Set degrees of freedom based on uncertainty calibration in unexplored space
+                # The prior covariance factor W_0 = AS(S'AS)^{-1}S'A + phi (I - S(S'S)^{-1}S') of the calibration
+                # covariance class satisfies W_0S = AS. Hence the posterior covariance factor W_0 - W_0S(S'W_0S)^{-1}S'W_0
+                # is the scaled projection onto the null space of span(S) (and analogously span(Y) for Ainv).
                 (
-                    calibration_term_A,
-                    calibration_term_Ainv,
+                    _A_covfactor,
+                    _Ainv_covfactor,
                 ) = self._get_calibration_covariance_update_terms(phi=phi, psi=psi)
-
-                _A_covfactor = (
-                    _A_covfactor0 - self._A_covfactor_update_term + calibration_term_A
-                )
-                _Ainv_covfactor = (
-                    _Ainv_covfactor0
-                    - self._Ainv_covfactor_update_term
-                    + calibration_term_Ainv
-                )
             else:
                 # No calibration
                 _A_covfactor = self.A_covfactor
@@ -718,61 +1086,92 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             _A_covfactor = self.A_covfactor0
             _Ainv_covfactor = self.Ainv_covfactor0
 
+        return _A_covfactor, _Ainv_covfactor
+
+    def _compute_trace_sol_cov(self, Ainv_covfactor):
+        """Computes the trace of the solution covariance :math:`\\tr(\\operatorname{Cov}[x])` and the
+        matrix-vector product :math:`Wb` it is based on."""
+        Wb = Ainv_covfactor @ self.b
+        bWb = _inner_product(Wb, self.b)
+        trace_sol_cov = np.real_if_close(
+            self._compute_trace_solution_covariance(bWb=bWb, Wb=Wb)
+        ).item()
+        return trace_sol_cov, Wb, bWb
+
+    def _get_output_randvars(self, phi=None, psi=None):
+        """Return output random variables x, A, Ainv from their means and covariances."""
+        _A_covfactor, _Ainv_covfactor = self._get_posterior_covfactors(phi=phi, psi=psi)
+
         # Create output random variables
         A = prob.RandomVariable(
             shape=(self.n, self.n),
-            dtype=float,
+            dtype=self.dtype,
             distribution=prob.Normal(
                 mean=self.A_mean, cov=linops.SymmetricKronecker(A=_A_covfactor)
             ),
         )
         Ainv = prob.RandomVariable(
             shape=(self.n, self.n),
-            dtype=float,
+            dtype=self.dtype,
             distribution=prob.Normal(
                 mean=self.Ainv_mean, cov=linops.SymmetricKronecker(A=_Ainv_covfactor)
             ),
         )
         # Induced distribution on x via Ainv
         # Exp(x) = Ainv b, Cov(x) = 1/2 (W b'Wb + Wbb'W)
-        Wb = _Ainv_covfactor @ self.b
-        bWb = np.squeeze(Wb.T @ self.b)
-
-        def _mv(x):
-            return 0.5 * (bWb * _Ainv_covfactor @ x + Wb @ (Wb.T @ x))
-
-        cov_op = linops.LinearOperator(
-            shape=(self.n, self.n), dtype=float, matvec=_mv, matmat=_mv
+        self.trace_sol_cov, Wb, bWb = self._compute_trace_sol_cov(
+            Ainv_covfactor=_Ainv_covfactor
+        )
+        cov_op = linops.LowRankUpdate(
+            A=self.dtype.type(0.5 * bWb) * linops.aslinop(_Ainv_covfactor),
+            U=0.5 * Wb,
+            V=Wb,
         )
 
         x = prob.RandomVariable(
             shape=(self.n,),
-            dtype=float,
+            dtype=self.dtype,
             distribution=prob.Normal(mean=self.x_mean.ravel(), cov=cov_op),
         )
 
-        # Compute trace of solution covariance: tr(Cov(x))
-        self.trace_sol_cov = np.real_if_close(
-            self._compute_trace_solution_covariance(bWb=bWb, Wb=Wb)
-        ).item()
-
         return x, A, Ainv
 
-    def _mean_update(self, u, v):
-        """Linear operator implementing the symmetric rank 2 mean update (+= uv' + vu')."""
-
-        def mv(x):
-            return u @ (v.T @ x) + v @ (u.T @ x)
-
-        return linops.LinearOperator(shape=(self.n, self.n), matvec=mv, matmat=mv)
-
-    def _covariance_update(self, u, Ws):
-        """Linear operator implementing the symmetric rank 2 kernels update (-= Ws u^T)."""
+    def _randvar_shapes(self):
+        """Shapes of the output random variables x, A, Ainv."""
+        return [(self.n,), (self.n, self.n), (self.n, self.n)]
 
-        def mv(x):
-            return Ws @ (u.T @ x)
+    def _get_lazy_output_randvars(self, phi=None, psi=None, calibration=None):
+        """
+        Return proxies of the output random variables x, A, Ainv in the current state of the solver.
 
-        return linops.LinearOperator(shape=(self.n, self.n), matvec=mv, matmat=mv)
+        The random variables are only constructed once the distribution of one of the proxies is accessed. If a
+        calibration method is given, the uncertainty is only calibrated at this point.
+        """
+        # Solver state at the current iteration. Quantities are not modified in place during the iteration,
+        # such that a shallow copy suffices.
+        state = copy.copy(self)
+        state.workspace = copy.copy(self.workspace)
+        if calibration is not None:
+            state.rayleigh_quotients = copy.copy(self.rayleigh_quotients)
+        randvars = []
+
+        def _get_distribution(i):
+            if not randvars:
+                _phi, _psi = phi, psi
+                if calibration is not None:
+                    _phi, _psi = state._calibrate_uncertainty(method=calibration)
+                    state._update_trace_Ainv_covfactor(psi=_psi)
+                randvars.extend(state._get_output_randvars(phi=_phi, psi=_psi))
+            return randvars[i].distribution
+
+        return tuple(
+            prob.randomvariable._LazyRandomVariable(
+                shape=shape,
+                dtype=self.dtype,
+                distribution_factory=lambda i=i: _get_distribution(i),
+            )
+            for i, shape in enumerate(self._randvar_shapes())
+        )
 
     def solve(
         self, callback=None, maxiter=None, atol=None, rtol=None, calibration=None
@@ -803,9 +1202,15 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
              Provided scale                       float
              Most recent Rayleigh quotient        ``adhoc``
              Running (weighted) mean              ``weightedmean``
+             Least-squares regression             ``lstsq``
              GP regression for kernel matrices    ``gpkern``
             ====================================  ================
 
+            Calibration procedures only record the Rayleigh quotients of the search directions during the iteration
+            and calibrate the output on termination or if the callback accesses the output random variables. The
+            convergence criteria are based on the uncalibrated solution covariance. Calibration via ``gpkern`` requires
+            GPy.
+
         Returns
         -------
         x : RandomVariable, shape=(n,) or (n, nrhs)
@@ -824,19 +1229,16 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         # Initialize uncertainty calibration
         phi = None
         psi = None
-        if calibration is None:
+        if calibration is None or calibration is False:
             pass
-        elif (
-            calibration is not None
-            or calibration is not False
-            and not self.is_calib_covclass
-        ):
+        elif not self.is_calib_covclass:
             warnings.warn(
                 message="Cannot use calibration without a compatible covariance class."
             )
-        elif isinstance(calibration, str) and self.is_calib_covclass:
-            pass
-        elif self.is_calib_covclass:
+        elif isinstance(calibration, str):
+            if calibration not in ["adhoc", "weightedmean", "lstsq", "gpkern"]:
+                raise ValueError("Calibration method not recognized.")
+        else:
             if calibration < 0:
                 raise ValueError("Calibration scale must be non-negative.")
             elif calibration == 0.0:
@@ -845,15 +1247,28 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 phi = calibration
                 psi = 1 / calibration
 
-        # Trace of solution covariance
-        _trace_Ainv_covfactor_update = 0
-        self.trace_Ainv_covfactor = self._compute_trace_Ainv_covfactor0(
-            Y=None, unc_scale=psi
+        # Posterior means and covariance factors as low-rank updates of the prior with preallocated storage
+        _maxrank = self.n if maxiter is None else min(maxiter, self.n)
+        _capacity = _initial_capacity(_maxrank)
+        self.A_mean = linops.LowRankUpdate(A=self.A_mean0, maxrank=2 * _capacity)
+        self.Ainv_mean = linops.LowRankUpdate(A=self.Ainv_mean0, maxrank=2 * _capacity)
+        self.A_covfactor = linops.LowRankUpdate(A=self.A_covfactor0, maxrank=_capacity)
+        self.Ainv_covfactor = linops.LowRankUpdate(
+            A=self.Ainv_covfactor0, maxrank=_capacity
         )
+        self.workspace = _KrylovWorkspace(
+            n=self.n, capacity=_capacity, dtype=self.dtype
+        )
+        self.rayleigh_quotients = _LogRayleighQuotients()
+        self._init_calibration_factors()
 
-        # Create output random variables
-        x, A, Ainv = self._get_output_randvars(
-            Y_list=self.obs_list, sy_list=self.sy, phi=phi, psi=psi
+        # Trace of solution covariance
+        self._trace_Ainv_covfactor_update = 0
+        self._update_trace_Ainv_covfactor(psi=psi)
+
+        # Trace of solution covariance: tr(Cov(x))
+        self.trace_sol_cov, _, _ = self._compute_trace_sol_cov(
+            Ainv_covfactor=self._get_posterior_covfactors(phi=phi, psi=psi)[1]
         )
 
         # Iteration with stopping criteria
@@ -867,16 +1282,14 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
             # Compute search direction (with implicit reorthogonalization) via policy
             search_dir = -self.Ainv_mean @ resid
-            self.search_dir_list.append(search_dir)
 
             # Perform action and observe
             obs = self.A @ search_dir
-            self.obs_list.append(obs)
 
-            # Compute step size
-            sy = search_dir.T @ obs
-            step_size = -np.squeeze((search_dir.T @ resid) / sy)
-            self.sy.append(sy)
+            # Compute step size (with inner products accumulated in double precision)
+            sy = _inner_product(search_dir, obs)
+            step_size = -_inner_product(search_dir, resid) / sy
+            self.workspace.append(s=search_dir, y=obs, sy=sy)
 
             # Step and residual update
             self.x_mean = self.x_mean + step_size * search_dir
@@ -885,67 +1298,49 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             # (Symmetric) mean and covariance updates
             Vs = self.A_covfactor @ search_dir
             delta_A = obs - self.A_mean @ search_dir
-            u_A = Vs / (search_dir.T @ Vs)
-            v_A = delta_A - 0.5 * (search_dir.T @ delta_A) * u_A
+            u_A = Vs / _inner_product(search_dir, Vs)
+            v_A = delta_A - 0.5 * _inner_product(search_dir, delta_A) * u_A
 
             Wy = self.Ainv_covfactor @ obs
             delta_Ainv = search_dir - self.Ainv_mean @ obs
-            yWy = np.squeeze(obs.T @ Wy)
+            yWy = _inner_product(obs, Wy)
             u_Ainv = Wy / yWy
-            v_Ainv = delta_Ainv - 0.5 * (obs.T @ delta_Ainv) * u_Ainv
+            v_Ainv = delta_Ainv - 0.5 * _inner_product(obs, delta_Ainv) * u_Ainv
 
             # Rank 2 mean updates (+= uv' + vu')
-            self.A_mean = linops.aslinop(self.A_mean) + self._mean_update(u=u_A, v=v_A)
-            self.Ainv_mean = linops.aslinop(self.Ainv_mean) + self._mean_update(
-                u=u_Ainv, v=v_Ainv
+            self.A_mean = self.A_mean.update(
+                U=np.hstack((u_A, v_A)), V=np.hstack((v_A, u_A))
+            )
+            self.Ainv_mean = self.Ainv_mean.update(
+                U=np.hstack((u_Ainv, v_Ainv)), V=np.hstack((v_Ainv, u_Ainv))
             )
 
-            # Rank 1 covariance Kronecker factor update (-= u_A(Vs)' and -= u_Ainv(Wy)')
-            if self.iter_ == 0:
-                self._A_covfactor_update_term = self._covariance_update(u=u_A, Ws=Vs)
-                self._Ainv_covfactor_update_term = self._covariance_update(
-                    u=u_Ainv, Ws=Wy
-                )
-            else:
-                self._A_covfactor_update_term = (
-                    self._A_covfactor_update_term
-                    + self._covariance_update(u=u_A, Ws=Vs)
-                )
-                self._Ainv_covfactor_update_term = (
-                    self._Ainv_covfactor_update_term
-                    + self._covariance_update(u=u_Ainv, Ws=Wy)
-                )
-            self.A_covfactor = (
-                linops.aslinop(self.A_covfactor0) - self._A_covfactor_update_term
-            )
-            self.Ainv_covfactor = (
-                linops.aslinop(self.Ainv_covfactor0) - self._Ainv_covfactor_update_term
-            )
+            # Rank 1 covariance Kronecker factor update (-= Vs u_A' and -= Wy u_Ainv')
+            self.A_covfactor = self.A_covfactor.update(U=-Vs, V=u_A)
+            self.Ainv_covfactor = self.Ainv_covfactor.update(U=-Wy, V=u_Ainv)
 
-            # Calibrate uncertainty based on Rayleigh quotient
+            # Record Rayleigh quotient for uncertainty calibration (calibrated only on termination or if the callback
+            # accesses the output random variables)
             if isinstance(calibration, str) and self.is_calib_covclass:
-                phi, psi = self._calibrate_uncertainty(
-                    S=np.hstack(self.search_dir_list),
-                    sy=np.vstack(self.sy).ravel(),
-                    method=calibration,
+                self.rayleigh_quotients.update(
+                    np.log(sy) - np.log(_inner_product(search_dir, search_dir))
                 )
 
             # Update trace of solution covariance: tr(Cov(Hb))
-            _trace_Ainv_covfactor_update += 1 / yWy * np.squeeze(Wy.T @ Wy)
-            self.trace_Ainv_covfactor = np.real_if_close(
-                self._compute_trace_Ainv_covfactor0(
-                    Y=np.hstack(self.obs_list), unc_scale=psi
-                )
-                - _trace_Ainv_covfactor_update
-            ).item()
+            self._trace_Ainv_covfactor_update += 1 / yWy * _inner_product(Wy, Wy)
+            self._update_trace_Ainv_covfactor(psi=psi)
 
-            # Create output random variables
-            x, A, Ainv = self._get_output_randvars(
-                Y_list=self.obs_list, sy_list=self.sy, phi=phi, psi=psi
+            self.trace_sol_cov, _, _ = self._compute_trace_sol_cov(
+                Ainv_covfactor=self._get_posterior_covfactors(phi=phi, psi=psi)[1]
             )
 
-            # Callback function used to extract quantities from iteration
+            # Callback function used to extract quantities from iteration. Output random variables are only
+            # constructed if accessed by the callback.
             if callback is not None:
+                if isinstance(calibration, str) and self.is_calib_covclass:
+                    x, A, Ainv = self._get_lazy_output_randvars(calibration=calibration)
+                else:
+                    x, A, Ainv = self._get_lazy_output_randvars(phi=phi, psi=psi)
                 callback(
                     xk=x,
                     Ak=A,
@@ -959,6 +1354,14 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             # Iteration increment
             self.iter_ += 1
 
+        # Calibrate uncertainty based on Rayleigh quotients
+        if isinstance(calibration, str) and self.is_calib_covclass and self.iter_ > 0:
+            phi, psi = self._calibrate_uncertainty(method=calibration)
+            self._update_trace_Ainv_covfactor(psi=psi)
+
+        # Create output random variables
+        x, A, Ainv = self._get_output_randvars(phi=phi, psi=psi)
+
         # Log information on solution
         info = {
             "iter": self.iter_,
@@ -972,19 +1375,336 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         return x, A, Ainv, info
 
 
+class BlockSymmetricMatrixBasedSolver(SymmetricMatrixBasedSolver):
+    """
+    Symmetric matrix-based probabilistic linear solver for multiple right hand sides.
+
+    Solves :math:`AX=B` for all columns of :math:`B` simultaneously. In each iteration a block of search directions
+    :math:`S = -H_k R` is chosen for the residuals :math:`R` of the right hand sides which have not yet converged and
+    observed via a single matrix-matrix product :math:`Y=AS`. The search directions are orthonormalized with respect
+    to :math:`A` and linearly dependent directions are removed, such that :math:`S^\\top Y = I`. The beliefs about
+    :math:`A` and :math:`H=A^{-1}` are updated jointly by a rank :math:`2m` update for :math:`m` search directions, i.e.
+    the solver runs on BLAS-3 operations.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(n,n)
+        The square matrix or linear operator of the linear system.
+    b : array_like, shape=(n, nrhs)
+        Right-hand side matrix in :math:`A X = B`.
+    A0 : array-like or LinearOperator or RandomVariable, shape=(n, n), optional
+        A square matrix, linear operator or random variable representing the prior belief over the linear operator
+        :math:`A`. If an array or linear operator is given, a prior distribution is chosen automatically.
+    Ainv0 : array-like or LinearOperator or RandomVariable, shape=(n,n), optional
+        A square matrix, linear operator or random variable representing the prior belief over the inverse
+        :math:`H=A^{-1}`. If an array or linear operator is given, a prior distribution is chosen automatically.
+    x0 : array-like, shape=(n, nrhs), optional
+        Initial guess for the solution of the linear system. Defaults to :math:`H_0 B`.
+
+    See Also
+    --------
+    SymmetricMatrixBasedSolver : Class implementing the symmetric probabilistic linear solver.
+    """
+
+    def __init__(self, A, b, A0=None, Ainv0=None, x0=None):
+        if isinstance(A, prob.RandomVariable) or isinstance(b, prob.RandomVariable):
+            raise NotImplementedError(
+                "The block solver is only implemented for deterministic linear systems."
+            )
+        MatrixBasedSolver.__init__(self, A=A, b=b, x0=x0)
+
+        # Get or construct prior parameters
+        (
+            self.A_mean0,
+            self.A_covfactor0,
+            self.Ainv_mean0,
+            self.Ainv_covfactor0,
+        ) = self._get_prior_params(A0=A0, Ainv0=Ainv0, x0=None, b=self.b)
+        self.A_mean = self.A_mean0
+        self.A_covfactor = self.A_covfactor0
+        self.Ainv_mean = self.Ainv_mean0
+        self.Ainv_covfactor = self.Ainv_covfactor0
+
+        # Initial guess
+        if x0 is None:
+            self.x_mean = self.Ainv_mean0 @ self.b
+        elif isinstance(x0, np.ndarray):
+            self.x_mean = x0
+        else:
+            raise NotImplementedError
+        self.x0 = self.x_mean
+        self.iter_ = 0
+
+    def _randvar_shapes(self):
+        return [self.b.shape, (self.n, self.n), (self.n, self.n)]
+
+    def has_converged(self, iter, maxiter, resid=None, atol=None, rtol=None):
+        """
+        Check convergence of a linear solver.
+
+        The iteration has converged once the residuals of all right hand sides are below the tolerances.
+
+        Parameters
+        ----------
+        iter : int
+            Current iteration of solver.
+        maxiter : int
+            Maximum number of iterations
+        resid : array-like, shape=(n, nrhs)
+            Residuals :math:`R = AX_i - B` of the current iteration.
+        atol : float
+            Absolute residual tolerance. Stops if :math:`\\lVert r_j \\rVert \\leq \\text{atol}` for all columns.
+        rtol : float
+            Relative residual tolerance. Stops if :math:`\\lVert r_j \\rVert \\leq \\text{rtol} \\lVert b_j \\rVert`
+            for all columns.
+
+        Returns
+        -------
+        has_converged : bool
+            True if the method has converged.
+        convergence_criterion : str
+            Convergence criterion which caused termination.
+        """
+        # maximum iterations
+        if iter >= maxiter:
+            warnings.warn(
+                message="Iteration terminated. Solver reached the maximum number of iterations."
+            )
+            return True, "maxiter"
+        # residuals below error tolerance
+        resid_norms = np.linalg.norm(resid, axis=0)
+        if np.all(resid_norms <= atol):
+            return True, "resid_atol"
+        elif np.all(self._converged_columns(resid_norms, atol=atol, rtol=rtol)):
+            return True, "resid_rtol"
+        else:
+            return False, ""
+
+    def _converged_columns(self, resid_norms, atol, rtol):
+        """Mask of the right hand sides whose residuals are below the tolerances."""
+        return resid_norms <= np.maximum(atol, rtol * np.linalg.norm(self.b, axis=0))
+
+    def _apply_A_covfactor(self, S, Y):
+        """Apply the covariance factor of the belief about :math:`A` to search directions with observations ``Y=AS``."""
+        if self.A_covfactor0 is self.A:
+            # Avoid a further product with A for the default prior
+            return Y + self.A_covfactor.U @ (self.A_covfactor.V.T @ S)
+        return self.A_covfactor @ S
+
+    def _get_output_randvars(self, phi=None, psi=None):
+        """Return output random variables x, A, Ainv from their means and covariances."""
+        A = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=self.A_mean, cov=linops.SymmetricKronecker(A=self.A_covfactor)
+            ),
+        )
+        Ainv_cov = linops.SymmetricKronecker(A=self.Ainv_covfactor)
+        Ainv = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(mean=self.Ainv_mean, cov=Ainv_cov),
+        )
+        # Induced distribution on X via Ainv
+        delta = linops.Kronecker(
+            A=linops.Identity(shape=self.n, dtype=self.dtype), B=self.b
+        )
+        x = prob.RandomVariable(
+            shape=self.b.shape,
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=self.x_mean, cov=delta.T @ (Ainv_cov @ delta)
+            ),
+        )
+
+        # Trace of solution covariance: sum_j 1/2 (b_j'Wb_j tr(W) + ||Wb_j||^2)
+        WB = self.Ainv_covfactor @ self.b
+        self.trace_sol_cov = np.real_if_close(
+            0.5
+            * (
+                np.sum(WB * self.b) * self.Ainv_covfactor.trace()
+                + np.linalg.norm(WB) ** 2
+            )
+        ).item()
+
+        return x, A, Ainv
+
+    def solve(self, callback=None, maxiter=None, atol=None, rtol=None):
+        """
+        Solve the linear system :math:`AX=B`.
+
+        Parameters
+        ----------
+        callback : function, optional
+            User-supplied function called after each iteration of the linear solver. It is called as
+            ``callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs)`` with blocks of search directions, observations
+            and step sizes. Note that depending on the function supplied, this can slow down the solver.
+        maxiter : int
+            Maximum number of iterations
+        atol : float
+            Absolute residual tolerance. Stops if :math:`\\lVert r_j \\rVert \\leq \\text{atol}` for all columns.
+        rtol : float
+            Relative residual tolerance. Stops if :math:`\\lVert r_j \\rVert \\leq \\text{rtol} \\lVert b_j \\rVert`
+            for all columns.
+
+        Returns
+        -------
+        x : RandomVariable, shape=(n, nrhs)
+            Approximate solution :math:`X` to the linear system.
+        A : RandomVariable, shape=(n,n)
+            Posterior belief over the linear operator.
+        Ainv : RandomVariable, shape=(n,n)
+            Posterior belief over the linear operator inverse :math:`H=A^{-1}`.
+        info : dict
+            Information on convergence of the solver.
+        """
+        # Default arguments
+        if maxiter is None:
+            maxiter = self.n * 10
+        if atol is None:
+            atol = 10 ** -6
+        if rtol is None:
+            rtol = 10 ** -6
+
+        # Posterior means and covariance factors as low-rank updates of the prior with preallocated storage
+        _capacity = _initial_capacity(min(maxiter * self.b.shape[1], self.n))
+        self.A_mean = linops.LowRankUpdate(A=self.A_mean0, maxrank=2 * _capacity)
+        self.Ainv_mean = linops.LowRankUpdate(A=self.Ainv_mean0, maxrank=2 * _capacity)
+        self.A_covfactor = linops.LowRankUpdate(A=self.A_covfactor0, maxrank=_capacity)
+        self.Ainv_covfactor = linops.LowRankUpdate(
+            A=self.Ainv_covfactor0, maxrank=_capacity
+        )
+        self.workspace = _KrylovWorkspace(n=self.n, capacity=0, dtype=self.dtype)
+
+        # Initial residual
+        self.x_mean = self.x0
+        self.iter_ = 0
+        resid = self.A @ self.x_mean - self.b
+
+        # Iteration with stopping criteria
+        while True:
+            # Check convergence
+            _has_converged, _conv_crit = self.has_converged(
+                iter=self.iter_, maxiter=maxiter, resid=resid, atol=atol, rtol=rtol
+            )
+            if _has_converged:
+                break
+
+            # Compute block of search directions for the right hand sides which have not converged
+            active = ~self._converged_columns(
+                np.linalg.norm(resid, axis=0), atol=atol, rtol=rtol
+            )
+            search_dirs = -(self.Ainv_mean @ resid[:, active])
+
+            # Perform action and observe (single matrix-matrix product)
+            obs = self.A @ search_dirs
+
+            # A-orthonormalize search directions and remove linearly dependent ones, such that S'Y = I
+            SY_eigvals, SY_eigvecs = np.linalg.eigh(
+                0.5 * (search_dirs.T @ obs + obs.T @ search_dirs)
+            )
+            keep = SY_eigvals > np.finfo(self.dtype).eps * len(SY_eigvals) * np.max(
+                np.abs(SY_eigvals)
+            )
+            if not np.any(keep):
+                _conv_crit = "breakdown"
+                break
+            transform = SY_eigvecs[:, keep] / np.sqrt(SY_eigvals[keep])
+            search_dirs = search_dirs @ transform
+            obs = obs @ transform
+
+            # Step and residual update
+            step_sizes = -(search_dirs.T @ resid)
+            self.x_mean = self.x_mean + search_dirs @ step_sizes
+            resid = resid + obs @ step_sizes
+
+            # (Symmetric) mean and covariance updates
+            WS = self._apply_A_covfactor(search_dirs, obs)
+            U_A, V_A = _symmetric_kronecker_update(
+                mean=self.A_mean, S=search_dirs, Y=obs, WS=WS
+            )
+            WY = self.Ainv_covfactor @ obs
+            U_Ainv, V_Ainv = _symmetric_kronecker_update(
+                mean=self.Ainv_mean, S=obs, Y=search_dirs, WS=WY
+            )
+
+            # Rank 2m mean updates (+= UV' + VU')
+            self.A_mean = self.A_mean.update(
+                U=np.hstack((U_A, V_A)), V=np.hstack((V_A, U_A))
+            )
+            self.Ainv_mean = self.Ainv_mean.update(
+                U=np.hstack((U_Ainv, V_Ainv)), V=np.hstack((V_Ainv, U_Ainv))
+            )
+
+            # Rank m covariance Kronecker factor updates (-= WS U_A' and -= WY U_Ainv')
+            self.A_covfactor = self.A_covfactor.update(U=-WS, V=U_A)
+            self.Ainv_covfactor = self.Ainv_covfactor.update(U=-WY, V=U_Ainv)
+
+            # Callback function used to extract quantities from iteration. Output random variables are only
+            # constructed if accessed by the callback.
+            if callback is not None:
+                x, A, Ainv = self._get_lazy_output_randvars()
+                callback(
+                    xk=x,
+                    Ak=A,
+                    Ainvk=Ainv,
+                    sk=search_dirs,
+                    yk=obs,
+                    alphak=step_sizes,
+                    resid=resid,
+                )
+
+            # Iteration increment
+            self.iter_ += 1
+
+        # Create output random variables
+        x, A, Ainv = self._get_output_randvars()
+
+        # Log information on solution
+        info = {
+            "iter": self.iter_,
+            "maxiter": maxiter,
+            "resid_l2norm": np.linalg.norm(resid, ord=2),
+            "trace_sol_cov": self.trace_sol_cov,
+            "conv_crit": _conv_crit,
+            "rel_cond": None,
+        }
+
+        return x, A, Ainv, info
+
+
 class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
     """
     Solver iteration of the noisy symmetric probabilistic linear solver.
 
     Implements the solve iteration of the symmetric matrix-based probabilistic linear solver taking into account noisy
-    matrix-vector products :math:`y_k = (A + E_k)s_k` as described in [1]_ and [2]_.
+    matrix-vector products :math:`y_k = (A + E_k)s_k` as described in [1]_ and [2]_. The system matrix is only accessed
+    through a random matrix-vector product oracle, i.e. a linear operator whose products return independent noisy
+    realizations :math:`(A + E)v`, such as a kernel matrix evaluated on a random subset of the data. If a random
+    variable is given instead, noisy products are drawn from its distribution without forming samples of the matrix.
+
+    The noise is assumed to be proportional to the prior covariance, i.e. :math:`E_k \\sim \\mathcal{N}(0, \\varepsilon^2
+    W \\otimes_s W)`. Each observation is the average of ``batch_size`` noisy products, which reduces the noise scale
+    to :math:`\\varepsilon^2 / m` for a mini-batch of size :math:`m`. The posterior over :math:`A` then is
+
+    .. math::
+        \\mathbb{E}[A] = A_0 + c(A_k^{\\text{exact}} - A_0), \\qquad
+        \\operatorname{Cov}(A) = (1 - c) W \\otimes_s W + c W_k \\otimes_s W_k, \\qquad
+        c = \\frac{1}{1 + \\varepsilon^2 / m},
+
+    where :math:`A_k^{\\text{exact}}` and :math:`W_k` are the posterior mean and covariance factor given exact
+    observations, and analogously for :math:`H=A^{-1}`. The iteration terminates once the signal-to-noise ratio of an
+    observation drops below two, since further observations carry little information about the solution. The
+    recursively updated residual does not reflect the noise, hence the residual tolerance is always verified with a
+    freshly observed residual, and the iteration also terminates if that residual is dominated by noise.
 
     Parameters
     ----------
     A : LinearOperator or RandomVariable, shape=(n,n)
-        The square matrix or linear operator of the linear system.
-    b : array_like, shape=(n,) or (n, nrhs)
-        Right-hand side vector or matrix in :math:`A x = b`.
+        Random matrix-vector product oracle or random variable representing the noisy system matrix.
+    b : array_like or RandomVariable, shape=(n,) or (n, 1)
+        Right-hand side vector in :math:`A x = b`. If a random variable is given, its mean is used.
     A0 : array-like or LinearOperator or RandomVariable, shape=(n, n), optional
         A square matrix, linear operator or random variable representing the prior belief over the linear operator
         :math:`A`. If an array or linear operator is given, a prior distribution is chosen automatically.
@@ -1014,6 +1734,23 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
     See Also
     --------
     SymmetricMatrixBasedSolver : Class implementing the symmetric probabilistic linear solver.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg import linops
+    >>> from probnum.linalg.linearsolvers import NoisySymmetricMatrixBasedSolver
+    >>> np.random.seed(0)
+    >>> n = 20
+    >>> A = np.diag(np.linspace(1., 2., n))
+    >>> def noisy_matvec(v):
+    ...     return A @ v + 10 ** -4 * np.random.normal(size=v.shape)
+    >>> A_oracle = linops.LinearOperator(shape=(n, n), matvec=noisy_matvec)
+    >>> b = np.ones(n)
+    >>> solver = NoisySymmetricMatrixBasedSolver(A=A_oracle, b=b)
+    >>> x, _, _, info = solver.solve(batch_size=4)
+    >>> np.linalg.norm(x.mean() - np.linalg.solve(A, b)) < 10 ** -2
+    True
     """
 
     def __init__(self, A, b, A0=None, Ainv0=None, x0=None):
@@ -1026,6 +1763,12 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         super().__init__(A=A, b=_b, x0=x0)
 
+        # The system matrix is only accessed via noisy matrix-vector products
+        if isinstance(A, prob.RandomVariable):
+            self.matvec_oracle = _RandomMatvecOracle(A)
+        else:
+            self.matvec_oracle = linops.aslinop(A)
+
         # Get or initialize prior parameters
         (
             A0_mean,
@@ -1037,32 +1780,35 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         # Matrix prior parameters
         self.A0_mean = linops.aslinop(A0_mean)
-        self.A_mean = linops.aslinop(A0_mean)
-        self.A0_covfactor = A0_covfactor
+        self.A_mean = self.A0_mean
+        self.A0_covfactor = linops.aslinop(A0_covfactor)
+        self.A_covfactor = self.A0_covfactor
         self.Ainv0_mean = linops.aslinop(Ainv0_mean)
-        self.Ainv_mean = linops.aslinop(Ainv0_mean)
-        self.Ainv0_covfactor = Ainv0_covfactor
+        self.Ainv_mean = self.Ainv0_mean
+        self.Ainv0_covfactor = linops.aslinop(Ainv0_covfactor)
+        self.Ainv_covfactor = self.Ainv0_covfactor
         self.b_mean = b_mean
 
         # Induced distribution on x via Ainv
         # Exp = x = A^-1 b, Cov = 1/2 (W b'Wb + Wbb'W)
-        Wb = Ainv0_covfactor @ self.b_mean
-        bWb = np.squeeze(Wb.T @ self.b_mean)
-
-        def _mv(x):
-            return 0.5 * (bWb * Ainv0_covfactor @ x + Wb @ (Wb.T @ x))
-
-        self.x_cov = linops.LinearOperator(
-            shape=(self.n, self.n), dtype=float, matvec=_mv, matmat=_mv
+        self.x_cov0, self.trace_sol_cov0 = self._solution_covariance(
+            Ainv_covfactor=self.Ainv0_covfactor
         )
+        self.x_cov = self.x_cov0
+        self.trace_sol_cov = self.trace_sol_cov0
         if isinstance(x0, np.ndarray):
             self.x_mean = x0
         elif x0 is None:
-            self.x_mean = Ainv0_mean @ self.b_mean
+            self.x_mean = self.Ainv0_mean @ self.b_mean
         else:
             raise NotImplementedError
         self.x0 = self.x_mean
 
+        # Noise scale and resulting weight of the observations
+        self.noise_scale = 0.0
+        self.obs_weight = 1.0
+        self.iter_ = 0
+
     def _get_prior_params(self, A0, Ainv0, x0, b):
         """
         Get the parameters of the matrix priors on A and H.
@@ -1101,35 +1847,26 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
         """
 
         # Right hand side mean
-        b_mean = b.sample(1)  # TODO: build prior model for rhs and change to b.mean()
+        b_mean = np.reshape(b.mean(), (self.n, -1)).astype(self.dtype, copy=False)
 
         # No matrix priors specified
         if A0 is None and Ainv0 is None:
             # No prior information given
             if x0 is None:
-                Ainv0_mean = linops.Identity(shape=self.n)
-                Ainv0_covfactor = linops.Identity(shape=self.n)
+                Ainv0_mean = linops.Identity(shape=self.n, dtype=self.dtype)
+                Ainv0_covfactor = linops.Identity(shape=self.n, dtype=self.dtype)
                 # Standard normal covariance
-                A0_mean = linops.Identity(shape=self.n)
-                A0_covfactor = linops.Identity(
-                    shape=self.n
-                )  # TODO: should this be a sample from A to achieve symm. posterior correspondence?
+                A0_mean = linops.Identity(shape=self.n, dtype=self.dtype)
+                A0_covfactor = linops.Identity(shape=self.n, dtype=self.dtype)
                 return A0_mean, A0_covfactor, Ainv0_mean, Ainv0_covfactor, b_mean
-            # Construct matrix priors from initial guess x0
+            # Construct matrix priors from initial guess x0 (requires at most a single noisy product)
             elif isinstance(x0, np.ndarray):
-                # Sample from linear operator for prior construction
-                if isinstance(self.A, prob.RandomVariable):
-                    _A = self.A.sample([1])[0]
-                else:
-                    _A = self.A
                 A0_mean, Ainv0_mean = self._construct_symmetric_matrix_prior_means(
-                    A=_A, x0=x0, b=b_mean
+                    A=self.matvec_oracle, x0=x0, b=b_mean
                 )
                 Ainv0_covfactor = Ainv0_mean
                 # Standard normal covariance
-                A0_covfactor = linops.Identity(
-                    shape=self.n
-                )  # TODO: should this be a sample from A to achieve symm. posterior correspondence?
+                A0_covfactor = linops.Identity(shape=self.n, dtype=self.dtype)
                 return A0_mean, A0_covfactor, Ainv0_mean, Ainv0_covfactor, b_mean
             elif isinstance(x0, prob.RandomVariable):
                 raise NotImplementedError
@@ -1156,15 +1893,13 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
                 )
                 A0_mean = np.linalg.inv(Ainv0.mean())
             except NotImplementedError:
-                A0_mean = linops.Identity(self.n)
+                A0_mean = linops.Identity(self.n, dtype=self.dtype)
                 warnings.warn(
                     message="Prior specified only for Ainv. Automatic prior mean inversion not implemented, "
                     + "falling back to standard normal prior."
                 )
             # Standard normal covariance
-            A0_covfactor = linops.Identity(
-                shape=self.n
-            )  # TODO: should this be a sample from A to achieve symm. posterior correspondence?
+            A0_covfactor = linops.Identity(shape=self.n, dtype=self.dtype)
             return A0_mean, A0_covfactor, Ainv0_mean, Ainv0_covfactor, b_mean
 
         # Prior on A specified
@@ -1189,7 +1924,7 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
                 )
                 Ainv0_mean = np.linalg.inv(A0.mean())
             except NotImplementedError:
-                Ainv0_mean = linops.Identity(self.n)
+                Ainv0_mean = linops.Identity(self.n, dtype=self.dtype)
                 warnings.warn(
                     message="Prior specified only for A. "
                     + "Automatic prior mean inversion failed, falling back to standard normal prior."
@@ -1209,7 +1944,22 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
         else:
             raise NotImplementedError
 
-    def has_converged(self, iter, maxiter, atol=None, rtol=None):
+    def _solution_covariance(self, Ainv_covfactor):
+        """
+        Covariance :math:`\\frac{1}{2}(W b^\\top W b + Wbb^\\top W)` of the solution induced by the belief over
+        :math:`H` and its trace.
+        """
+        Wb = Ainv_covfactor @ self.b_mean
+        bWb = _inner_product(Wb, self.b_mean)
+        x_cov = linops.LowRankUpdate(
+            A=self.dtype.type(0.5 * bWb) * linops.aslinop(Ainv_covfactor),
+            U=0.5 * Wb,
+            V=Wb,
+        )
+        trace_sol_cov = 0.5 * (bWb * Ainv_covfactor.trace() + _inner_product(Wb, Wb))
+        return x_cov, np.real_if_close(trace_sol_cov).item()
+
+    def has_converged(self, iter, maxiter, resid=None, atol=None, rtol=None):
         """
         Check convergence of a linear solver.
 
@@ -1221,14 +1971,14 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
             Current iteration of solver.
         maxiter : int
             Maximum number of iterations
+        resid : array-like
+            Residual vector :math:`r_i = Ax_i - b` of the current iteration estimated from the noisy observations.
         atol : float
-            Absolute tolerance for the uncertainty about the solution estimate. Stops if
-            :math:`\\sqrt{\\text{tr}(\\Sigma)}  \\leq \\text{atol}`, where :math:`\\Sigma` is the covariance of the
-            solution :math:`x`.
+            Absolute tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{atol}`.
         rtol : float
-            Relative tolerance for the uncertainty about the solution estimate. Stops if
-            :math:`\\sqrt{\\text{tr}(\\Sigma)} \\leq \\text{rtol} \\lVert x_i \\rVert`, where :math:`\\Sigma` is the
-            covariance of the solution :math`x` and :math:`x_i` its mean.
+            Relative tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{rtol} \\lVert b \\rVert`.
 
         Returns
         -------
@@ -1243,18 +1993,121 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
                 message="Iteration terminated. Solver reached the maximum number of iterations."
             )
             return True, "maxiter"
+        # residual below error tolerance
+        resid_norm = np.linalg.norm(resid)
+        b_norm = np.linalg.norm(self.b_mean)
+        if resid_norm <= atol:
+            return True, "resid_atol"
+        elif resid_norm <= rtol * b_norm:
+            return True, "resid_rtol"
         # uncertainty-based
-        if isinstance(self.x_cov, linops.LinearOperator):
-            sqrttracecov = np.sqrt(self.x_cov.trace())
-        else:
-            sqrttracecov = np.sqrt(np.trace(self.x_cov))
+        sqrttracecov = np.sqrt(self.trace_sol_cov)
         if sqrttracecov <= atol:
-            return True, "covar_atol"
-        elif sqrttracecov <= rtol * np.linalg.norm(self.x_mean):
-            return True, "covar_rtol"
+            return True, "tracecov_atol"
+        elif sqrttracecov <= rtol * b_norm:
+            return True, "tracecov_rtol"
         else:
             return False, ""
 
+    def _observe(self, s, batch_size):
+        """
+        Average of a mini-batch of noisy matrix-vector products.
+
+        Returns the averaged observation and the sample variance :math:`\\frac{1}{m-1} \\sum_{j=1}^m \\lVert y_j -
+        \\bar{y} \\rVert^2` of the products, which is zero for a single product.
+        """
+        products = np.hstack(
+            [np.reshape(self.matvec_oracle @ s, (self.n, 1)) for _ in range(batch_size)]
+        )
+        y = np.mean(products, axis=1, keepdims=True).astype(self.dtype, copy=False)
+        if batch_size == 1:
+            return y, 0.0
+        return y, np.sum((products - y) ** 2) / (batch_size - 1)
+
+    def _noise_sqnorm(self, s):
+        """
+        Expected squared norm of the noise of a single product per unit noise scale.
+
+        Under the noise model :math:`E \\sim \\mathcal{N}(0, \\varepsilon^2 W \\otimes_s W)` it holds that
+        :math:`\\mathbb{E}[\\lVert Es \\rVert^2] = \\frac{\\varepsilon^2}{2}(\\operatorname{tr}(W) s^\\top W s +
+        \\lVert Ws \\rVert^2)`.
+        """
+        Ws = self.A0_covfactor @ s
+        return 0.5 * (
+            self._trace_A0_covfactor * _inner_product(s, Ws) + _inner_product(Ws, Ws)
+        )
+
+    def _observe_residual(self, batch_size, estimate_noise):
+        """
+        Residual :math:`r = Ax - b` of the current solution estimate observed via a mini-batch of noisy products.
+
+        Returns the residual and the expected squared norm of its noise.
+        """
+        Ax, sample_var = self._observe(self.x_mean, batch_size=batch_size)
+        if estimate_noise:
+            noise_sqnorm = sample_var / batch_size
+        elif self.noise_scale > 0:
+            noise_sqnorm = (
+                self.noise_scale / batch_size * self._noise_sqnorm(self.x_mean)
+            )
+        else:
+            noise_sqnorm = 0.0
+        return Ax - self.b_mean, noise_sqnorm
+
+    def _get_output_randvars(self):
+        """Return output random variables x, A, Ainv from their means and covariances."""
+        c = self.obs_weight
+
+        def _posterior_cov(covfactor0, covfactor):
+            cov = linops.SymmetricKronecker(A=covfactor)
+            if c < 1:
+                cov = (1 - c) * linops.SymmetricKronecker(A=covfactor0) + c * cov
+            return cov
+
+        A = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=self.A_mean,
+                cov=_posterior_cov(self.A0_covfactor, self.A_covfactor),
+            ),
+        )
+        Ainv = prob.RandomVariable(
+            shape=(self.n, self.n),
+            dtype=self.dtype,
+            distribution=prob.Normal(
+                mean=self.Ainv_mean,
+                cov=_posterior_cov(self.Ainv0_covfactor, self.Ainv_covfactor),
+            ),
+        )
+        x = prob.RandomVariable(
+            shape=(self.n,),
+            dtype=self.dtype,
+            distribution=prob.Normal(mean=self.x_mean.ravel(), cov=self.x_cov),
+        )
+        return x, A, Ainv
+
+    def _get_lazy_output_randvars(self):
+        """Return proxies of the output random variables x, A, Ainv in the current state of the solver."""
+        # Solver state at the current iteration. Quantities are replaced rather than modified in place during the
+        # iteration, such that a shallow copy suffices.
+        state = copy.copy(self)
+        randvars = []
+
+        def _get_distribution(i):
+            if not randvars:
+                randvars.extend(state._get_output_randvars())
+            return randvars[i].distribution
+
+        return tuple(
+            prob.randomvariable._LazyRandomVariable(
+                shape=shape,
+                dtype=self.dtype,
+                distribution_factory=lambda i=i: _get_distribution(i),
+            )
+            for i, shape in enumerate([(self.n,), (self.n, self.n), (self.n, self.n)])
+        )
+
     def solve(
         self,
         callback=None,
@@ -1262,6 +2115,7 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
         atol=10 ** -6,
         rtol=10 ** -6,
         noise_scale=None,
+        batch_size=1,
         **kwargs
     ):
         """
@@ -1276,15 +2130,17 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
         maxiter : int
             Maximum number of iterations
         atol : float
-            Absolute tolerance for the uncertainty about the solution estimate. Stops if
-            :math:`\\sqrt{\\text{tr}(\\Sigma)}  \\leq \\text{atol}`, where :math:`\\Sigma` is the covariance of the
-            solution :math:`x`.
+            Absolute tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{atol}`.
         rtol : float
-            Relative tolerance for the uncertainty about the solution estimate. Stops if
-            :math:`\\sqrt{\\text{tr}(\\Sigma)} \\leq \\text{rtol} \\lVert x_i \\rVert`, where :math:`\\Sigma` is the
-            covariance of the solution :math`x` and :math:`x_i` its mean.
-        noise_scale : float
-            Assumed (initial) noise scale :math:`\\varepsilon^2`.
+            Relative tolerance. Stops if
+            :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(\\operatorname{Cov}(x))}) \\leq \\text{rtol} \\lVert b \\rVert`.
+        noise_scale : float, optional
+            Assumed noise scale :math:`\\varepsilon^2` of a single matrix-vector product. If not given, it is estimated
+            from the sample variance of the mini-batches, or assumed to be zero for ``batch_size=1``. Convergence in
+            the residual is verified against an observed residual regardless of the noise scale.
+        batch_size : int, default=1
+            Number :math:`m` of noisy matrix-vector products averaged per observation.
 
         Returns
         -------
@@ -1297,4 +2153,706 @@ class NoisySymmetricMatrixBasedSolver(MatrixBasedSolver):
         info : dict
             Information on convergence of the solver.
         """
-        raise NotImplementedError
+        # Default arguments
+        if maxiter is None:
+            maxiter = self.n * 10
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer.")
+        if noise_scale is not None and noise_scale < 0:
+            raise ValueError("The noise scale must be non-negative.")
+        estimate_noise = noise_scale is None and batch_size > 1
+        self.noise_scale = 0.0 if noise_scale is None else noise_scale
+        self.obs_weight = 1.0
+        if estimate_noise or self.noise_scale > 0:
+            self._trace_A0_covfactor = self.A0_covfactor.trace()
+        noise_estimates = []
+
+        # Posterior beliefs over A and H given the observations collected so far
+        _capacity = _initial_capacity(min(maxiter, self.n))
+        A_posterior = _NoisySymmetricKroneckerPosterior(
+            mean=self.A0_mean,
+            covfactor=self.A0_covfactor,
+            maxrank=_capacity,
+            dtype=self.dtype,
+        )
+        Ainv_posterior = _NoisySymmetricKroneckerPosterior(
+            mean=self.Ainv0_mean,
+            covfactor=self.Ainv0_covfactor,
+            maxrank=_capacity,
+            dtype=self.dtype,
+        )
+        Wb0 = self.Ainv0_covfactor @ self.b_mean
+
+        # Initial residual
+        self.x_mean = self.x0
+        self.iter_ = 0
+        resid, _ = self._observe_residual(
+            batch_size=batch_size, estimate_noise=estimate_noise
+        )
+        resid_is_observed = True
+
+        # Iteration with stopping criteria
+        while True:
+            # Check convergence
+            _has_converged, _conv_crit = self.has_converged(
+                iter=self.iter_, maxiter=maxiter, resid=resid, atol=atol, rtol=rtol
+            )
+            if (
+                _has_converged
+                and not resid_is_observed
+                and _conv_crit in ["resid_atol", "resid_rtol"]
+            ):
+                # The recursively updated residual vanishes regardless of the noise in the observations. Verify
+                # convergence with a freshly observed residual and continue from it if the tolerance is not met.
+                resid, resid_noise_sqnorm = self._observe_residual(
+                    batch_size=batch_size, estimate_noise=estimate_noise
+                )
+                resid_is_observed = True
+                _has_converged, _conv_crit = self.has_converged(
+                    iter=self.iter_, maxiter=maxiter, resid=resid, atol=atol, rtol=rtol
+                )
+                if not _has_converged and 4 * resid_noise_sqnorm >= _inner_product(
+                    resid, resid
+                ):
+                    # Residual is indistinguishable from the noise
+                    _has_converged, _conv_crit = True, "noise"
+            if _has_converged:
+                break
+
+            # Compute search direction
+            search_dir = -(self.Ainv_mean @ resid)
+
+            # Perform action and observe (averaged over a mini-batch)
+            obs, sample_var = self._observe(search_dir, batch_size=batch_size)
+
+            # Noise scale and expected squared norm of the noise of the averaged observation
+            if estimate_noise:
+                noise_sqnorm = sample_var / batch_size
+                noise_estimates.append(sample_var / self._noise_sqnorm(search_dir))
+                self.noise_scale = np.mean(noise_estimates)
+            elif self.noise_scale > 0:
+                noise_sqnorm = (
+                    self.noise_scale / batch_size * self._noise_sqnorm(search_dir)
+                )
+            else:
+                noise_sqnorm = 0.0
+
+            # Stop once the signal-to-noise ratio of the observation drops below two
+            sy = _inner_product(search_dir, obs)
+            if sy <= 0 or 4 * noise_sqnorm >= _inner_product(obs, obs):
+                _conv_crit = "noise"
+                break
+            self.obs_weight = 1 / (1 + self.noise_scale / batch_size)
+
+            # Step size and solution update
+            step_size = -_inner_product(search_dir, resid) / sy
+            self.x_mean = self.x_mean + step_size * search_dir
+            resid = resid + step_size * obs
+            resid_is_observed = False
+
+            # Posterior means and covariance factors (symmetric posterior correspondence for H)
+            A_posterior.append(s=search_dir, y=obs)
+            Ainv_posterior.append(
+                s=obs, y=search_dir, rtol=noise_sqnorm / _inner_product(obs, obs)
+            )
+            self.A_mean = A_posterior.mean(weight=self.obs_weight)
+            self.Ainv_mean = Ainv_posterior.mean(weight=self.obs_weight)
+            self.A_covfactor = A_posterior.covfactor
+            self.Ainv_covfactor = Ainv_posterior.covfactor
+
+            # Covariance of the solution Cov(x) = (1 - c) Cov_0(x) + c Cov_k(x)
+            Z = Ainv_posterior.Z
+            Wb = Wb0 - Z @ (Z.T @ self.b_mean)
+            bWb = _inner_product(Wb, self.b_mean)
+            self.x_cov = linops.LowRankUpdate(
+                A=self.dtype.type(0.5 * bWb) * linops.aslinop(self.Ainv_covfactor),
+                U=0.5 * Wb,
+                V=Wb,
+            )
+            trace_sol_cov = 0.5 * (
+                bWb * Ainv_posterior.trace_covfactor() + _inner_product(Wb, Wb)
+            )
+            if self.obs_weight < 1:
+                self.x_cov = (
+                    1 - self.obs_weight
+                ) * self.x_cov0 + self.obs_weight * self.x_cov
+                trace_sol_cov = (
+                    1 - self.obs_weight
+                ) * self.trace_sol_cov0 + self.obs_weight * trace_sol_cov
+            self.trace_sol_cov = np.real_if_close(trace_sol_cov).item()
+
+            # Callback function used to extract quantities from iteration
+            if callback is not None:
+                x, A, Ainv = self._get_lazy_output_randvars()
+                callback(
+                    xk=x,
+                    Ak=A,
+                    Ainvk=Ainv,
+                    sk=search_dir,
+                    yk=obs,
+                    alphak=step_size,
+                    resid=resid,
+                    noise_scale=self.noise_scale,
+                )
+
+            # Iteration increment
+            self.iter_ += 1
+
+        # Report an observed rather than the recursively updated residual for noisy systems
+        if not resid_is_observed:
+            resid, _ = self._observe_residual(
+                batch_size=batch_size, estimate_noise=estimate_noise
+            )
+
+        # Create output random variables
+        x, A, Ainv = self._get_output_randvars()
+
+        # Log information on solution
+        info = {
+            "iter": self.iter_,
+            "maxiter": maxiter,
+            "resid_l2norm": np.linalg.norm(resid, ord=2),
+            "trace_sol_cov": self.trace_sol_cov,
+            "conv_crit": _conv_crit,
+            "rel_cond": None,
+            "noise_scale": self.noise_scale,
+        }
+
+        return x, A, Ainv, info
+
+
+def _initial_capacity(maxrank):
+    """
+    Number of columns to preallocate for iterates with at most ``maxrank`` columns.
+
+    Storage is only reserved for the first few iterations and extended geometrically on demand, since solvers typically
+    converge long before the maximum number of iterations.
+    """
+    return min(maxrank, 16)
+
+
+def _inner_product(u, v):
+    """
+    Inner product of two (column) vectors accumulated in double precision.
+
+    Ensures that step sizes and update coefficients are computed accurately, even if the solver iterates in single
+    precision.
+    """
+    return np.dot(
+        np.ravel(u).astype(np.float64, copy=False),
+        np.ravel(v).astype(np.float64, copy=False),
+    )
+
+
+def _symmetric_kronecker_update(mean, S, Y, WS):
+    """
+    Factors of the posterior update of a symmetric matrix under a symmetric Kronecker product prior.
+
+    Given the prior :math:`\\mathcal{N}(M_0, W \\otimes_s W)` and observations :math:`MS = Y`, the posterior mean is
+    :math:`M_0 + UV^\\top + VU^\\top` and the posterior covariance factor is :math:`W - WSU^\\top` with
+
+    .. math::
+        U = WS(S^\\top W S)^{-1}, \\qquad V = \\Delta - \\frac{1}{2} U S^\\top \\Delta, \\qquad \\Delta = Y - M_0S.
+
+    Parameters
+    ----------
+    mean : LinearOperator, shape=(n,n)
+        Prior mean :math:`M_0`.
+    S : np.ndarray, shape=(n,k)
+        Actions.
+    Y : np.ndarray, shape=(n,k)
+        Observations.
+    WS : np.ndarray, shape=(n,k)
+        Actions multiplied by the prior covariance factor.
+
+    Returns
+    -------
+    U : np.ndarray, shape=(n,k)
+    V : np.ndarray, shape=(n,k)
+    """
+    U = np.linalg.solve(S.T @ WS, WS.T).T
+    delta = Y - mean @ S
+    V = delta - 0.5 * U @ (S.T @ delta)
+    return U, V
+
+
+class _KrylovWorkspace:
+    """
+    Preallocated storage for the search directions, observations and their inner products.
+
+    Columns are written in place as the solver iterates, such that the quantities collected so far are available as
+    views of the leading columns without copying. Written columns are never modified. If the capacity is exhausted,
+    it is doubled.
+
+    Parameters
+    ----------
+    n : int
+        Dimension of the linear system.
+    capacity : int
+        Initial number of columns.
+    dtype : numpy.dtype
+        Data type of the search directions and observations. Inner products are stored in double precision.
+    """
+
+    def __init__(self, n, capacity, dtype):
+        self._S = np.empty((n, capacity), dtype=dtype)
+        self._Y = np.empty((n, capacity), dtype=dtype)
+        self._sy = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    @property
+    def capacity(self):
+        return self._sy.shape[0]
+
+    @property
+    def search_dirs(self):
+        """Search directions :math:`S` collected so far."""
+        return self._S[:, : self.size]
+
+    @property
+    def observations(self):
+        """Observations :math:`Y=AS` collected so far."""
+        return self._Y[:, : self.size]
+
+    @property
+    def inner_products(self):
+        """Inner products :math:`s_i^\\top y_i` collected so far."""
+        return self._sy[: self.size]
+
+    def append(self, s, y, sy):
+        """Store a search direction, its observation and their inner product."""
+        if self.size == self.capacity:
+            self._grow(max(1, 2 * self.capacity))
+        self._S[:, self.size] = np.ravel(s)
+        self._Y[:, self.size] = np.ravel(y)
+        self._sy[self.size] = sy
+        self.size += 1
+
+    def _grow(self, capacity):
+        n, size = self._S.shape[0], self.size
+        S = np.empty((n, capacity), dtype=self._S.dtype)
+        Y = np.empty((n, capacity), dtype=self._Y.dtype)
+        sy = np.empty(capacity, dtype=self._sy.dtype)
+        S[:, :size] = self._S[:, :size]
+        Y[:, :size] = self._Y[:, :size]
+        sy[:size] = self._sy[:size]
+        self._S, self._Y, self._sy = S, Y, sy
+
+
+class _LogRayleighQuotients:
+    """
+    Running statistics of the log-Rayleigh quotients :math:`\\ln R_i = \\ln(s_i^\\top A s_i) - \\ln(s_i^\\top s_i)` of the
+    search directions for uncertainty calibration.
+
+    Each update requires :math:`\\mathcal{O}(1)` operations. The statistics determine the most recent and the weighted
+    mean log-Rayleigh quotient as well as a least-squares fit of the model :math:`\\ln R_i \\approx \\theta_0 +
+    \\theta_1 \\ln(i)` based on Weyl's result on the spectra of Gram matrices of differentiable kernels.
+
+    Parameters
+    ----------
+    deprecation_rate : float
+        Weight decay of the weighted mean.
+    """
+
+    def __init__(self, deprecation_rate=0.9):
+        self.deprecation_rate = deprecation_rate
+        self.size = 0
+        self.last = None
+        self._weighted_sum = 0.0
+        self._sum_logi = 0.0
+        self._sum_logi2 = 0.0
+        self._sum_logR = 0.0
+        self._sum_logi_logR = 0.0
+
+    def update(self, logR):
+        """Add the log-Rayleigh quotient of the most recent search direction."""
+        logi = np.log(self.size + 1)
+        self._weighted_sum += logR * self.deprecation_rate ** self.size
+        self._sum_logi += logi
+        self._sum_logi2 += logi ** 2
+        self._sum_logR += logR
+        self._sum_logi_logR += logi * logR
+        self.last = logR
+        self.size += 1
+
+    def weighted_mean(self):
+        """Mean of the log-Rayleigh quotients weighted by the deprecation rate."""
+        return self._weighted_sum / self.size
+
+    def predict_mean(self, n):
+        """
+        Mean predicted log-Rayleigh quotient of the remaining dimensions :math:`i = k+1, \\dots, n` under the
+        least-squares fit of the model :math:`\\ln R_i \\approx \\theta_0 + \\theta_1 \\ln(i)`.
+        """
+        theta = np.linalg.lstsq(
+            np.array([[self.size, self._sum_logi], [self._sum_logi, self._sum_logi2]]),
+            np.array([self._sum_logR, self._sum_logi_logR]),
+            rcond=None,
+        )[0]
+        if n > self.size:
+            # Mean of ln(i) for i = k+1, ..., n via the log-gamma function
+            mean_logi = (
+                scipy.special.gammaln(n + 1) - scipy.special.gammaln(self.size + 1)
+            ) / (n - self.size)
+        else:
+            mean_logi = np.log(n)
+        return theta[0] + theta[1] * mean_logi
+
+
+class _IncrementalQR:
+    """
+    QR factorization of a matrix whose columns are collected one after another.
+
+    New columns are orthonormalized against the existing basis via classical Gram-Schmidt with reorthogonalization, such
+    that appending the :math:`k`-th column requires :math:`\\mathcal{O}(nk)` operations. Since Gram-Schmidt
+    orthonormalizes columns in order, the first :math:`j` columns of the basis span the first :math:`j` columns of the
+    matrix. Hence states of the matrix with fewer columns can share the factorization.
+
+    Parameters
+    ----------
+    n : int
+        Number of rows.
+    dtype : numpy.dtype
+        Data type of the factors.
+    """
+
+    def __init__(self, n, dtype):
+        self._Q = np.empty((n, 0), dtype=dtype)
+        self._R = np.empty((0, 0), dtype=dtype)
+        self.size = 0
+
+    def basis(self, V):
+        """
+        Orthonormal basis :math:`Q` of the span of the columns of :math:`V=QR`.
+
+        Only the columns of :math:`V` which have not been factorized yet are orthonormalized. Numerically linearly
+        dependent columns contribute a zero column to the basis.
+
+        Parameters
+        ----------
+        V : np.ndarray, shape=(n,k)
+            Matrix whose leading columns are the previously factorized ones.
+
+        Returns
+        -------
+        Q : np.ndarray, shape=(n,k)
+            Orthonormal basis.
+        """
+        k = V.shape[1]
+        for j in range(self.size, k):
+            self._append(V[:, j])
+        return self._Q[:, :k]
+
+    @property
+    def R(self):
+        """Upper triangular factor :math:`R`."""
+        return self._R[: self.size, : self.size]
+
+    def _append(self, v):
+        if self.size == self._Q.shape[1]:
+            self._grow(max(1, 2 * self.size))
+        Q = self._Q[:, : self.size]
+        w = np.array(v, dtype=self._Q.dtype)
+        r = np.zeros(self.size, dtype=self._Q.dtype)
+        for _ in range(2):
+            coeffs = Q.T @ w
+            w -= Q @ coeffs
+            r += coeffs
+        rkk = np.linalg.norm(w)
+        if rkk <= np.finfo(self._Q.dtype).eps * np.linalg.norm(v):
+            # Column in the span of the previous columns
+            w[:] = 0.0
+            rkk = 0.0
+        else:
+            w /= rkk
+        self._Q[:, self.size] = w
+        self._R[: self.size, self.size] = r
+        self._R[self.size, self.size] = rkk
+        self.size += 1
+
+    def _grow(self, capacity):
+        Q = np.empty((self._Q.shape[0], capacity), dtype=self._Q.dtype)
+        R = np.zeros((capacity, capacity), dtype=self._R.dtype)
+        Q[:, : self.size] = self._Q[:, : self.size]
+        R[: self.size, : self.size] = self._R[: self.size, : self.size]
+        self._Q, self._R = Q, R
+
+
+class _IncrementalGramCholesky:
+    """
+    Cholesky factorization :math:`Y^\\top M Y = LL^\\top` of a Gram matrix whose columns :math:`Y` are collected one after
+    another.
+
+    Besides the Cholesky factor the matrix :math:`Z = MYL^{-\\top}` is maintained, such that
+    :math:`MY(Y^\\top M Y)^{-1}Y^\\top M = ZZ^\\top`. Numerically linearly dependent columns are dropped, i.e. they
+    contribute a zero row to :math:`L` and a zero column to :math:`Z`. Appending the :math:`k`-th column requires a
+    single product with :math:`M` and :math:`\\mathcal{O}(nk)` operations. As for :class:`_IncrementalQR` states with
+    fewer columns can share the factorization.
+
+    Parameters
+    ----------
+    M : LinearOperator, shape=(n,n)
+        Symmetric positive definite weight matrix.
+    dtype : numpy.dtype
+        Data type of the factors.
+    """
+
+    def __init__(self, M, dtype):
+        self.M = M
+        self._L = np.empty((0, 0), dtype=dtype)
+        self._Z = np.empty((M.shape[0], 0), dtype=dtype)
+        self._Z_sqnorms = np.empty(0, dtype=np.float64)
+        self._active = np.empty(0, dtype=bool)
+        self.size = 0
+
+    def update(self, Y):
+        """Factorize the columns of :math:`Y` which have not been factorized yet."""
+        for j in range(self.size, Y.shape[1]):
+            self._append(Y_prev=Y[:, :j], y=Y[:, j])
+
+    def trace(self, Y):
+        """Trace :math:`\\operatorname{tr}(MY(Y^\\top M Y)^{-1}Y^\\top M) = \\lVert Z \\rVert_F^2`."""
+        self.update(Y)
+        return np.sum(self._Z_sqnorms[: Y.shape[1]])
+
+    @property
+    def L(self):
+        """Lower triangular Cholesky factor :math:`L`."""
+        return self._L[: self.size, : self.size]
+
+    def _append(self, Y_prev, y):
+        if self.size == self._L.shape[0]:
+            self._grow(max(1, 2 * self.size))
+        k = self.size
+        My = np.ravel(self.M @ y)
+        yMy = _inner_product(y, My)
+
+        # New row of the Cholesky factor: L_k l = Y'My and l_kk^2 = y'My - l'l, restricted to the independent columns
+        l = np.zeros(k, dtype=self._L.dtype)
+        active = np.flatnonzero(self._active[:k])
+        if active.size > 0:
+            l[active] = scipy.linalg.solve_triangular(
+                self._L[np.ix_(active, active)], Y_prev[:, active].T @ My, lower=True
+            )
+        lkk_sq = yMy - l @ l
+        self._L[k, :k] = l
+        if lkk_sq <= 100 * (k + 1) * np.finfo(self._L.dtype).eps * np.abs(yMy):
+            # Column (numerically) in the span of the previous columns
+            self._L[k, k] = 0.0
+            self._Z[:, k] = 0.0
+            self._Z_sqnorms[k] = 0.0
+            self._active[k] = False
+        else:
+            # New column of Z = MYL^{-T} by forward substitution
+            lkk = np.sqrt(lkk_sq)
+            z = (My - self._Z[:, :k] @ l) / lkk
+            self._L[k, k] = lkk
+            self._Z[:, k] = z
+            self._Z_sqnorms[k] = _inner_product(z, z)
+            self._active[k] = True
+        self.size += 1
+
+    def _grow(self, capacity):
+        n, k = self._Z.shape[0], self.size
+        L = np.zeros((capacity, capacity), dtype=self._L.dtype)
+        Z = np.empty((n, capacity), dtype=self._Z.dtype)
+        Z_sqnorms = np.empty(capacity, dtype=np.float64)
+        L[:k, :k] = self._L[:k, :k]
+        Z[:, :k] = self._Z[:, :k]
+        Z_sqnorms[:k] = self._Z_sqnorms[:k]
+        active = np.zeros(capacity, dtype=bool)
+        active[:k] = self._active[:k]
+        self._L, self._Z, self._Z_sqnorms, self._active = L, Z, Z_sqnorms, active
+
+
+class _NoisySymmetricKroneckerPosterior:
+    """
+    Posterior of a symmetric matrix under a symmetric Kronecker product prior given noisy observations collected one
+    after another.
+
+    For the prior :math:`\\mathcal{N}(M_0, W \\otimes_s W)` and observations :math:`Y=(M + E)S` with noise
+    :math:`E \\sim \\mathcal{N}(0, \\varepsilon^2 W \\otimes_s W)` the posterior mean and covariance factor are
+
+    .. math::
+        M_k = M_0 + c(Z\\Delta^\\top + \\Delta Z^\\top - ZCZ^\\top), \\qquad W_k = W - ZZ^\\top,
+
+    where :math:`c = (1 + \\varepsilon^2)^{-1}`, :math:`S^\\top W S = LL^\\top`, :math:`T = SL^{-\\top}`,
+    :math:`Z = WT`, :math:`\\Delta = (Y - M_0S)L^{-\\top}` and :math:`C = \\frac{1}{2}(\\Delta^\\top T + T^\\top
+    \\Delta)`. Since the Cholesky factor of a Gram matrix with an additional column extends the previous one, the update
+    terms are independent of the noise scale and grow by a symmetric rank-2 term per observation. Appending an
+    observation requires a single product with each of :math:`W` and :math:`M_0` and :math:`\\mathcal{O}(nk)`
+    operations. Numerically linearly dependent actions are dropped.
+
+    Parameters
+    ----------
+    mean : LinearOperator, shape=(n,n)
+        Prior mean :math:`M_0`.
+    covfactor : LinearOperator, shape=(n,n)
+        Symmetric positive definite prior covariance factor :math:`W`.
+    maxrank : int
+        Number of observations to initially preallocate storage for.
+    dtype : numpy.dtype
+        Data type of the posterior parameters.
+    """
+
+    def __init__(self, mean, covfactor, maxrank, dtype):
+        self.mean0 = mean
+        self.covfactor0 = covfactor
+        self._update = linops.LowRankUpdate(
+            A=linops.ScalarMult(shape=mean.shape, scalar=0.0, dtype=dtype),
+            maxrank=2 * maxrank,
+            dtype=dtype,
+        )
+        self.covfactor = linops.LowRankUpdate(A=covfactor, maxrank=maxrank, dtype=dtype)
+        n = mean.shape[0]
+        self._T = np.empty((n, maxrank), dtype=dtype)
+        self._Z = np.empty((n, maxrank), dtype=dtype)
+        self._Delta = np.empty((n, maxrank), dtype=dtype)
+        self._Z_sqnorm = 0.0
+        self._trace_covfactor0 = None
+        self.size = 0
+
+    @property
+    def Z(self):
+        """Matrix :math:`Z = WSL^{-\\top}` with :math:`W_k = W - ZZ^\\top`."""
+        return self._Z[:, : self.size]
+
+    def mean(self, weight):
+        """
+        Posterior mean for a given weight :math:`c = (1 + \\varepsilon^2)^{-1}` of the observations.
+
+        The returned linear operator shares the update terms with this posterior.
+        """
+        if weight == 1:
+            return linops.LowRankUpdate(
+                A=self.mean0, U=self._update.U, V=self._update.V
+            )
+        return self.mean0 + weight * self._update
+
+    def trace_covfactor(self):
+        """Trace :math:`\\operatorname{tr}(W_k) = \\operatorname{tr}(W) - \\lVert Z \\rVert_F^2`."""
+        if self._trace_covfactor0 is None:
+            self._trace_covfactor0 = self.covfactor0.trace()
+        return self._trace_covfactor0 - self._Z_sqnorm
+
+    def append(self, s, y, rtol=0.0):
+        """
+        Condition on a further observation :math:`y = (M + E)s`.
+
+        Parameters
+        ----------
+        s : np.ndarray, shape=(n,) or (n, 1)
+            Action.
+        y : np.ndarray, shape=(n,) or (n, 1)
+            Noisy observation.
+        rtol : float, default=0.0
+            Relative tolerance below which the component of the action outside the span of the previous actions is
+            considered to be noise, i.e. the action is dropped if :math:`l_{kk}^2 \\leq \\text{rtol} \\cdot s^\\top W s`.
+        """
+        s = np.ravel(s)
+        y = np.ravel(y)
+        k = self.size
+        T, Z, Delta = self._T[:, :k], self._Z[:, :k], self._Delta[:, :k]
+
+        # New row of the Cholesky factor of S'WS: l = L^{-1}S'Ws = T'Ws and l_kk^2 = s'Ws - l'l
+        Ws = np.ravel(self.covfactor0 @ s)
+        l = T.T @ Ws
+        sWs = _inner_product(s, Ws)
+        lkk_sq = sWs - _inner_product(l, l)
+        if lkk_sq <= max(rtol, 100 * (k + 1) * np.finfo(self._T.dtype).eps) * np.abs(
+            sWs
+        ):
+            # Action (numerically) in the span of the previous actions
+            return
+
+        # New columns of T = SL^{-T}, Z = WT and Delta = (Y - M_0S)L^{-T} by forward substitution
+        lkk = np.sqrt(lkk_sq)
+        t = (s - T @ l) / lkk
+        z = (Ws - Z @ l) / lkk
+        delta = (y - np.ravel(self.mean0 @ s) - Delta @ l) / lkk
+
+        # Increment of the update term Z Delta' + Delta Z' - ZCZ' is the symmetric rank-2 term zv' + vz'
+        C_col = 0.5 * (Delta.T @ t + T.T @ delta)
+        C_kk = _inner_product(t, delta)
+        v = delta - Z @ C_col - 0.5 * C_kk * z
+        self._update = self._update.update(
+            U=np.column_stack((z, v)), V=np.column_stack((v, z))
+        )
+        self.covfactor = self.covfactor.update(U=-z, V=z)
+
+        if k == self._T.shape[1]:
+            self._grow(max(1, 2 * k))
+        self._T[:, k] = t
+        self._Z[:, k] = z
+        self._Delta[:, k] = delta
+        self._Z_sqnorm += _inner_product(z, z)
+        self.size += 1
+
+    def _grow(self, capacity):
+        k = self.size
+        for name in ["_T", "_Z", "_Delta"]:
+            buffer = np.empty((self._T.shape[0], capacity), dtype=self._T.dtype)
+            buffer[:, :k] = getattr(self, name)[:, :k]
+            setattr(self, name, buffer)
+
+
+def _covfactor_sqrt(W):
+    """Factor :math:`L` with :math:`W = LL^\\top` of a symmetric positive definite covariance factor."""
+    W = linops.aslinop(W)
+    if isinstance(W, linops.ScalarMult):
+        return linops.ScalarMult(shape=W.shape, scalar=np.sqrt(W.scalar), dtype=W.dtype)
+    elif hasattr(W, "cholesky"):
+        return W.cholesky()
+    return linops.MatrixMult(A=np.linalg.cholesky(W.todense()))
+
+
+class _RandomMatvecOracle(linops.LinearOperator):
+    """
+    Noisy matrix-vector products with a random linear operator.
+
+    Returns products :math:`(M + E)v` with an independent realization of the noise :math:`E` for each column of the
+    input. For normal distributions with (symmetric) Kronecker product covariance the product with the noise is drawn
+    directly, such that neither a sample of the operator nor its covariance are formed. For :math:`E \\sim
+    \\mathcal{N}(0, V \\otimes W)` it holds that :math:`Ev = \\sqrt{v^\\top W v} L_V z` with :math:`V=L_VL_V^\\top` and
+    standard normal :math:`z`. For :math:`E \\sim \\mathcal{N}(0, W \\otimes_s W)` it holds that
+    :math:`Ev = \\frac{1}{2} L_W (G + G^\\top) L_W^\\top v` with standard normal :math:`G`, where the product with
+    :math:`G + G^\\top` only requires a standard normal vector due to its covariance :math:`2(\\lVert u \\rVert^2 I +
+    uu^\\top)` for :math:`u = L_W^\\top v`.
+
+    Parameters
+    ----------
+    A : RandomVariable, shape=(n,n)
+        Random linear operator with normal distribution.
+    """
+
+    def __init__(self, A):
+        self.mean = linops.aslinop(A.mean())
+        cov = A.cov()
+        if isinstance(cov, linops.Kronecker):
+            self._left_sqrt = _covfactor_sqrt(cov.A)
+            self._right_factor = linops.aslinop(cov.B)
+            self._symmetric = False
+        elif isinstance(cov, linops.SymmetricKronecker) and cov._ABequal:
+            self._left_sqrt = _covfactor_sqrt(cov.A)
+            self._symmetric = True
+        else:
+            raise NotImplementedError(
+                "Noisy matrix-vector products are only implemented for (symmetric) Kronecker covariances. Provide "
+                "a linear operator returning noisy matrix-vector products instead."
+            )
+        self.random_state = A.random_state
+        super().__init__(shape=A.shape, dtype=np.result_type(A.dtype, float))
+
+    def _matvec(self, x):
+        x = np.ravel(x)
+        z = scipy.stats.norm.rvs(size=self.shape[0], random_state=self.random_state)
+        if self._symmetric:
+            u = self._left_sqrt.T @ x
+            unorm = np.linalg.norm(u)
+            if unorm > 0:
+                z = z + (np.sqrt(2) - 1) * u * (u @ z) / unorm ** 2
+            noise = np.sqrt(0.5) * unorm * (self._left_sqrt @ z)
+        else:
+            scale = np.sqrt(_inner_product(x, self._right_factor @ x))
+            noise = scale * (self._left_sqrt @ z)
+        return np.ravel(self.mean @ x) + noise
@@ -0,0 +1,330 @@
+"""
+Preconditioners for (probabilistic) linear solvers.
+
+A preconditioner :math:`M \\approx A^{-1}` is a symmetric positive definite linear operator which is cheap to apply. In
+probabilistic linear solvers a preconditioner acts as the prior mean and covariance factor of the inverse
+:math:`H=A^{-1}`, such that the matrix-based solver recovers the preconditioned conjugate gradient method. The
+preconditioner is applied separately from the low-rank updates of the posterior.
+"""
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
+
+from probnum.linalg import linops
+
+
+def _as_sparse_matrix(A):
+    """Sparse matrix in CSR format from a sparse or dense matrix or a linear operator defined via a matrix."""
+    if isinstance(A, linops.MatrixMult):
+        A = A.A
+    if scipy.sparse.issparse(A):
+        return scipy.sparse.csr_matrix(A)
+    elif isinstance(A, np.ndarray) and A.ndim == 2:
+        return scipy.sparse.csr_matrix(A)
+    raise TypeError(
+        "The matrix must be given explicitly as a (sparse) matrix or matrix-based linear operator."
+    )
+
+
+class JacobiPreconditioner(linops.LinearOperator):
+    """
+    Jacobi (diagonal) preconditioner.
+
+    Represents the linear operator :math:`M = \\operatorname{diag}(A)^{-1}`.
+
+    Parameters
+    ----------
+    A : array-like or scipy.sparse.spmatrix or LinearOperator, shape=(n,n)
+        Symmetric positive definite matrix or linear operator with positive diagonal.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg import JacobiPreconditioner
+    >>> M = JacobiPreconditioner(np.array([[2., 1.], [1., 4.]]))
+    >>> M @ np.ones(2)
+    array([0.5 , 0.25])
+    """
+
+    def __init__(self, A):
+        if isinstance(A, np.ndarray):
+            diag = np.diagonal(A)
+        else:
+            diag = A.diagonal()
+        diag = np.asarray(diag)
+        if np.any(diag <= 0):
+            raise ValueError(
+                "The Jacobi preconditioner requires a matrix with positive diagonal."
+            )
+        self.diag = diag
+        super().__init__(dtype=diag.dtype, shape=A.shape)
+
+    def _matvec(self, x):
+        return np.reshape(x, (-1,)) / self.diag
+
+    def _matmat(self, X):
+        return X / self.diag[:, None]
+
+    def _transpose(self):
+        return self
+
+    def _adjoint(self):
+        return self
+
+    def todense(self):
+        return np.diag(1 / self.diag)
+
+    def inv(self):
+        """Diagonal approximation :math:`\\operatorname{diag}(A)` of the system matrix."""
+        return linops.SparseMatrixMult(
+            scipy.sparse.diags(self.diag, format="csr"),
+            symmetric=True,
+            positive_definite=True,
+        )
+
+    # Properties
+    def trace(self):
+        return np.sum(1 / self.diag)
+
+    def diagonal(self):
+        return 1 / self.diag
+
+
+class IncompleteCholeskyPreconditioner(linops.LinearOperator):
+    """
+    Incomplete Cholesky preconditioner.
+
+    Represents the linear operator :math:`M = (LL^\\top)^{-1}`, where :math:`L` is the zero fill-in incomplete Cholesky
+    factor of :math:`A`, i.e. the lower triangular matrix with the sparsity pattern of the lower triangle of :math:`A`
+    such that :math:`(LL^\\top)_{ij} = A_{ij}` for all non-zero entries :math:`A_{ij}`. If the factorization breaks down,
+    a diagonal shift :math:`A + \\alpha \\operatorname{diag}(A)` can be factorized instead. The factorization is
+    vectorized over levels of mutually independent columns and :math:`M` is applied via compiled sparse triangular
+    solves.
+
+    Parameters
+    ----------
+    A : array-like or scipy.sparse.spmatrix or MatrixMult, shape=(n,n)
+        Sparse symmetric positive definite matrix.
+    shift : float, default=0.0
+        Relative diagonal shift :math:`\\alpha \\geq 0`.
+
+    Raises
+    ------
+    LinAlgError
+        If the incomplete factorization breaks down due to a non-positive pivot.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import scipy.sparse
+    >>> from probnum.linalg import IncompleteCholeskyPreconditioner
+    >>> A = scipy.sparse.diags([-1., 2., -1.], offsets=[-1, 0, 1], shape=(4, 4))
+    >>> M = IncompleteCholeskyPreconditioner(A)
+    >>> np.allclose(M @ (A @ np.ones(4)), np.ones(4))
+    True
+    """
+
+    def __init__(self, A, shift=0.0):
+        A = _as_sparse_matrix(A)
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("The matrix must be square.")
+        if shift < 0:
+            raise ValueError("The diagonal shift must be non-negative.")
+        if shift > 0:
+            A = A + shift * scipy.sparse.diags(A.diagonal())
+        self.L = self._incomplete_cholesky(A.astype(np.float64))
+        # Sparse LU decomposition of the triangular factor without pivoting and fill-in for compiled triangular solves
+        self._L_factor = scipy.sparse.linalg.splu(
+            self.L.tocsc(),
+            permc_spec="NATURAL",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+        super().__init__(dtype=self.L.dtype, shape=A.shape)
+
+    @staticmethod
+    def _incomplete_cholesky(A):
+        """
+        Zero fill-in incomplete Cholesky factor in CSR format.
+
+        The entry :math:`L_{ik} = (A_{ik} - \\sum_{j<k} L_{ij} L_{kj}) / L_{kk}` of column :math:`k` only depends on the
+        columns :math:`j` with :math:`L_{kj} \\neq 0`. Columns are grouped into levels, such that each column only
+        depends on columns of previous levels, and the entries of all columns of a level are computed at once from the
+        precomputed pairs of entries :math:`(L_{ij}, L_{kj})` contributing to each entry.
+        """
+        L = scipy.sparse.tril(A, format="csr")
+        L.sum_duplicates()
+        L.sort_indices()
+        n = L.shape[0]
+        indptr, indices, data = L.indptr, L.indices, L.data
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        diag_pos = indptr[1:] - 1
+        if np.any(np.diff(indptr) == 0) or np.any(indices[diag_pos] != np.arange(n)):
+            raise np.linalg.LinAlgError(
+                "Incomplete Cholesky factorization requires non-zero diagonal entries."
+            )
+
+        # Pairs of strictly lower entries (i, j) and (k, j) with k <= i in the same column, which contribute to the
+        # entry (i, k) if it is part of the sparsity pattern
+        strict = np.flatnonzero(indices != rows)
+        strict = strict[np.lexsort((rows[strict], indices[strict]))]
+        col_start = np.searchsorted(indices[strict], indices[strict], side="left")
+        npartners = np.arange(strict.shape[0]) - col_start + 1
+        partner_offsets = np.arange(np.sum(npartners)) - np.repeat(
+            np.cumsum(npartners) - npartners, npartners
+        )
+        pos_ij = strict[np.repeat(np.arange(strict.shape[0]), npartners)]
+        pos_kj = strict[np.repeat(col_start, npartners) + partner_offsets]
+        keys = rows.astype(np.int64) * n + indices
+        pair_keys = rows[pos_ij].astype(np.int64) * n + rows[pos_kj]
+        pos_ik = np.minimum(np.searchsorted(keys, pair_keys), keys.shape[0] - 1)
+        in_pattern = keys[pos_ik] == pair_keys
+        pos_ij, pos_kj, pos_ik = (
+            pos_ij[in_pattern],
+            pos_kj[in_pattern],
+            pos_ik[in_pattern],
+        )
+
+        # Level of each column, i.e. the length of the longest chain of columns it depends on
+        _indptr, _indices = indptr.tolist(), indices.tolist()
+        levels = [0] * n
+        for k in range(n):
+            levels[k] = 1 + max(
+                (levels[j] for j in _indices[_indptr[k] : _indptr[k + 1] - 1]),
+                default=-1,
+            )
+        levels = np.asarray(levels)
+
+        # Per level the diagonal entries are computed before the off-diagonal entries
+        stage = 2 * levels[indices] + (indices != rows)
+        nstages = 2 * np.max(levels) + 2
+        order = np.argsort(stage, kind="stable")
+        bounds = np.searchsorted(stage[order], np.arange(nstages + 1))
+        local_index = np.empty(keys.shape[0], dtype=int)
+        local_index[order] = np.arange(keys.shape[0]) - bounds[stage[order]]
+        pair_order = np.argsort(stage[pos_ik], kind="stable")
+        pos_ij, pos_kj, pos_ik = (
+            pos_ij[pair_order],
+            pos_kj[pair_order],
+            pos_ik[pair_order],
+        )
+        pair_bounds = np.searchsorted(stage[pos_ik], np.arange(nstages + 1))
+        pair_local_index = local_index[pos_ik]
+
+        for i in range(nstages):
+            targets = order[bounds[i] : bounds[i + 1]]
+            if targets.shape[0] == 0:
+                continue
+            pairs = slice(pair_bounds[i], pair_bounds[i + 1])
+            sums = np.bincount(
+                pair_local_index[pairs],
+                weights=data[pos_ij[pairs]] * data[pos_kj[pairs]],
+                minlength=targets.shape[0],
+            )
+            if i % 2 == 0:
+                pivots = data[targets] - sums
+                if np.any(pivots <= 0):
+                    raise np.linalg.LinAlgError(
+                        "Incomplete Cholesky factorization broke down. Try a positive diagonal shift."
+                    )
+                data[targets] = np.sqrt(pivots)
+            else:
+                data[targets] = (data[targets] - sums) / data[
+                    diag_pos[indices[targets]]
+                ]
+        return L
+
+    def _matmat(self, X):
+        Z = self._L_factor.solve(np.asarray(X))
+        return self._L_factor.solve(Z, trans="T")
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1)))[:, 0]
+
+    def _transpose(self):
+        return self
+
+    def _adjoint(self):
+        return self
+
+    def inv(self):
+        """Approximation :math:`LL^\\top` of the system matrix."""
+        return linops.SparseMatrixMult(
+            (self.L @ self.L.T).tocsr(), symmetric=True, positive_definite=True
+        )
+
+
+class DeflationPreconditioner(linops.LinearOperator):
+    """
+    Deflation preconditioner.
+
+    Represents the balancing deflation preconditioner [1]_
+
+    .. math::
+        M = UE^{-1}U^\\top + (I - UE^{-1}U^\\top A) M_0 (I - AUE^{-1}U^\\top), \\qquad E = U^\\top A U,
+
+    which removes the eigenvalues of :math:`A` associated with the deflation subspace
+    :math:`\\operatorname{span}(U)`, e.g. spanned by approximate eigenvectors of the smallest eigenvalues, from the
+    spectrum of the preconditioned system. Construction requires a single matrix-matrix product with :math:`A`.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(n,n)
+        Symmetric positive definite matrix or linear operator.
+    U : array-like, shape=(n,k)
+        Basis of the deflation subspace.
+    M0 : LinearOperator, shape=(n,n), optional
+        Preconditioner on the complement of the deflation subspace. Defaults to the identity.
+
+    References
+    ----------
+    .. [1] Tang, J. M. et al., Comparison of Two-Level Preconditioners Derived from Deflation, Domain Decomposition and
+           Multigrid Methods, *Journal of Scientific Computing*, 2009, 39, 340-370
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg import DeflationPreconditioner
+    >>> A = np.diag([1e-3, 1., 2.])
+    >>> M = DeflationPreconditioner(A, U=np.eye(3)[:, :1])
+    >>> np.round(M @ (A @ np.eye(3)[:, 0]), 6)
+    array([1., 0., 0.])
+    """
+
+    def __init__(self, A, U, M0=None):
+        U = np.asarray(U)
+        if U.ndim == 1:
+            U = U[:, None]
+        if U.shape[0] != A.shape[0]:
+            raise ValueError("Dimension mismatch between A and the deflation subspace.")
+        self.U = U
+        self.AU = np.asarray(A @ U)
+        self._E_cho = scipy.linalg.cho_factor(U.T @ self.AU)
+        if M0 is None:
+            M0 = linops.Identity(
+                shape=A.shape[0], dtype=np.result_type(A.dtype, U.dtype)
+            )
+        self.M0 = linops.aslinop(M0)
+        super().__init__(
+            dtype=np.result_type(self.M0.dtype, U.dtype, self.AU.dtype), shape=A.shape,
+        )
+
+    def _matmat(self, X):
+        coarse = scipy.linalg.cho_solve(self._E_cho, self.U.T @ X)
+        Z = self.M0 @ (X - self.AU @ coarse)
+        return (
+            Z
+            - self.U @ scipy.linalg.cho_solve(self._E_cho, self.AU.T @ Z)
+            + self.U @ coarse
+        )
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1)))[:, 0]
+
+    def _transpose(self):
+        return self
+
+    def _adjoint(self):
+        return self
@@ -0,0 +1,215 @@
+"""
+Recycling of posterior information across sequences of linear systems.
+
+Sequences of linear systems with slowly changing system matrices, as they arise in Newton's method or implicit time
+stepping, share most of their spectral information. This module compresses the posterior of a probabilistic linear
+solve into a subspace of fixed dimension, which defines the prior for the next linear system in the sequence.
+"""
+
+import numpy as np
+
+from probnum import prob
+from probnum.linalg import linops
+from probnum.linalg.linearsolvers.matrixbased import _symmetric_kronecker_update
+
+
+class RecycledSubspace:
+    """
+    Recycled deflation subspace for sequences of symmetric positive definite linear systems.
+
+    Stores an :math:`A`-orthonormal basis :math:`U \\in \\mathbb{R}^{n \\times r}` of approximate eigenvectors of the
+    system matrix belonging to its smallest eigenvalues. The prior mean of the inverse returned by :meth:`prior` is the
+    balancing deflation preconditioner [1]_
+
+    .. math::
+        H_0 = UU^\\top + (I - UU^\\top A)(I - AUU^\\top),
+
+    which satisfies :math:`H_0AU = U`. Hence the initial residual is orthogonal to :math:`\\operatorname{span}(U)` and the
+    solver only searches its :math:`A`-orthogonal complement. The covariance factor :math:`W_0 = H_0 - UU^\\top` of the
+    inverse satisfies :math:`W_0AU = 0`, such that there is no uncertainty about the solution in the recycled subspace. After each solve the basis is compressed via :meth:`update`
+    to the Ritz vectors of the smallest Ritz values in the span of the recycled basis and the new search directions, such
+    that the rank of the prior stays bounded by ``rank``.
+
+    Parameters
+    ----------
+    rank : int
+        Maximum dimension :math:`r` of the recycled subspace.
+    basis : array-like, shape=(n, k), optional
+        Initial basis of the recycled subspace. Only the first ``rank`` columns are retained.
+
+    References
+    ----------
+    .. [1] Tang, J. M. et al., Comparison of Two-Level Preconditioners Derived from Deflation, Domain Decomposition and
+           Multigrid Methods, *Journal of Scientific Computing*, 2009, 39, 340-370
+
+    See Also
+    --------
+    problinsolve : Solve linear systems in a Bayesian framework.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg import problinsolve, RecycledSubspace
+    >>> np.random.seed(42)
+    >>> n = 50
+    >>> B = np.random.rand(n, n)
+    >>> A = B @ B.T + np.eye(n)
+    >>> recycle = RecycledSubspace(rank=10)
+    >>> for t in range(3):
+    ...     x, _, _, info = problinsolve(A=A + 0.01 * t * np.eye(n), b=np.random.rand(n), recycle=recycle)
+    >>> recycle.basis.shape
+    (50, 10)
+    """
+
+    def __init__(self, rank, basis=None):
+        if rank < 0:
+            raise ValueError("The rank of the recycled subspace must be non-negative.")
+        self.rank = int(rank)
+        if basis is not None:
+            basis = np.asarray(basis)
+            if basis.ndim != 2:
+                raise ValueError("The basis of the recycled subspace must be a matrix.")
+            basis = basis[:, : self.rank]
+        self.basis = basis
+        self._Abasis = None
+
+    def prior(self, A):
+        """
+        Matrix priors deflated by the recycled subspace.
+
+        Requires a single matrix-matrix product with the system matrix to :math:`A`-orthonormalize the recycled
+        basis.
+
+        Parameters
+        ----------
+        A : array-like or LinearOperator, shape=(n,n)
+            Symmetric positive definite system matrix of the next linear system.
+
+        Returns
+        -------
+        A0 : RandomVariable or None
+            Prior belief over the linear operator :math:`A`. ``None`` if the recycled subspace is empty.
+        Ainv0 : RandomVariable or None
+            Prior belief over the inverse :math:`H=A^{-1}`. ``None`` if the recycled subspace is empty.
+        """
+        self._Abasis = None
+        if self.basis is None or self.basis.shape[1] == 0:
+            return None, None
+
+        # A-orthonormalize the recycled basis with respect to the current system matrix
+        U, AU = self._A_orthonormalize(self.basis, A @ self.basis)
+        self.basis, self._Abasis = U, AU
+        if U.shape[1] == 0:
+            return None, None
+
+        n = A.shape[0]
+        dtype = np.result_type(A.dtype, U.dtype)
+        Identity = linops.Identity(shape=n, dtype=dtype)
+
+        # Posterior of the default prior on A with covariance factor W^A = A given AU
+        U_A, V_A = _symmetric_kronecker_update(mean=Identity, S=U, Y=AU, WS=AU)
+        A0_mean = linops.LowRankUpdate(
+            A=Identity, U=np.hstack((U_A, V_A)), V=np.hstack((V_A, U_A))
+        )
+        A0_covfactor = linops.LowRankUpdate(A=A, U=-AU, V=U_A)
+
+        # Balancing deflation preconditioner H_0 = I + U(I + (AU)'AU)U' - UAU' - AUU' as prior mean of H
+        AUtAU = AU.T @ AU
+        Ainv0_mean = linops.LowRankUpdate(
+            A=Identity,
+            U=np.hstack((U, AU)),
+            V=np.hstack((U @ (np.eye(U.shape[1]) + AUtAU) - AU, -U)),
+        )
+
+        # Covariance factor W_0 = (I - UU'A)(I - AUU') = H_0 - UU' of H, which is conditioned on H AU = U, i.e.
+        # W_0 AU = 0, such that there is no uncertainty about the solution in the recycled subspace
+        Ainv0_covfactor = linops.LowRankUpdate(
+            A=Identity, U=np.hstack((U, AU)), V=np.hstack((U @ AUtAU - AU, -U))
+        )
+
+        A0 = prob.RandomVariable(
+            shape=(n, n),
+            dtype=float,
+            distribution=prob.Normal(
+                mean=A0_mean, cov=linops.SymmetricKronecker(A=A0_covfactor)
+            ),
+        )
+        Ainv0 = prob.RandomVariable(
+            shape=(n, n),
+            dtype=float,
+            distribution=prob.Normal(
+                mean=Ainv0_mean, cov=linops.SymmetricKronecker(A=Ainv0_covfactor)
+            ),
+        )
+        return A0, Ainv0
+
+    def update(self, S, Y):
+        """
+        Compress the recycled subspace and the actions of a solve into a subspace of dimension at most ``rank``.
+
+        Computes the Ritz vectors of the system matrix in the span of the recycled basis and the search directions
+        :math:`S` belonging to the ``rank`` smallest Ritz values. No further products with the system matrix are
+        required.
+
+        Parameters
+        ----------
+        S : np.ndarray, shape=(n,k)
+            Search directions of the solve.
+        Y : np.ndarray, shape=(n,k)
+            Observations :math:`Y=AS` of the solve.
+        """
+        S = np.asarray(S)
+        Y = np.asarray(Y)
+        if self._Abasis is not None:
+            S = np.hstack((self.basis, S))
+            Y = np.hstack((self._Abasis, Y))
+        self._Abasis = None
+
+        # Rayleigh-Ritz: with C'AC = I the eigenvalues of C'C are the inverse Ritz values
+        C, _ = self._A_orthonormalize(S, Y)
+        _, eigvecs = np.linalg.eigh(C.T @ C)
+        Z = eigvecs[:, ::-1][:, : self.rank]
+        self.basis = C @ Z
+
+    @staticmethod
+    def _A_orthonormalize(S, Y):
+        """A-orthonormalize a basis given its products with A, dropping (numerically) linearly dependent columns."""
+        if S.shape[1] == 0:
+            return S, Y
+        eigvals, eigvecs = np.linalg.eigh(S.T @ Y)
+        keep = eigvals > 10 * np.finfo(eigvals.dtype).eps * np.max(np.abs(eigvals))
+        transform = eigvecs[:, keep] / np.sqrt(eigvals[keep])
+        return S @ transform, Y @ transform
+
+    def save(self, file):
+        """
+        Save the recycled subspace to a file.
+
+        Parameters
+        ----------
+        file : str or file
+            File or filename to which the subspace is saved in ``.npz`` format.
+        """
+        basis = self.basis
+        if basis is None:
+            basis = np.empty((0, 0))
+        np.savez(file, rank=self.rank, basis=basis)
+
+    @classmethod
+    def load(cls, file):
+        """
+        Load a recycled subspace from a file.
+
+        Parameters
+        ----------
+        file : str or file
+            File or filename created by :meth:`save`.
+
+        Returns
+        -------
+        recycled_subspace : RecycledSubspace
+            Recycled subspace.
+        """
+        with np.load(file) as data:
+            basis = data["basis"]
+            return cls(rank=int(data["rank"]), basis=basis if basis.size > 0 else None)
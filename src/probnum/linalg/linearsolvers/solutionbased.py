@@ -8,21 +8,41 @@ observations.
 import warnings
 import numpy as np
 
-from probnum.linalg.linearsolvers.matrixbased import ProbabilisticLinearSolver
+from probnum import prob
+from probnum.linalg import linops
+from probnum.linalg.linearsolvers.matrixbased import (
+    ProbabilisticLinearSolver,
+    _KrylovWorkspace,
+    _initial_capacity,
+    _inner_product,
+)
 
 
 class SolutionBasedSolver(ProbabilisticLinearSolver):
     """
     Solver iteration of BayesCG.
 
-    Implements the solve iteration of the solution-based solver BayesCG [1]_.
+    Implements the solve iteration of the solution-based solver BayesCG [1]_. Given a Gaussian prior
+    :math:`\\mathcal{N}(x_0, \\Sigma_0)` on the solution, the posterior after observing :math:`S^\\top A x = S^\\top b`
+    for search directions :math:`S` is
+
+    .. math::
+        \\Sigma_k = \\Sigma_0 - \\Sigma_0 A S (S^\\top A \\Sigma_0 A S)^{-1} S^\\top A \\Sigma_0.
+
+    The search directions are chosen :math:`A \\Sigma_0 A`-conjugate, such that the posterior covariance is a low-rank
+    update of the prior covariance. Each iteration requires a product with :math:`\\Sigma_0`, two products with
+    :math:`A` and :math:`\\mathcal{O}(nk)` additional operations in iteration :math:`k` if search directions are
+    reorthogonalized.
 
     Parameters
     ----------
-    A : array-like or LinearOperator or RandomVariable, shape=(n,n)
+    A : array-like or LinearOperator, shape=(n,n)
         The square matrix or linear operator of the linear system.
-    b : array_like, shape=(n,) or (n, nrhs)
-        Right-hand side vector or matrix in :math:`A x = b`.
+    b : array_like, shape=(n,) or (n, 1)
+        Right-hand side vector in :math:`A x = b`.
+    x0 : array-like or RandomVariable, shape=(n,) or (n, 1), optional
+        Prior belief over the solution of the linear system. If an array is given, it is used as the prior mean and the
+        prior covariance is the identity. Defaults to a zero prior mean.
 
     References
     ----------
@@ -30,8 +50,30 @@ class SolutionBasedSolver(ProbabilisticLinearSolver):
     """
 
     def __init__(self, A, b, x0=None):
-        self.x0 = x0
-        super().__init__(A=A, b=b)
+        if isinstance(A, prob.RandomVariable) or isinstance(b, prob.RandomVariable):
+            raise NotImplementedError(
+                "BayesCG is only implemented for deterministic linear systems."
+            )
+        if b.ndim == 2 and b.shape[1] > 1:
+            raise NotImplementedError(
+                "BayesCG is only implemented for a single right hand side."
+            )
+        super().__init__(A=A, b=np.reshape(b, (-1, 1)))
+
+        # Prior on the solution
+        if isinstance(x0, prob.RandomVariable):
+            self.x0 = np.reshape(x0.mean(), (-1, 1)).astype(self.dtype)
+            self.x_cov0 = linops.aslinop(x0.cov())
+        else:
+            if x0 is None:
+                self.x0 = np.zeros((self.n, 1), dtype=self.dtype)
+            else:
+                self.x0 = np.reshape(x0, (-1, 1)).astype(self.dtype)
+            self.x_cov0 = linops.Identity(shape=self.n, dtype=self.dtype)
+        self.x_mean = self.x0
+        self.x_cov = self.x_cov0
+        self.trace_sol_cov = None
+        self.iter_ = 0
 
     def has_converged(self, iter, maxiter, resid=None, atol=None, rtol=None):
         """
@@ -48,9 +90,11 @@ class SolutionBasedSolver(ProbabilisticLinearSolver):
         resid : array-like
             Residual vector :math:`\\lVert r_i \\rVert = \\lVert Ax_i - b \\rVert` of the current iteration.
         atol : float
-            Absolute residual tolerance. Stops if :math:`\\lVert r_i \\rVert < \\text{atol}`.
+            Absolute residual tolerance. Stops if :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(
+            \\operatorname{Cov}(x))}) \\leq \\text{atol}`.
         rtol : float
-            Relative residual tolerance. Stops if :math:`\\lVert r_i \\rVert < \\text{rtol} \\lVert b \\rVert`.
+            Relative residual tolerance. Stops if :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(
+            \\operatorname{Cov}(x))}) \\leq \\text{rtol} \\lVert b \\rVert`.
 
         Returns
         -------
@@ -66,12 +110,159 @@ class SolutionBasedSolver(ProbabilisticLinearSolver):
             )
             return True, "maxiter"
         # residual below error tolerance
-        elif np.linalg.norm(resid) <= atol:
+        resid_norm = np.linalg.norm(resid)
+        b_norm = np.linalg.norm(self.b)
+        if resid_norm <= atol:
             return True, "resid_atol"
-        elif np.linalg.norm(resid) <= rtol * np.linalg.norm(self.b):
+        elif resid_norm <= rtol * b_norm:
             return True, "resid_rtol"
-        else:
-            return False, ""
+        # uncertainty-based
+        if self.trace_sol_cov is not None:
+            if np.sqrt(self.trace_sol_cov) <= atol:
+                return True, "tracecov_atol"
+            elif np.sqrt(self.trace_sol_cov) <= rtol * b_norm:
+                return True, "tracecov_rtol"
+        return False, ""
+
+    def _get_output_randvar(self):
+        """Return the output random variable x from its mean and covariance."""
+        return prob.RandomVariable(
+            shape=(self.n,),
+            dtype=self.dtype,
+            distribution=prob.Normal(mean=self.x_mean.ravel(), cov=self.x_cov),
+        )
+
+    def _get_lazy_output_randvar(self):
+        """
+        Return a proxy of the output random variable x in the current state of the solver.
+
+        The random variable is only constructed once the distribution of the proxy is accessed.
+        """
+        x_mean, x_cov = self.x_mean, self.x_cov
+        return prob.randomvariable._LazyRandomVariable(
+            shape=(self.n,),
+            dtype=self.dtype,
+            distribution_factory=lambda: prob.Normal(mean=x_mean.ravel(), cov=x_cov),
+        )
+
+    def solve(
+        self, callback=None, maxiter=None, atol=None, rtol=None, reorthogonalize=False
+    ):
+        """
+        Solve the linear system :math:`Ax=b`.
+
+        Parameters
+        ----------
+        callback : function, optional
+            User-supplied function called after each iteration of the linear solver. It is called as
+            ``callback(xk, sk, yk, alphak, resid, **kwargs)`` and can be used to return quantities from the
+            iteration. Note that depending on the function supplied, this can slow down the solver.
+        maxiter : int
+            Maximum number of iterations
+        atol : float
+            Absolute residual tolerance. Stops if :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(
+            \\operatorname{Cov}(x))}) \\leq \\text{atol}`.
+        rtol : float
+            Relative residual tolerance. Stops if :math:`\\min(\\lVert r_i \\rVert, \\sqrt{\\operatorname{tr}(
+            \\operatorname{Cov}(x))}) \\leq \\text{rtol} \\lVert b \\rVert`.
+        reorthogonalize : bool, default=False
+            Whether to reorthogonalize each search direction against all previous ones. This counteracts the loss of
+            conjugacy in finite precision at the cost of :math:`\\mathcal{O}(nk)` operations in iteration :math:`k`.
+
+        Returns
+        -------
+        x : RandomVariable, shape=(n,)
+            Approximate solution :math:`x` to the linear system.
+        info : dict
+            Information on convergence of the solver.
+        """
+        # Default arguments
+        if maxiter is None:
+            maxiter = self.n * 10
+        if atol is None:
+            atol = 10 ** -6
+        if rtol is None:
+            rtol = 10 ** -6
+
+        # Posterior covariance as low-rank downdate of the prior covariance with preallocated storage
+        _capacity = _initial_capacity(min(maxiter, self.n))
+        self.x_mean = self.x0
+        self.x_cov = linops.LowRankUpdate(A=self.x_cov0, maxrank=_capacity)
+        self.workspace = _KrylovWorkspace(
+            n=self.n, capacity=_capacity, dtype=self.dtype
+        )
+        self.trace_sol_cov = self.x_cov0.trace()
+        self.iter_ = 0
+
+        # Initial residual and search direction
+        resid = self.A @ self.x_mean - self.b
+        search_dir = -resid
+        resid_sqnorm = _inner_product(resid, resid)
+
+        # Iteration with stopping criteria
+        while True:
+            # Check convergence
+            _has_converged, _conv_crit = self.has_converged(
+                iter=self.iter_, maxiter=maxiter, resid=resid, atol=atol, rtol=rtol
+            )
+            if _has_converged:
+                break
+
+            # Reorthogonalize search direction with respect to the inner product induced by A Sigma_0 A
+            if reorthogonalize and self.iter_ > 0:
+                S = self.workspace.search_dirs
+                Y = self.workspace.observations
+                search_dir = search_dir - S @ (
+                    (Y.T @ search_dir).ravel() / self.workspace.inner_products
+                ).reshape(-1, 1)
+
+            # Perform action and observe
+            cov_dir = self.x_cov0 @ (self.A @ search_dir)
+            obs = self.A @ cov_dir
+            sy = _inner_product(search_dir, obs)
+            self.workspace.append(s=search_dir, y=obs, sy=sy)
+
+            # Step and residual update
+            step_size = -_inner_product(search_dir, resid) / sy
+            self.x_mean = self.x_mean + step_size * cov_dir
+            resid = resid + step_size * obs
+
+            # Rank 1 covariance downdate (-= Sigma_0 A s s' A Sigma_0 / s'A Sigma_0 A s)
+            self.x_cov = self.x_cov.update(U=-cov_dir, V=cov_dir / sy)
+            self.trace_sol_cov = (
+                self.trace_sol_cov - _inner_product(cov_dir, cov_dir) / sy
+            )
+
+            # Callback function used to extract quantities from iteration. The output random variable is only
+            # constructed if accessed by the callback.
+            if callback is not None:
+                callback(
+                    xk=self._get_lazy_output_randvar(),
+                    sk=search_dir,
+                    yk=obs,
+                    alphak=step_size,
+                    resid=resid,
+                )
+
+            # Next search direction
+            resid_sqnorm_prev = resid_sqnorm
+            resid_sqnorm = _inner_product(resid, resid)
+            search_dir = -resid + resid_sqnorm / resid_sqnorm_prev * search_dir
+
+            # Iteration increment
+            self.iter_ += 1
+
+        # Create output random variable
+        x = self._get_output_randvar()
+
+        # Log information on solution
+        info = {
+            "iter": self.iter_,
+            "maxiter": maxiter,
+            "resid_l2norm": np.linalg.norm(resid, ord=2),
+            "trace_sol_cov": self.trace_sol_cov,
+            "conv_crit": _conv_crit,
+            "rel_cond": None,
+        }
 
-    def solve(self, callback=None, maxiter=None, atol=None, rtol=None):
-        raise NotImplementedError
+        return x, info
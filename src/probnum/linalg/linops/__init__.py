@@ -7,6 +7,13 @@ a matrix-vector product instead of representing the full linear operator as a ma
 
 from probnum.linalg.linops.linearoperators import *
 from probnum.linalg.linops.kronecker import *
+from probnum.linalg.linops.lowrank import *
+from probnum.linalg.linops.batched import *
+from probnum.linalg.linops.block import *
+from probnum.linalg.linops.memmap import *
+from probnum.linalg.linops.estimators import *
+from probnum.linalg.linops.simplification import *
+from probnum.linalg.linops.parallel import *
 
 # Public classes and functions. Order is reflected in documentation.
 __all__ = [
@@ -14,12 +21,28 @@ __all__ = [
     "Identity",
     "ScalarMult",
     "MatrixMult",
+    "SparseMatrixMult",
+    "MemoryMappedMatrixMult",
     "Kronecker",
     "SymmetricKronecker",
+    "MultiKronecker",
+    "LowRankUpdate",
+    "BlockDiagonal",
+    "Block",
+    "BatchedLinearOperator",
+    "BatchedIdentity",
+    "BatchedScalarMult",
+    "BatchedMatrixMult",
+    "BatchedKronecker",
     "Vec",
     "Svec",
     "Symmetrize",
     "aslinop",
+    "simplify",
+    "parallel_execution",
+    "trace_hutchinson",
+    "trace_hutchpp",
+    "logdet_slq",
 ]
 
 # Set correct module paths. Corrects links and module paths in documentation.
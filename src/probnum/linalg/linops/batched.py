@@ -0,0 +1,446 @@
+"""
+Batches of linear operators.
+
+This module implements stacks of linear operators with identical shape, which are applied simultaneously to stacks of
+vectors or matrices. Applications are dispatched to stacked (i.e. broadcasted) matrix products via :func:`np.matmul`,
+such that a batch of small linear systems does not require a loop in Python.
+"""
+import numpy as np
+
+from probnum.linalg.linops.linearoperators import (
+    ScalarMult,
+    Identity,
+    MatrixMult,
+)
+from probnum.linalg.linops.kronecker import Kronecker
+
+
+class BatchedLinearOperator:
+    """
+    Batch of finite dimensional linear operators.
+
+    Represents a stack of linear operators :math:`A_i \\in \\mathbb{R}^{m \\times n}` indexed by a leading batch shape.
+    Analogous to stacked arrays in :func:`np.matmul`, the shape of a batched linear operator is
+    ``batch_shape + (m, n)`` and its application to stacked vectors or matrices broadcasts over the batch dimensions.
+
+    A subclass must implement the method ``_matmat``, which applies the linear operators to an array of shape
+    ``(..., n, k)``. Optionally, structured linear operators override further methods such as :meth:`inv` and
+    :meth:`logabsdet`.
+
+    Parameters
+    ----------
+    batch_shape : tuple
+        Shape of the batch of linear operators.
+    shape : tuple
+        Shape (m, n) of each linear operator in the batch.
+    dtype : dtype
+        Data type of the operators.
+
+    See Also
+    --------
+    BatchedMatrixMult : Batch of linear operators defined via matrices.
+    """
+
+    def __init__(self, batch_shape, shape, dtype):
+        if len(shape) != 2:
+            raise ValueError(
+                "The shape of each linear operator must be two-dimensional."
+            )
+        self.batch_shape = tuple(batch_shape)
+        self.shape = self.batch_shape + tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the batched linear operator."""
+        return len(self.shape)
+
+    def __repr__(self):
+        return "<{} {} with dtype={}>".format(
+            "x".join([str(dim) for dim in self.shape]),
+            self.__class__.__name__,
+            str(self.dtype),
+        )
+
+    def matvec(self, x):
+        """
+        Batched matrix-vector multiplication.
+
+        Parameters
+        ----------
+        x : array-like, shape=(..., n)
+            Stack of vectors. Leading dimensions are broadcast against the batch shape.
+
+        Returns
+        -------
+        y : np.ndarray, shape=(..., m)
+            Stack of matrix-vector products :math:`A_i x_i`.
+        """
+        x = np.asarray(x)
+        if x.ndim < 1 or x.shape[-1] != self.shape[-1]:
+            raise ValueError("Dimension mismatch.")
+        return self._matmat(x[..., None])[..., 0]
+
+    def matmat(self, X):
+        """
+        Batched matrix-matrix multiplication.
+
+        Parameters
+        ----------
+        X : array-like, shape=(..., n, k)
+            Stack of matrices. Leading dimensions are broadcast against the batch shape.
+
+        Returns
+        -------
+        Y : np.ndarray, shape=(..., m, k)
+            Stack of matrix-matrix products :math:`A_i X_i`.
+        """
+        X = np.asarray(X)
+        if X.ndim < 2 or X.shape[-2] != self.shape[-1]:
+            raise ValueError("Dimension mismatch.")
+        return self._matmat(X)
+
+    def _matmat(self, X):
+        raise NotImplementedError
+
+    def __matmul__(self, x):
+        """Batched application following the broadcasting rules of :func:`np.matmul`."""
+        if np.ndim(x) == 1:
+            return self.matvec(x)
+        return self.matmat(x)
+
+    def transpose(self):
+        """Transpose each linear operator in the batch."""
+        return self._transpose()
+
+    T = property(transpose)
+
+    def _transpose(self):
+        raise NotImplementedError
+
+    def todense(self):
+        """
+        Dense representation of the batched linear operator.
+
+        Returns
+        -------
+        matrices : np.ndarray, shape=batch_shape + (m, n)
+            Stack of matrix representations.
+        """
+        return self._matmat(np.eye(self.shape[-1], dtype=self.dtype))
+
+    def inv(self):
+        """Batch of inverses of the linear operators."""
+        raise NotImplementedError
+
+    def solve(self, B):
+        """
+        Solve the batch of linear systems :math:`A_i X_i = B_i`.
+
+        Parameters
+        ----------
+        B : array-like, shape=(..., n) or (..., n, k)
+            Stack of right hand sides. As in :func:`np.linalg.solve`, ``B`` is interpreted as a stack of vectors if it
+            is one-dimensional or has one dimension less than the batched linear operator.
+
+        Returns
+        -------
+        X : np.ndarray
+            Stack of solutions.
+        """
+        B = np.asarray(B)
+        if self._is_vector_stack(B):
+            return self.inv().matvec(B)
+        return self.inv().matmat(B)
+
+    def _is_vector_stack(self, B):
+        """Check whether an array represents a stack of vectors or of matrices."""
+        return B.ndim == 1 or B.ndim == self.ndim - 1
+
+    def det(self):
+        """Determinants of the linear operators in the batch."""
+        sign, logabsdet = self.slogdet()
+        return sign * np.exp(logabsdet)
+
+    def logabsdet(self):
+        """Log absolute determinants of the linear operators in the batch."""
+        _, logabsdet = self.slogdet()
+        return logabsdet
+
+    def slogdet(self):
+        """Signs and log absolute determinants of the linear operators in the batch."""
+        return np.linalg.slogdet(self.todense())
+
+    def trace(self):
+        """
+        Traces of the linear operators in the batch.
+
+        Raises
+        ------
+        ValueError : If :meth:`trace` is called on non-square linear operators.
+        """
+        if self.shape[-2] != self.shape[-1]:
+            raise ValueError("The trace is only defined for square linear operators.")
+        return np.sum(self.diagonal(), axis=-1)
+
+    def diagonal(self):
+        """Diagonals of the linear operators in the batch."""
+        return np.diagonal(self.todense(), axis1=-2, axis2=-1)
+
+
+class BatchedScalarMult(BatchedLinearOperator):
+    """
+    Batch of linear operators representing scalar multiplication.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape (m, n) of each linear operator in the batch.
+    scalar : array-like
+        Scalars to multiply by. The shape of the array determines the batch shape.
+    """
+
+    def __init__(self, shape, scalar):
+        self.scalar = np.asarray(scalar, dtype=float)
+        super().__init__(batch_shape=self.scalar.shape, shape=shape, dtype=float)
+
+    def __getitem__(self, idx):
+        scalar = self.scalar[idx]
+        if np.ndim(scalar) == 0:
+            return ScalarMult(shape=self.shape[-2:], scalar=scalar)
+        return BatchedScalarMult(shape=self.shape[-2:], scalar=scalar)
+
+    def _matmat(self, X):
+        return self.scalar[..., None, None] * X
+
+    def _transpose(self):
+        return BatchedScalarMult(shape=self.shape[:-3:-1], scalar=self.scalar)
+
+    def todense(self):
+        return self.scalar[..., None, None] * np.eye(*self.shape[-2:])
+
+    def inv(self):
+        return BatchedScalarMult(shape=self.shape[-2:], scalar=1 / self.scalar)
+
+    # Properties
+    def slogdet(self):
+        n = self.shape[-1]
+        return np.sign(self.scalar) ** n, n * np.log(np.abs(self.scalar))
+
+    def trace(self):
+        return self.scalar * self.shape[-1]
+
+    def diagonal(self):
+        return self.scalar[..., None] * np.ones(min(self.shape[-2:]))
+
+
+class BatchedIdentity(BatchedScalarMult):
+    """
+    Batch of identity operators.
+
+    Parameters
+    ----------
+    shape : int or tuple
+        Shape of each identity operator in the batch.
+    batch_shape : tuple
+        Shape of the batch.
+    """
+
+    def __init__(self, shape, batch_shape=()):
+        if np.isscalar(shape):
+            shape = (shape, shape)
+        elif shape[0] != shape[1]:
+            raise ValueError("The identity operator must be square.")
+        super().__init__(shape=shape, scalar=np.ones(batch_shape))
+
+    def __getitem__(self, idx):
+        batch_shape = np.shape(self.scalar[idx])
+        if batch_shape == ():
+            return Identity(shape=self.shape[-2:])
+        return BatchedIdentity(shape=self.shape[-2:], batch_shape=batch_shape)
+
+    def _matmat(self, X):
+        return X + np.zeros(self.batch_shape + (1, 1), dtype=self.dtype)
+
+    def _transpose(self):
+        return self
+
+    def inv(self):
+        return self
+
+    # Properties
+    def slogdet(self):
+        return np.ones(self.batch_shape), np.zeros(self.batch_shape)
+
+
+class BatchedMatrixMult(BatchedLinearOperator):
+    """
+    Batch of linear operators defined via matrices.
+
+    Parameters
+    ----------
+    A : array-like, shape=batch_shape + (m, n)
+        Stack of matrices.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import BatchedMatrixMult
+    >>> A = BatchedMatrixMult(np.array([[[2., 0.], [0., 1.]], [[1., 1.], [0., 1.]]]))
+    >>> A
+    <2x2x2 BatchedMatrixMult with dtype=float64>
+    >>> A @ np.ones(2)
+    array([[2., 1.],
+           [2., 1.]])
+    >>> A.solve(np.array([[2., 1.], [2., 1.]]))
+    array([[1., 1.],
+           [1., 1.]])
+    """
+
+    def __init__(self, A):
+        self.A = np.asarray(A)
+        if self.A.ndim < 2:
+            raise ValueError("A batch of matrices must be at least two-dimensional.")
+        super().__init__(
+            batch_shape=self.A.shape[:-2], shape=self.A.shape[-2:], dtype=self.A.dtype
+        )
+
+    def __getitem__(self, idx):
+        A = self.A[idx]
+        if A.ndim == 2:
+            return MatrixMult(A=A)
+        return BatchedMatrixMult(A=A)
+
+    def _matmat(self, X):
+        return np.matmul(self.A, X)
+
+    def _transpose(self):
+        return BatchedMatrixMult(A=np.swapaxes(self.A, -2, -1))
+
+    def todense(self):
+        return self.A
+
+    def inv(self):
+        return BatchedMatrixMult(A=np.linalg.inv(self.A))
+
+    def solve(self, B):
+        B = np.asarray(B)
+        if self._is_vector_stack(B):
+            return np.linalg.solve(self.A, B[..., None])[..., 0]
+        return np.linalg.solve(self.A, B)
+
+    # Properties
+    def slogdet(self):
+        return np.linalg.slogdet(self.A)
+
+    def diagonal(self):
+        return np.diagonal(self.A, axis1=-2, axis2=-1)
+
+
+def _index_broadcast(A, batch_shape, idx):
+    """
+    Index a batched linear operator as if it was broadcast to the given batch shape.
+
+    Unbatched operators are not indexed and only unpacked if the indexed batch is a single linear operator.
+    """
+    if A.batch_shape == batch_shape:
+        return A[idx]
+    if A.batch_shape == ():
+        return A[()] if np.broadcast_to(0, batch_shape)[idx].shape == () else A
+    # Gather the batch entries of A corresponding to the indexed entries of the broadcast batch
+    flat_idx = np.broadcast_to(
+        np.reshape(np.arange(np.prod(A.batch_shape, dtype=int)), A.batch_shape),
+        batch_shape,
+    )[idx]
+    return A[np.unravel_index(flat_idx, A.batch_shape)]
+
+
+def _as_batched_linop(A):
+    """Represent a stack of matrices as a batched linear operator."""
+    if isinstance(A, BatchedLinearOperator):
+        return A
+    return BatchedMatrixMult(A=A)
+
+
+class BatchedKronecker(BatchedLinearOperator):
+    """
+    Batch of Kronecker products.
+
+    Represents the stack of Kronecker products :math:`A_i \\otimes B_i`. Each application requires a single batched
+    product with the factors :math:`A` and :math:`B`.
+
+    Parameters
+    ----------
+    A : BatchedLinearOperator or array-like, shape=batch_shape + (m1, n1)
+        First factors of the Kronecker products.
+    B : BatchedLinearOperator or array-like, shape=batch_shape + (m2, n2)
+        Second factors of the Kronecker products.
+    """
+
+    def __init__(self, A, B):
+        self.A = _as_batched_linop(A)
+        self.B = _as_batched_linop(B)
+        batch_shape = np.broadcast(
+            np.empty(self.A.batch_shape), np.empty(self.B.batch_shape)
+        ).shape
+        super().__init__(
+            batch_shape=batch_shape,
+            shape=(
+                self.A.shape[-2] * self.B.shape[-2],
+                self.A.shape[-1] * self.B.shape[-1],
+            ),
+            dtype=np.result_type(self.A.dtype, self.B.dtype),
+        )
+
+    def __getitem__(self, idx):
+        batch_shape = np.broadcast_to(0, self.batch_shape)[idx].shape
+        A = _index_broadcast(self.A, self.batch_shape, idx)
+        B = _index_broadcast(self.B, self.batch_shape, idx)
+        if batch_shape != ():
+            return BatchedKronecker(A=A, B=B)
+        return Kronecker(A=A, B=B)
+
+    def _matmat(self, X):
+        (m1, n1), (m2, n2) = self.A.shape[-2:], self.B.shape[-2:]
+        batch_shape = X.shape[:-2]
+        k = X.shape[-1]
+
+        # Apply B to all blocks of X simultaneously
+        X = np.reshape(X, batch_shape + (n1, n2, k))
+        X = np.reshape(np.moveaxis(X, -3, -2), batch_shape + (n2, n1 * k))
+        Y = self.B.matmat(X)
+        Y = np.moveaxis(np.reshape(Y, Y.shape[:-2] + (m2, n1, k)), -3, -2)
+
+        # Apply A
+        Y = self.A.matmat(np.reshape(Y, Y.shape[:-3] + (n1, m2 * k)))
+        return np.reshape(Y, Y.shape[:-2] + (m1 * m2, k))
+
+    def _transpose(self):
+        return BatchedKronecker(A=self.A.T, B=self.B.T)
+
+    def todense(self):
+        A, B = self.A.todense(), self.B.todense()
+        dense = np.einsum("...ij,...kl->...ikjl", A, B)
+        return np.reshape(dense, dense.shape[:-4] + self.shape[-2:])
+
+    def inv(self):
+        return BatchedKronecker(A=self.A.inv(), B=self.B.inv())
+
+    # Properties
+    def slogdet(self):
+        n1, n2 = self.A.shape[-1], self.B.shape[-1]
+        sign_A, logabsdet_A = self.A.slogdet()
+        sign_B, logabsdet_B = self.B.slogdet()
+        return (
+            sign_A ** n2 * sign_B ** n1,
+            n2 * logabsdet_A + n1 * logabsdet_B,
+        )
+
+    def trace(self):
+        if self.shape[-2] != self.shape[-1]:
+            raise ValueError("The trace is only defined for square linear operators.")
+        return self.A.trace() * self.B.trace()
+
+    def diagonal(self):
+        diag = self.A.diagonal()[..., :, None] * self.B.diagonal()[..., None, :]
+        return np.reshape(diag, diag.shape[:-2] + (-1,))
@@ -0,0 +1,357 @@
+"""
+Block-structured linear operators.
+
+This module implements block-diagonal linear operators and linear operators consisting of a :math:`2 \\times 2` block
+structure. Functions of these operators, such as their inverse, determinant or Cholesky factor, are computed from the
+blocks without forming a dense matrix representation.
+"""
+import numpy as np
+import scipy.linalg
+
+from probnum.linalg.linops.linearoperators import LinearOperator, MatrixMult, aslinop
+from probnum.linalg.linops.batched import BatchedMatrixMult
+from probnum.linalg.linops.parallel import _map_partitions
+
+
+def _cholesky_factor(A):
+    """Lower triangular Cholesky factor of a symmetric positive definite linear operator."""
+    if isinstance(A, (BlockDiagonal, Block)):
+        return A.cholesky()
+    return MatrixMult(A=np.linalg.cholesky(A.todense()))
+
+
+def _as_dense_array(A):
+    """Return the matrix of a dense array or linear operator defined via a dense matrix, otherwise ``None``."""
+    if isinstance(A, np.ndarray) and A.ndim == 2:
+        return A
+    elif isinstance(A, MatrixMult) and isinstance(A.A, np.ndarray):
+        return A.A
+    return None
+
+
+class BlockDiagonal(LinearOperator):
+    """
+    Block-diagonal linear operator.
+
+    Represents the linear operator :math:`\\operatorname{diag}(A_1, \\dots, A_k)` with (not necessarily square)
+    diagonal blocks :math:`A_i`. Dense blocks of identical shape are stored in a single stacked array, such that
+    products are computed via a single batched matrix product. Otherwise each block is applied to the corresponding
+    rows of the input, possibly in parallel (see :func:`parallel_execution`).
+
+    Parameters
+    ----------
+    blocks : array-like or LinearOperator
+        Diagonal blocks.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import BlockDiagonal
+    >>> A = BlockDiagonal(np.array([[2., 0.], [1., 1.]]), np.array([[3., 0.], [0., 4.]]))
+    >>> A @ np.ones(4)
+    array([2., 2., 3., 4.])
+    >>> np.isclose(A.logabsdet(), np.log(24.))
+    True
+    """
+
+    def __init__(self, *blocks):
+        if len(blocks) == 0:
+            raise ValueError(
+                "A block-diagonal linear operator requires at least one block."
+            )
+
+        # Stack dense blocks of identical shape
+        dense_blocks = [_as_dense_array(block) for block in blocks]
+        if all(block is not None for block in dense_blocks) and all(
+            block.shape == dense_blocks[0].shape for block in dense_blocks
+        ):
+            self._stacked = BatchedMatrixMult(A=np.stack(dense_blocks))
+            self.blocks = [MatrixMult(A=block) for block in self._stacked.A]
+        else:
+            self._stacked = None
+            self.blocks = [aslinop(block) for block in blocks]
+
+        self._row_offsets = np.cumsum([0] + [block.shape[0] for block in self.blocks])
+        self._col_offsets = np.cumsum([0] + [block.shape[1] for block in self.blocks])
+        super().__init__(
+            dtype=np.result_type(*[block.dtype for block in self.blocks]),
+            shape=(self._row_offsets[-1], self._col_offsets[-1]),
+        )
+
+    def _matmat(self, X):
+        X = np.asarray(X)
+        if self._stacked is not None:
+            nblocks, m, n = self._stacked.shape
+            Y = self._stacked.matmat(X.reshape(nblocks, n, X.shape[1]))
+            return Y.reshape(nblocks * m, X.shape[1])
+
+        Y = np.empty(
+            (self.shape[0], X.shape[1]), dtype=np.result_type(self.dtype, X.dtype)
+        )
+
+        def _apply_block(i):
+            rows = slice(self._row_offsets[i], self._row_offsets[i + 1])
+            cols = slice(self._col_offsets[i], self._col_offsets[i + 1])
+            Y[rows] = self.blocks[i].matmat(X[cols])
+
+        _map_partitions(
+            _apply_block, list(range(len(self.blocks))), num_threads=self.num_threads
+        )
+        return Y
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1)))
+
+    def _transpose(self):
+        if self._stacked is not None:
+            return BlockDiagonal(*np.swapaxes(self._stacked.A, -2, -1))
+        return BlockDiagonal(*[block.T for block in self.blocks])
+
+    def _adjoint(self):
+        if self._stacked is not None:
+            return BlockDiagonal(*np.swapaxes(self._stacked.A, -2, -1).conj())
+        return BlockDiagonal(*[block.H for block in self.blocks])
+
+    def todense(self):
+        return scipy.linalg.block_diag(*[block.todense() for block in self.blocks])
+
+    def inv(self):
+        if self._stacked is not None:
+            return BlockDiagonal(*self._stacked.inv().A)
+        return BlockDiagonal(*[block.inv() for block in self.blocks])
+
+    def solve(self, B):
+        B = np.asarray(B)
+        if self._stacked is not None:
+            nblocks, _, n = self._stacked.shape
+            return self._stacked.solve(B.reshape((nblocks, n) + B.shape[1:])).reshape(
+                B.shape
+            )
+        return np.concatenate(
+            [
+                block.solve(B[self._row_offsets[i] : self._row_offsets[i + 1]])
+                for i, block in enumerate(self.blocks)
+            ]
+        )
+
+    def cholesky(self):
+        """
+        Cholesky factor of a symmetric positive definite block-diagonal linear operator.
+
+        Returns
+        -------
+        L : BlockDiagonal
+            Lower triangular block-diagonal Cholesky factor :math:`L` such that :math:`A = LL^\\top`.
+        """
+        if self._stacked is not None:
+            return BlockDiagonal(*np.linalg.cholesky(self._stacked.A))
+        return BlockDiagonal(*[_cholesky_factor(block) for block in self.blocks])
+
+    # Properties
+    def rank(self):
+        return np.sum([block.rank() for block in self.blocks])
+
+    def eigvals(self):
+        return np.concatenate([block.eigvals() for block in self.blocks])
+
+    def det(self):
+        if self._stacked is not None:
+            return np.prod(self._stacked.det())
+        return np.prod([block.det() for block in self.blocks])
+
+    def logabsdet(self):
+        if self._stacked is not None:
+            return np.sum(self._stacked.logabsdet())
+        return np.sum([block.logabsdet() for block in self.blocks])
+
+    def trace(self):
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("The trace is only defined for square linear operators.")
+        return np.sum(self.diagonal())
+
+    def diagonal(self):
+        if self.shape[0] != self.shape[1] or not np.all(
+            self._row_offsets == self._col_offsets
+        ):
+            return super().diagonal()
+        if self._stacked is not None:
+            return self._stacked.diagonal().ravel()
+        return np.concatenate([block.diagonal() for block in self.blocks])
+
+
+class Block(LinearOperator):
+    """
+    Linear operator with :math:`2 \\times 2` block structure.
+
+    Represents the linear operator
+
+    .. math::
+        \\begin{bmatrix}
+            A & B \\\\
+            C & D
+        \\end{bmatrix}.
+
+    Products are computed block-wise, possibly in parallel (see :func:`parallel_execution`). The inverse, determinant
+    and Cholesky factor are computed via the Schur complement :math:`S = D - CA^{-1}B` of :math:`A`, which requires
+    :math:`A` to be invertible.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(m_1, n_1)
+        Upper left block.
+    B : array-like or LinearOperator, shape=(m_1, n_2)
+        Upper right block.
+    C : array-like or LinearOperator, shape=(m_2, n_1)
+        Lower left block.
+    D : array-like or LinearOperator, shape=(m_2, n_2)
+        Lower right block.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import Block
+    >>> M = Block(A=np.eye(2), B=np.ones((2, 1)), C=np.ones((1, 2)), D=np.array([[3.]]))
+    >>> M.todense()
+    array([[1., 0., 1.],
+           [0., 1., 1.],
+           [1., 1., 3.]])
+    >>> np.round(M.det(), 6)
+    1.0
+    """
+
+    def __init__(self, A, B, C, D):
+        self.A = aslinop(A)
+        self.B = aslinop(B)
+        self.C = aslinop(C)
+        self.D = aslinop(D)
+        if (
+            self.A.shape[0] != self.B.shape[0]
+            or self.C.shape[0] != self.D.shape[0]
+            or self.A.shape[1] != self.C.shape[1]
+            or self.B.shape[1] != self.D.shape[1]
+        ):
+            raise ValueError("Dimension mismatch between the blocks.")
+        super().__init__(
+            dtype=np.result_type(
+                self.A.dtype, self.B.dtype, self.C.dtype, self.D.dtype
+            ),
+            shape=(
+                self.A.shape[0] + self.C.shape[0],
+                self.A.shape[1] + self.B.shape[1],
+            ),
+        )
+
+    def _matmat(self, X):
+        X = np.asarray(X)
+        X1, X2 = X[: self.A.shape[1]], X[self.A.shape[1] :]
+        Y1, Y2 = _map_partitions(
+            lambda blocks: blocks[0].matmat(X1) + blocks[1].matmat(X2),
+            [(self.A, self.B), (self.C, self.D)],
+            num_threads=self.num_threads,
+        )
+        return np.vstack((Y1, Y2))
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1)))
+
+    def _transpose(self):
+        return Block(A=self.A.T, B=self.C.T, C=self.B.T, D=self.D.T)
+
+    def _adjoint(self):
+        return Block(A=self.A.H, B=self.C.H, C=self.B.H, D=self.D.H)
+
+    def todense(self):
+        return np.block(
+            [
+                [self.A.todense(), self.B.todense()],
+                [self.C.todense(), self.D.todense()],
+            ]
+        )
+
+    def schur_complement(self):
+        """
+        Schur complement :math:`S = D - CA^{-1}B` of the upper left block.
+
+        Returns
+        -------
+        S : MatrixMult
+            Schur complement.
+        """
+        AinvB = self.A.solve(self.B.todense())
+        return MatrixMult(A=np.asarray(self.D.todense() - self.C @ AinvB))
+
+    def inv(self):
+        """
+        Inverse via the Schur complement.
+
+        .. math::
+            \\begin{bmatrix}
+                A & B \\\\
+                C & D
+            \\end{bmatrix}^{-1}
+            =
+            \\begin{bmatrix}
+                A^{-1} + A^{-1}BS^{-1}CA^{-1} & -A^{-1}BS^{-1} \\\\
+                -S^{-1}CA^{-1} & S^{-1}
+            \\end{bmatrix}
+        """
+        Ainv = self.A.inv()
+        Sinv = self.schur_complement().inv()
+        AinvBSinv = Ainv @ self.B @ Sinv
+        SinvCAinv = Sinv @ self.C @ Ainv
+        return Block(
+            A=Ainv + AinvBSinv @ self.C @ Ainv, B=-AinvBSinv, C=-SinvCAinv, D=Sinv
+        )
+
+    def cholesky(self):
+        """
+        Cholesky factor of a symmetric positive definite block linear operator.
+
+        Computes the lower triangular factor
+
+        .. math::
+            L = \\begin{bmatrix}
+                L_A & 0 \\\\
+                C L_A^{-\\top} & L_S
+            \\end{bmatrix},
+
+        where :math:`L_A` and :math:`L_S` are the Cholesky factors of :math:`A` and the Schur complement :math:`S`.
+
+        Returns
+        -------
+        L : Block
+            Lower triangular block Cholesky factor :math:`L` such that :math:`M = LL^\\top`.
+        """
+        L_A = _cholesky_factor(self.A)
+        L_A_dense = np.asarray(L_A.todense())
+        CL_Ainv_T = scipy.linalg.solve_triangular(
+            L_A_dense, np.asarray(self.C.todense()).T, lower=True
+        ).T
+        L_S = _cholesky_factor(
+            MatrixMult(A=np.asarray(self.D.todense()) - CL_Ainv_T @ CL_Ainv_T.T)
+        )
+        return Block(
+            A=L_A,
+            B=np.zeros((self.A.shape[0], self.D.shape[1]), dtype=L_A_dense.dtype),
+            C=CL_Ainv_T,
+            D=L_S,
+        )
+
+    # Properties
+    def det(self):
+        return self.A.det() * self.schur_complement().det()
+
+    def logabsdet(self):
+        return self.A.logabsdet() + self.schur_complement().logabsdet()
+
+    def trace(self):
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("The trace is only defined for square linear operators.")
+        if self.A.shape[0] != self.A.shape[1]:
+            return np.sum(self.diagonal())
+        return self.A.trace() + self.D.trace()
+
+    def diagonal(self):
+        if self.A.shape[0] != self.A.shape[1]:
+            return super().diagonal()
+        return np.concatenate((self.A.diagonal(), self.D.diagonal()))
@@ -0,0 +1,203 @@
+"""
+Stochastic estimators for functions of linear operators.
+
+This module implements randomized estimators of the trace and the log-determinant of linear operators, which only
+require matrix-vector products. All probe vectors of an estimator are applied to the linear operator in a single
+matrix-matrix product.
+"""
+import numpy as np
+import scipy._lib._util
+import scipy.linalg
+
+from probnum.linalg.linops.linearoperators import aslinop
+
+
+def _rademacher_probes(shape, random_state):
+    """Draw a matrix of Rademacher random variables."""
+    return 2.0 * random_state.randint(low=0, high=2, size=shape) - 1.0
+
+
+def _check_estimator_input(A, nprobes, minprobes=1):
+    """Check the input arguments of a stochastic estimator."""
+    A = aslinop(A)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Stochastic estimators require a square linear operator.")
+    if not isinstance(nprobes, (int, np.integer)) or nprobes < minprobes:
+        raise ValueError(
+            "The number of probe vectors must be an integer of at least {}.".format(
+                minprobes
+            )
+        )
+    return A
+
+
+def trace_hutchinson(A, nprobes=100, random_state=None):
+    """
+    Hutchinson's stochastic trace estimator.
+
+    Estimates the trace of a square linear operator via :math:`\\operatorname{tr}(A) \\approx \\frac{1}{m}
+    \\sum_{i=1}^m z_i^\\top A z_i`, where the :math:`z_i` are independent Rademacher random vectors [1]_.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(n,n)
+        Square linear operator.
+    nprobes : int
+        Number of probe vectors :math:`m`, i.e. matrix-vector products with ``A``.
+    random_state : None or int or :class:`~numpy.random.RandomState` instance, optional
+        Random state used to draw the probe vectors.
+
+    Returns
+    -------
+    trace : float
+        Estimate of the trace of ``A``.
+
+    References
+    ----------
+    .. [1] Hutchinson, M. F., A stochastic estimator of the trace of the influence matrix for Laplacian smoothing
+           splines, *Communications in Statistics - Simulation and Computation*, 1989, 18, 1059-1076
+
+    See Also
+    --------
+    trace_hutchpp : Variance-reduced stochastic trace estimator.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import trace_hutchinson
+    >>> A = np.diag(np.arange(1., 11.))
+    >>> np.round(trace_hutchinson(A, nprobes=10, random_state=42), 6)
+    55.0
+    """
+    A = _check_estimator_input(A, nprobes)
+    random_state = scipy._lib._util.check_random_state(random_state)
+
+    Z = _rademacher_probes(shape=(A.shape[0], nprobes), random_state=random_state)
+    return np.einsum("ij,ij->", Z, A @ Z) / nprobes
+
+
+def trace_hutchpp(A, nprobes=102, random_state=None):
+    """
+    Hutch++ stochastic trace estimator.
+
+    Variance-reduced version of Hutchinson's estimator [1]_. One third of the matrix-vector products is used to
+    compute the trace of a low-rank approximation of ``A`` exactly; Hutchinson's estimator is applied to the
+    remainder. For linear operators with decaying spectrum this considerably reduces the number of necessary probe
+    vectors.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(n,n)
+        Square linear operator.
+    nprobes : int
+        Total number of matrix-vector products with ``A``. Must be at least 3.
+    random_state : None or int or :class:`~numpy.random.RandomState` instance, optional
+        Random state used to draw the probe vectors.
+
+    Returns
+    -------
+    trace : float
+        Estimate of the trace of ``A``.
+
+    References
+    ----------
+    .. [1] Meyer, R. A. et al., Hutch++: Optimal Stochastic Trace Estimation, *Symposium on Simplicity in
+           Algorithms*, 2021
+
+    See Also
+    --------
+    trace_hutchinson : Hutchinson's stochastic trace estimator.
+    """
+    A = _check_estimator_input(A, nprobes, minprobes=3)
+    random_state = scipy._lib._util.check_random_state(random_state)
+    n = A.shape[0]
+    nsketch = nprobes // 3
+
+    # Orthonormal basis of the range of a low-rank sketch of A
+    S = _rademacher_probes(shape=(n, nsketch), random_state=random_state)
+    Q, _ = np.linalg.qr(A @ S)
+
+    # Hutchinson's estimator on the orthogonal complement of the sketch
+    G = _rademacher_probes(shape=(n, nprobes - 2 * nsketch), random_state=random_state)
+    G = G - Q @ (Q.T @ G)
+
+    # Apply the basis and the projected probes in a single matrix-matrix product
+    AQG = A @ np.hstack((Q, G))
+    AQ, AG = AQG[:, : Q.shape[1]], AQG[:, Q.shape[1] :]
+    return np.einsum("ij,ij->", Q, AQ) + np.einsum("ij,ij->", G, AG) / G.shape[1]
+
+
+def logdet_slq(A, nprobes=30, nsteps=20, random_state=None):
+    """
+    Stochastic Lanczos quadrature estimate of the log-determinant.
+
+    Estimates the log-determinant of a symmetric positive definite linear operator via
+    :math:`\\log \\det(A) = \\operatorname{tr}(\\log(A)) \\approx \\frac{n}{m} \\sum_{i=1}^m \\sum_{k=1}^{l}
+    \\tau_{ik}^2 \\log(\\theta_{ik})`, where :math:`\\theta_{ik}` and :math:`\\tau_{ik}` are the eigenvalues and
+    first eigenvector components of the tridiagonal matrix computed by :math:`l` steps of the Lanczos process started at
+    the Rademacher probe vector :math:`z_i` [1]_. The Lanczos processes for all probe vectors are run simultaneously,
+    such that each step requires a single matrix-matrix product.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(n,n)
+        Symmetric positive definite linear operator.
+    nprobes : int
+        Number of probe vectors :math:`m`.
+    nsteps : int
+        Number of Lanczos steps :math:`l` per probe vector.
+    random_state : None or int or :class:`~numpy.random.RandomState` instance, optional
+        Random state used to draw the probe vectors.
+
+    Returns
+    -------
+    logdet : float
+        Estimate of the log-determinant of ``A``.
+
+    References
+    ----------
+    .. [1] Ubaru, S., Chen, J. and Saad, Y., Fast Estimation of tr(f(A)) via Stochastic Lanczos Quadrature, *SIAM
+           Journal on Matrix Analysis and Applications*, 2017, 38, 1075-1099
+    """
+    A = _check_estimator_input(A, nprobes)
+    if not isinstance(nsteps, (int, np.integer)) or nsteps < 1:
+        raise ValueError("The number of Lanczos steps must be a positive integer.")
+    random_state = scipy._lib._util.check_random_state(random_state)
+    n = A.shape[0]
+    nsteps = min(nsteps, n)
+
+    # Simultaneous Lanczos processes for all probe vectors
+    V = _rademacher_probes(shape=(n, nprobes), random_state=random_state)
+    V = V / np.sqrt(n)
+    V_prev = np.zeros_like(V)
+    beta_prev = np.zeros(nprobes)
+    alphas = np.zeros((nsteps, nprobes))
+    betas = np.zeros((nsteps, nprobes))
+    nsteps_probe = np.full(nprobes, nsteps)
+    active = np.ones(nprobes, dtype=bool)
+    for step in range(nsteps):
+        W = A @ V
+        alphas[step] = np.einsum("ij,ij->j", V, W)
+        W = W - alphas[step] * V - beta_prev * V_prev
+        beta = np.linalg.norm(W, axis=0)
+
+        # Stop the Lanczos process of probes whose Krylov space is exhausted
+        breakdown = active & (beta <= 10 ** -12 * np.abs(alphas[step]))
+        nsteps_probe[breakdown] = step + 1
+        active = active & ~breakdown
+        if step == nsteps - 1 or not np.any(active):
+            break
+        beta_prev = np.where(active, beta, 0.0)
+        betas[step] = beta_prev
+        V_prev = V
+        V = np.where(active, W / np.where(active, beta, 1.0), 0.0)
+
+    # Gauss quadrature from the eigendecompositions of the tridiagonal Lanczos matrices
+    logdet = 0.0
+    for idx in range(nprobes):
+        k = nsteps_probe[idx]
+        eigvals, eigvecs = scipy.linalg.eigh_tridiagonal(
+            alphas[:k, idx], betas[: k - 1, idx]
+        )
+        logdet += np.sum(eigvecs[0, :] ** 2 * np.log(eigvals))
+    return n * logdet / nprobes
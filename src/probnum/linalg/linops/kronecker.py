@@ -3,9 +3,19 @@ Operators of Kronecker-type or related.
 
 This module implements operators of Kronecker-type or linked to Kronecker-type products.
 """
+import functools
+
 import numpy as np
+import scipy.linalg
 
-from probnum.linalg.linops.linearoperators import LinearOperator, aslinop
+from probnum.linalg.linops.linearoperators import (
+    LinearOperator,
+    ScalarMult,
+    Diagonal,
+    MatrixMult,
+    aslinop,
+)
+from probnum.linalg.linops.parallel import _parallel_matmat
 
 
 class Symmetrize(LinearOperator):
@@ -30,6 +40,12 @@ class Symmetrize(LinearOperator):
         Y = 0.5 * (X + X.T)
         return Y.reshape(-1, 1)
 
+    def _matmat(self, X):
+        """Symmetrizes all columns of X=[vec(X_1), ..., vec(X_k)] simultaneously."""
+        X = X.reshape(self._dim, self._dim, -1)
+        Y = 0.5 * (X + X.transpose(1, 0, 2))
+        return Y.reshape(self._dim * self._dim, -1)
+
 
 class Vec(LinearOperator):
     """
@@ -176,13 +192,16 @@ class Kronecker(LinearOperator):
     See Also
     --------
     SymmetricKronecker : The symmetric Kronecker product of two linear operators.
+    MultiKronecker : The Kronecker product of an arbitrary number of linear operators.
 
     """
 
-    # todo: extend this to list of operators
     def __init__(self, A, B, dtype=None):
         self.A = aslinop(A)
         self.B = aslinop(B)
+        self._eigh_cache = None
+        if dtype is None:
+            dtype = np.result_type(self.A.dtype, self.B.dtype)
         super().__init__(
             dtype=dtype,
             shape=(
@@ -195,17 +214,29 @@ class Kronecker(LinearOperator):
         """
         Efficient multiplication via (A (x) B)vec(X) = vec(AXB^T) where vec is the row-wise vectorization operator.
         """
-        X = X.reshape(self.A.shape[1], self.B.shape[1])
-        Y = self.B.matmat(X.T)
-        return self.A.matmat(Y.T).ravel()
+        return _kronecker_matmat(
+            self.A, self.B, X.reshape(-1, 1), num_threads=self.num_threads
+        ).ravel()
 
     def _rmatvec(self, X):
         """
         Based on (A (x) B)^T = A^T (x) B^T.
         """
-        X = X.reshape(self.A.shape[0], self.B.shape[0])
-        Y = self.B.H.matmat(X.T)
-        return self.A.H.matmat(Y.T).ravel()
+        return _kronecker_matmat(
+            self.A.H, self.B.H, X.reshape(-1, 1), num_threads=self.num_threads
+        ).ravel()
+
+    def _matmat(self, X):
+        """
+        Efficient multiplication via (A (x) B)vec(X) = vec(AXB^T) applied to all columns of X simultaneously.
+        """
+        return _kronecker_matmat(self.A, self.B, X, num_threads=self.num_threads)
+
+    def _rmatmat(self, X):
+        """
+        Based on (A (x) B)^T = A^T (x) B^T.
+        """
+        return _kronecker_matmat(self.A.H, self.B.H, X, num_threads=self.num_threads)
 
     def transpose(self):
         """
@@ -213,34 +244,98 @@ class Kronecker(LinearOperator):
         """
         return Kronecker(A=self.A.transpose(), B=self.B.transpose(), dtype=self.dtype)
 
+    def astype(self, dtype):
+        return Kronecker(A=self.A.astype(dtype), B=self.B.astype(dtype), dtype=dtype)
+
+    def _factor_eigendecompositions(self):
+        """
+        Cached eigendecompositions of symmetric factors.
+
+        Returns ``None`` for factors which are not symmetric or whose structure does not require a decomposition.
+        """
+        if (
+            self._eigh_cache is None
+            or self._eigh_cache[0] is not self.A
+            or self._eigh_cache[1] is not self.B
+        ):
+            self._eigh_cache = (
+                self.A,
+                self.B,
+                _symmetric_eigendecomposition(self.A),
+                _symmetric_eigendecomposition(self.B),
+            )
+        return self._eigh_cache[2:]
+
     def inv(self):
         """
         (A (x) B)^-1 = A^-1 (x) B^-1
         """
-        return Kronecker(A=self.A.inv(), B=self.B.inv(), dtype=self.dtype)
+        eigh_A, eigh_B = self._factor_eigendecompositions()
+        return Kronecker(
+            A=_factor_inv(self.A, eigh_A),
+            B=_factor_inv(self.B, eigh_B),
+            dtype=self.dtype,
+        )
+
+    def solve(self, B):
+        """
+        (A (x) B)^-1 vec(X) = vec(A^-1 X B^-T)
+        """
+        return self.inv() @ B
+
+    def sqrtm(self):
+        """
+        Square root of a Kronecker product of symmetric positive semi-definite linear operators.
+
+        Computed factor-wise via :math:`(A \\otimes B)^{\\frac{1}{2}} = A^{\\frac{1}{2}} \\otimes B^{\\frac{1}{2}}` from the
+        (cached) eigendecompositions of the factors.
+
+        Returns
+        -------
+        sqrtm : Kronecker
+            Symmetric positive semi-definite square root.
+        """
+        eigh_A, eigh_B = self._factor_eigendecompositions()
+        return Kronecker(
+            A=_factor_sqrtm(self.A, eigh_A),
+            B=_factor_sqrtm(self.B, eigh_B),
+            dtype=self.dtype,
+        )
 
     # Properties
     def rank(self):
         return self.A.rank() * self.B.rank()
 
     def eigvals(self):
-        raise NotImplementedError
+        """
+        eig(A (x) B) = eig(A) (x) eig(B)
+        """
+        if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
+            eigh_A, eigh_B = self._factor_eigendecompositions()
+            return np.kron(
+                _factor_eigvals(self.A, eigh_A), _factor_eigvals(self.B, eigh_B)
+            )
+        else:
+            raise NotImplementedError
 
     def cond(self, p=None):
         return self.A.cond(p=p) * self.B.cond(p=p)
 
     def det(self):
+        """
+        det(A (x) B) = det(A)^n_B det(B)^n_A
+        """
         if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
-            return self.A.det() ** self.A.shape[0] * self.B.det() ** self.B.shape[0]
+            return self.A.det() ** self.B.shape[0] * self.B.det() ** self.A.shape[0]
         else:
             raise NotImplementedError
 
     def logabsdet(self):
         if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
-            return (
-                self.A.shape[0] * self.A.logabsdet()
-                + self.B.shape[0] * self.B.logabsdet()
-            )
+            eigh_A, eigh_B = self._factor_eigendecompositions()
+            return self.B.shape[0] * _factor_logabsdet(self.A, eigh_A) + self.A.shape[
+                0
+            ] * _factor_logabsdet(self.B, eigh_B)
         else:
             raise NotImplementedError
 
@@ -250,6 +345,215 @@ class Kronecker(LinearOperator):
         else:
             raise NotImplementedError
 
+    def diagonal(self):
+        """
+        diag(A (x) B) = diag(A) (x) diag(B)
+        """
+        if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
+            return np.kron(self.A.diagonal(), self.B.diagonal())
+        else:
+            return super().diagonal()
+
+
+class MultiKronecker(LinearOperator):
+    """
+    Kronecker product of an arbitrary number of linear operators.
+
+    The Kronecker product :math:`A_1 \\otimes A_2 \\otimes \\dots \\otimes A_d` arises for example for kernels on
+    grids and tensor-product quadrature rules. Interpreting a vector as a (row-wise vectorized) tensor of order
+    :math:`d`, the factors are applied mode by mode, such that each factor is applied only once to a matrix with as many
+    columns as there are fibers of the tensor in the respective mode.
+
+    Parameters
+    ----------
+    factors : np.ndarray or LinearOperator
+        Factors of the Kronecker product.
+    dtype : dtype
+        Data type of the operator.
+
+    See Also
+    --------
+    Kronecker : The Kronecker product of two linear operators.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import MultiKronecker
+    >>> A = MultiKronecker(np.eye(2), 2 * np.eye(3), np.array([[1., 2.], [0., 1.]]))
+    >>> A.shape
+    (12, 12)
+    >>> A.logabsdet() == 4 * 3 * np.log(2)
+    True
+    """
+
+    def __init__(self, *factors, dtype=None):
+        if len(factors) == 0:
+            raise ValueError("The Kronecker product requires at least one factor.")
+        self.factors = [aslinop(factor) for factor in factors]
+        self._eigh_cache = None
+        if dtype is None:
+            dtype = np.result_type(*[factor.dtype for factor in self.factors])
+        super().__init__(
+            dtype=dtype,
+            shape=(
+                int(np.prod([factor.shape[0] for factor in self.factors])),
+                int(np.prod([factor.shape[1] for factor in self.factors])),
+            ),
+        )
+
+    def _matmat(self, X):
+        """
+        Mode-wise multiplication applied to all columns of X simultaneously.
+
+        The columns of X are row-wise vectorized tensors of shape (n_1, ..., n_d). After applying a factor along the
+        leading mode, the resulting mode is moved to the end, such that the next factor is again applied along the
+        leading mode. After all modes have been processed, the tensor is in the original mode order.
+        """
+        k = X.shape[1]
+        Y = np.asarray(X)
+        for factor in self.factors:
+            Y = np.asarray(
+                _parallel_matmat(
+                    factor.matmat, Y.reshape(factor.shape[1], -1), self.num_threads
+                )
+            ).T
+        return Y.reshape(k, self.shape[0]).T
+
+    def _matvec(self, x):
+        return self._matmat(x.reshape(-1, 1)).ravel()
+
+    def _transpose(self):
+        return MultiKronecker(
+            *[factor.transpose() for factor in self.factors], dtype=self.dtype
+        )
+
+    def _adjoint(self):
+        return MultiKronecker(*[factor.H for factor in self.factors], dtype=self.dtype)
+
+    def todense(self):
+        return functools.reduce(np.kron, [factor.todense() for factor in self.factors])
+
+    def astype(self, dtype):
+        return MultiKronecker(
+            *[factor.astype(dtype) for factor in self.factors], dtype=dtype
+        )
+
+    def _is_square(self):
+        return all(factor.shape[0] == factor.shape[1] for factor in self.factors)
+
+    def _factor_eigendecompositions(self):
+        """Cached eigendecompositions of symmetric factors, see :class:`Kronecker`."""
+        if self._eigh_cache is None or any(
+            cached is not factor
+            for cached, factor in zip(self._eigh_cache[0], self.factors)
+        ):
+            self._eigh_cache = (
+                list(self.factors),
+                [_symmetric_eigendecomposition(factor) for factor in self.factors],
+            )
+        return self._eigh_cache[1]
+
+    def inv(self):
+        """
+        (A_1 (x) ... (x) A_d)^-1 = A_1^-1 (x) ... (x) A_d^-1
+        """
+        return MultiKronecker(
+            *[
+                _factor_inv(factor, eigh)
+                for factor, eigh in zip(
+                    self.factors, self._factor_eigendecompositions()
+                )
+            ],
+            dtype=self.dtype,
+        )
+
+    def solve(self, B):
+        return self.inv() @ B
+
+    def sqrtm(self):
+        """
+        Square root of a Kronecker product of symmetric positive semi-definite linear operators.
+
+        Returns
+        -------
+        sqrtm : MultiKronecker
+            Symmetric positive semi-definite square root.
+        """
+        return MultiKronecker(
+            *[
+                _factor_sqrtm(factor, eigh)
+                for factor, eigh in zip(
+                    self.factors, self._factor_eigendecompositions()
+                )
+            ],
+            dtype=self.dtype,
+        )
+
+    # Properties
+    def rank(self):
+        return np.prod([factor.rank() for factor in self.factors])
+
+    def eigvals(self):
+        if self._is_square():
+            return functools.reduce(
+                np.kron,
+                [
+                    _factor_eigvals(factor, eigh)
+                    for factor, eigh in zip(
+                        self.factors, self._factor_eigendecompositions()
+                    )
+                ],
+            )
+        else:
+            raise NotImplementedError
+
+    def cond(self, p=None):
+        return np.prod([factor.cond(p=p) for factor in self.factors])
+
+    def det(self):
+        """
+        det(A_1 (x) ... (x) A_d) = prod_i det(A_i)^(n / n_i)
+        """
+        if self._is_square():
+            return np.prod(
+                [
+                    factor.det() ** (self.shape[0] // factor.shape[0])
+                    for factor in self.factors
+                ]
+            )
+        else:
+            raise NotImplementedError
+
+    def logabsdet(self):
+        if self._is_square():
+            return np.sum(
+                [
+                    self.shape[0] // factor.shape[0] * _factor_logabsdet(factor, eigh)
+                    for factor, eigh in zip(
+                        self.factors, self._factor_eigendecompositions()
+                    )
+                ]
+            )
+        else:
+            raise NotImplementedError
+
+    def trace(self):
+        if self._is_square():
+            return np.prod([factor.trace() for factor in self.factors])
+        else:
+            raise NotImplementedError
+
+    def diagonal(self):
+        """
+        diag(A_1 (x) ... (x) A_d) = diag(A_1) (x) ... (x) diag(A_d)
+        """
+        if self._is_square():
+            return functools.reduce(
+                np.kron, [factor.diagonal() for factor in self.factors]
+            )
+        else:
+            return super().diagonal()
+
 
 class SymmetricKronecker(LinearOperator):
     """
@@ -297,6 +601,9 @@ class SymmetricKronecker(LinearOperator):
             raise ValueError(
                 "Linear operators A and B must be square and have the same dimensions."
             )
+        self._eigh_cache = None
+        if dtype is None:
+            dtype = np.result_type(self.A.dtype, self.B.dtype)
 
         # Initiator of superclass
         super().__init__(dtype=dtype, shape=(self._n ** 2, self._n ** 2))
@@ -306,27 +613,36 @@ class SymmetricKronecker(LinearOperator):
         Efficient multiplication via (A (x)_s B)vec(X) = 1/2 vec(BXA^T + AXB^T) where vec is the column-wise normalized
         symmetric stacking operator.
         """
-        # vec(x)
-        X = x.reshape(self._n, self._n)
-
-        # (A (x)_s B)vec(X) = 1/2 vec(BXA^T + AXB^T)
-        Y1 = (self.A @ (self.B @ X).T).T
-        Y2 = (self.B @ (self.A @ X).T).T
-        Y = 0.5 * (Y1 + Y2)
-        return Y.ravel()
+        return self._matmat(x.reshape(-1, 1)).ravel()
 
     def _rmatvec(self, x):
         """Based on (A (x)_s B)^T = A^T (x)_s B^T."""
-        # vec(x)
-        X = x.reshape(self._n, self._n)
+        return self._rmatmat(x.reshape(-1, 1)).ravel()
 
-        # (A^T (x)_s B^T)vec(X) = 1/2 vec(B^T XA + A^T XB)
-        Y1 = (self.A.H @ (self.B.H @ X).T).T
-        Y2 = (self.B.H @ (self.A.H @ X).T).T
-        Y = 0.5 * (Y1 + Y2)
-        return Y.ravel()
+    def _matmat(self, X):
+        """
+        Efficient multiplication via (A (x)_s B)vec(X) = 1/2 vec(BXA^T + AXB^T) applied to all columns of X
+        simultaneously.
+        """
+        if self._ABequal:
+            return _kronecker_matmat(self.A, self.A, X, num_threads=self.num_threads)
+        else:
+            return 0.5 * (
+                _kronecker_matmat(self.A, self.B, X, num_threads=self.num_threads)
+                + _kronecker_matmat(self.B, self.A, X, num_threads=self.num_threads)
+            )
 
-    # TODO: add efficient implementation of _matmat based on (Symmetric) Kronecker properties
+    def _rmatmat(self, X):
+        """Based on (A (x)_s B)^T = A^T (x)_s B^T."""
+        if self._ABequal:
+            return _kronecker_matmat(
+                self.A.H, self.A.H, X, num_threads=self.num_threads
+            )
+        else:
+            return 0.5 * (
+                _kronecker_matmat(self.A.H, self.B.H, X, num_threads=self.num_threads)
+                + _kronecker_matmat(self.B.H, self.A.H, X, num_threads=self.num_threads)
+            )
 
     def todense(self):
         """Dense representation of the symmetric Kronecker product"""
@@ -335,11 +651,289 @@ class SymmetricKronecker(LinearOperator):
         B_dense = self.B.todense()
         return 0.5 * (np.kron(A_dense, B_dense) + np.kron(B_dense, A_dense))
 
+    def astype(self, dtype):
+        if self._ABequal:
+            return SymmetricKronecker(A=self.A.astype(dtype), dtype=dtype)
+        return SymmetricKronecker(
+            A=self.A.astype(dtype), B=self.B.astype(dtype), dtype=dtype
+        )
+
+    def _eigendecomposition(self):
+        """
+        Cached (generalized) eigendecomposition of the factors.
+
+        For identical factors this is the eigendecomposition of :math:`A` if it is symmetric (see
+        :class:`Kronecker`). Otherwise it is the generalized eigendecomposition :math:`AV = BV\\Lambda` with
+        :math:`V^\\top B V = I` of symmetric factors, one of which is positive definite. Then
+        :math:`A = W \\Lambda W^\\top` and :math:`B = W W^\\top` with :math:`W = V^{-\\top}`, such that
+
+        .. math::
+            A \\otimes_{s} B = \\frac{1}{2}(W \\otimes W)(\\Lambda \\otimes I + I \\otimes \\Lambda)(W \\otimes W)^\\top.
+        """
+        if (
+            self._eigh_cache is None
+            or self._eigh_cache[0] is not self.A
+            or self._eigh_cache[1] is not self.B
+        ):
+            if self._ABequal:
+                eigh = _symmetric_eigendecomposition(self.A)
+            else:
+                eigh = _generalized_eigendecomposition(self.A, self.B)
+            self._eigh_cache = (self.A, self.B, eigh)
+        return self._eigh_cache[2]
+
     def inv(self):
         """
         (A (x)_s A)^-1 = A^-1 (x)_s A^-1
+
+        (A (x)_s B)^-1 = 2 (V (x) V) (Lambda (x) I + I (x) Lambda)^-1 (V (x) V)^T
         """
         if self._ABequal:
-            return SymmetricKronecker(A=self.A.inv(), dtype=self.dtype)
+            return SymmetricKronecker(
+                A=_factor_inv(self.A, self._eigendecomposition()), dtype=self.dtype
+            )
+        eigvals, V = self._eigendecomposition()
+        diag = 2.0 / np.add.outer(eigvals, eigvals).ravel()
+        V = aslinop(V)
+
+        def _matmat(X):
+            X = _kronecker_matmat(V.T, V.T, X, num_threads=self.num_threads)
+            return _kronecker_matmat(
+                V, V, diag[:, None] * X, num_threads=self.num_threads
+            )
+
+        return LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matvec=lambda x: _matmat(x.reshape(-1, 1)).ravel(),
+            matmat=_matmat,
+        )
+
+    def solve(self, B):
+        """
+        Solve via the factor-wise inverse, see :meth:`inv`.
+        """
+        return self.inv() @ B
+
+    def sqrtm(self):
+        """
+        Square root of a symmetric Kronecker product with identical symmetric positive semi-definite factors.
+
+        Computed factor-wise via :math:`(A \\otimes_{s} A)^{\\frac{1}{2}} = A^{\\frac{1}{2}} \\otimes_{s} A^{\\frac{1}{2}}`
+        from the (cached) eigendecomposition of :math:`A`.
+
+        Returns
+        -------
+        sqrtm : SymmetricKronecker
+            Symmetric positive semi-definite square root.
+        """
+        if self._ABequal:
+            return SymmetricKronecker(
+                A=_factor_sqrtm(self.A, self._eigendecomposition()), dtype=self.dtype
+            )
+        else:
+            raise NotImplementedError
+
+    # Properties
+    def eigvals(self):
+        """
+        eig(A (x)_s A) = eig(A) (x) eig(A)
+        """
+        if self._ABequal:
+            eigvals = _factor_eigvals(self.A, self._eigendecomposition())
+            return np.kron(eigvals, eigvals)
+        else:
+            raise NotImplementedError
+
+    def det(self):
+        """
+        det(A (x)_s A) = det(A)^(2n)
+        """
+        if self._ABequal:
+            return self.A.det() ** (2 * self._n)
         else:
-            return NotImplementedError
+            eigvals, _ = self._eigendecomposition()
+            return np.prod(np.sign(np.add.outer(eigvals, eigvals))) * np.exp(
+                self.logabsdet()
+            )
+
+    def logabsdet(self):
+        """
+        log|det(A (x)_s B)| = sum_ij log|(lambda_i + lambda_j) / 2| - 4n log|det(V)|
+        """
+        if self._ABequal:
+            return 2 * self._n * _factor_logabsdet(self.A, self._eigendecomposition())
+        else:
+            eigvals, V = self._eigendecomposition()
+            return (
+                np.sum(np.log(np.abs(0.5 * np.add.outer(eigvals, eigvals))))
+                - 4 * self._n * np.linalg.slogdet(V)[1]
+            )
+
+    def trace(self):
+        """
+        tr(A (x)_s B) = 1/2 (tr(A (x) B) + tr(B (x) A)) = tr(A)tr(B)
+        """
+        if self._ABequal:
+            return self.A.trace() ** 2
+        else:
+            return self.A.trace() * self.B.trace()
+
+    def diagonal(self):
+        """
+        diag(A (x)_s B) = 1/2 (diag(A) (x) diag(B) + diag(B) (x) diag(A))
+        """
+        diag_A = self.A.diagonal()
+        if self._ABequal:
+            return np.kron(diag_A, diag_A)
+        else:
+            diag_B = self.B.diagonal()
+            return 0.5 * (np.kron(diag_A, diag_B) + np.kron(diag_B, diag_A))
+
+
+def _kronecker_matmat(A, B, X, num_threads=1):
+    """
+    Apply the Kronecker product :math:`A \\otimes B` to all columns of :math:`X` simultaneously.
+
+    The columns of ``X`` are viewed as row-wise vectorized matrices, i.e. ``X`` is reshaped into a third-order tensor
+    of shape ``(n_1, n_2, k)``. The factors are applied along the first two modes, such that ``A`` and ``B`` are each
+    applied only once to a matrix with :math:`k` times as many columns.
+
+    Parameters
+    ----------
+    A : LinearOperator, shape=(m_1, n_1)
+        First factor.
+    B : LinearOperator, shape=(m_2, n_2)
+        Second factor.
+    X : np.ndarray, shape=(n_1 n_2, k)
+        Matrix to multiply with.
+    num_threads : int
+        Number of threads to which blocks of columns of the intermediate matrices are dispatched.
+
+    Returns
+    -------
+    Y : np.ndarray, shape=(m_1 m_2, k)
+        Result of the multiplication :math:`(A \\otimes B) X`.
+    """
+    (m1, n1), (m2, n2) = A.shape, B.shape
+    k = X.shape[1]
+
+    # Apply B along the second mode
+    Y = np.asarray(X).reshape(n1, n2, k).transpose(1, 0, 2).reshape(n2, n1 * k)
+    Y = np.asarray(_parallel_matmat(B.matmat, Y, num_threads)).reshape(m2, n1, k)
+
+    # Apply A along the first mode
+    Y = Y.transpose(1, 0, 2).reshape(n1, m2 * k)
+    return np.asarray(_parallel_matmat(A.matmat, Y, num_threads)).reshape(m1 * m2, k)
+
+
+class _SymmetricEigendecomposition:
+    """
+    Eigendecomposition :math:`A = Q \\Lambda Q^\\top` of a symmetric matrix.
+
+    Matrix functions of the decomposed matrix are cached, such that repeated inverses or square roots of Kronecker
+    products require only a single decomposition of each factor.
+
+    Parameters
+    ----------
+    A : np.ndarray, shape=(n, n)
+        Symmetric matrix.
+    """
+
+    def __init__(self, A):
+        self.eigvals, self.eigvecs = np.linalg.eigh(A)
+        self._matrix_functions = {}
+
+    def _matrix_function(self, name, fun):
+        """Linear operator :math:`Q f(\\Lambda) Q^\\top`, which is computed only once."""
+        if name not in self._matrix_functions:
+            self._matrix_functions[name] = MatrixMult(
+                A=(self.eigvecs * fun(self.eigvals)) @ self.eigvecs.T
+            )
+        return self._matrix_functions[name]
+
+    def inv(self):
+        if np.any(self.eigvals == 0):
+            raise np.linalg.LinAlgError("Singular matrix.")
+        return self._matrix_function("inv", np.reciprocal)
+
+    def sqrtm(self):
+        tol = (
+            self.eigvals.shape[0]
+            * np.finfo(self.eigvals.dtype).eps
+            * np.max(np.abs(self.eigvals), initial=0.0)
+        )
+        if np.any(self.eigvals < -tol):
+            raise ValueError("The matrix is not positive semi-definite.")
+        return self._matrix_function(
+            "sqrtm", lambda eigvals: np.sqrt(np.maximum(eigvals, 0.0))
+        )
+
+    def logabsdet(self):
+        return np.sum(np.log(np.abs(self.eigvals)))
+
+
+def _symmetric_eigendecomposition(A):
+    """
+    Eigendecomposition of a symmetric linear operator given by a dense matrix.
+
+    Returns ``None`` if the linear operator is not a dense symmetric matrix, in which case its own methods are used.
+    A matrix is considered symmetric if the linear operator is flagged as symmetric or the matrix equals its transpose
+    exactly.
+    """
+    if not isinstance(A, MatrixMult) or not isinstance(A.A, np.ndarray):
+        return None
+    A_dense = A.A
+    if A_dense.shape[0] != A_dense.shape[1] or not _is_symmetric(A, A_dense):
+        return None
+    return _SymmetricEigendecomposition(A_dense)
+
+
+def _is_symmetric(A, A_dense):
+    """Whether a linear operator is flagged as symmetric or its dense matrix equals its transpose exactly."""
+    return getattr(A, "symmetric", False) or np.array_equal(A_dense, A_dense.T)
+
+
+def _generalized_eigendecomposition(A, B):
+    """
+    Generalized eigendecomposition :math:`AV = BV\\Lambda` of symmetric linear operators with :math:`V^\\top B V = I`.
+
+    The roles of :math:`A` and :math:`B` are swapped if :math:`B` is not positive definite. This leaves the symmetric
+    Kronecker product invariant.
+    """
+    A_dense = np.asarray(A.todense())
+    B_dense = np.asarray(B.todense())
+    if not (_is_symmetric(A, A_dense) and _is_symmetric(B, B_dense)):
+        raise NotImplementedError(
+            "Only symmetric Kronecker products of symmetric factors are supported."
+        )
+    try:
+        return scipy.linalg.eigh(A_dense, B_dense)
+    except np.linalg.LinAlgError:
+        return scipy.linalg.eigh(B_dense, A_dense)
+
+
+def _factor_inv(A, eigh):
+    return A.inv() if eigh is None else eigh.inv()
+
+
+def _factor_logabsdet(A, eigh):
+    return A.logabsdet() if eigh is None else eigh.logabsdet()
+
+
+def _factor_eigvals(A, eigh):
+    return A.eigvals() if eigh is None else eigh.eigvals
+
+
+def _factor_sqrtm(A, eigh):
+    if eigh is not None:
+        return eigh.sqrtm()
+    elif isinstance(A, ScalarMult) and np.all(A.eigvals() >= 0):
+        return (
+            A if A.scalar == 1 else ScalarMult(shape=A.shape, scalar=np.sqrt(A.scalar))
+        )
+    elif isinstance(A, Diagonal) and np.all(A.diag >= 0):
+        return Diagonal(Op=np.sqrt(A.diag))
+    raise NotImplementedError(
+        "The square root is only implemented for symmetric positive semi-definite factors."
+    )
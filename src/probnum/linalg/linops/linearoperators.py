@@ -11,9 +11,25 @@ Several algorithms in the :mod:`probnum.linalg` library are able to operate on :
 import warnings
 
 import numpy as np
+import scipy.linalg
 import scipy.sparse.linalg
 import scipy.sparse.linalg.interface
 
+from probnum.linalg.linops.parallel import (
+    parallel_execution,
+    _check_num_threads,
+    _get_default_num_threads,
+    _parallel_matmat,
+)
+
+try:
+    # Optional dependency for sparse Cholesky decompositions
+    import sksparse.cholmod
+
+    _SKSPARSE_AVAILABLE = True
+except ImportError:
+    _SKSPARSE_AVAILABLE = False
+
 
 class LinearOperator(scipy.sparse.linalg.LinearOperator):
     """
@@ -188,6 +204,26 @@ class LinearOperator(scipy.sparse.linalg.LinearOperator):
 
         return y
 
+    @property
+    def num_threads(self):
+        """
+        Number of threads used to apply the linear operator.
+
+        Linear operators with a natural partition of their computations dispatch the partitions to a pool of threads.
+        If not set explicitly, the default of the enclosing :func:`parallel_execution` context is used, which is a
+        single thread otherwise.
+        """
+        num_threads = self.__dict__.get("_num_threads")
+        if num_threads is None:
+            return _get_default_num_threads()
+        return num_threads
+
+    @num_threads.setter
+    def num_threads(self, num_threads):
+        if num_threads is not None:
+            _check_num_threads(num_threads)
+        self._num_threads = num_threads
+
     def transpose(self):
         """
         Transpose this linear operator.
@@ -215,10 +251,58 @@ class LinearOperator(scipy.sparse.linalg.LinearOperator):
         """
         return self.matmat(np.eye(self.shape[1], dtype=self.dtype))
 
+    def astype(self, dtype):
+        """
+        Linear operator with the given data type.
+
+        By default, inputs and outputs of the linear operator are cast to the given data type. Linear operators which
+        store their entries override this method to store them in the given data type instead, such that for example
+        single precision matrix-vector products only read half the memory.
+
+        Parameters
+        ----------
+        dtype : dtype
+            Data type of the linear operator.
+
+        Returns
+        -------
+        A : LinearOperator
+            Linear operator with data type ``dtype``.
+        """
+        dtype = np.dtype(dtype)
+        if dtype == self.dtype:
+            return self
+        return LinearOperator(
+            shape=self.shape,
+            dtype=dtype,
+            matvec=lambda x: self.matvec(np.asarray(x, dtype=dtype)).astype(dtype),
+            rmatvec=lambda x: self.rmatvec(np.asarray(x, dtype=dtype)).astype(dtype),
+            matmat=lambda X: self.matmat(np.asarray(X, dtype=dtype)).astype(dtype),
+        )
+
     def inv(self):
         """Inverse of the linear operator."""
         raise NotImplementedError
 
+    def solve(self, B):
+        """
+        Solve the linear system :math:`AX=B`.
+
+        By default the inverse of the linear operator is applied to the right hand side(s). Linear operators which
+        implement a factorization override this method.
+
+        Parameters
+        ----------
+        B : array-like, shape=(n,) or (n,k)
+            Right hand side(s) of the linear system.
+
+        Returns
+        -------
+        X : np.ndarray, shape=(n,) or (n,k)
+            Solution(s) of the linear system.
+        """
+        return self.inv() @ B
+
     # TODO: implement operations (eigs, cond, det, logabsdet, trace, ...)
     def rank(self):
         """Rank of the linear operator."""
@@ -283,14 +367,31 @@ class LinearOperator(scipy.sparse.linalg.LinearOperator):
         if self.shape[0] != self.shape[1]:
             raise ValueError("The trace is only defined for square linear operators.")
         else:
-            _identity = np.eye(self.shape[0])
-            trace = 0.0
-            for i in range(self.shape[0]):
-                trace += np.squeeze(
-                    _identity[np.newaxis, i, :]
-                    @ self.matvec(_identity[i, :, np.newaxis])
-                )
-            return trace
+            return np.sum(self.diagonal())
+
+    def diagonal(self):
+        """
+        Diagonal of the linear operator.
+
+        Computes the diagonal entries :math:`(A_{11}, \\dots, A_{kk})`, where :math:`k = \\min(m, n)`. By default the
+        linear operator is applied to blocks of unit vectors, such that only few matrix-matrix products are needed.
+        Structured linear operators implement more efficient versions.
+
+        Returns
+        -------
+        diag : np.ndarray, shape=(k,)
+            Diagonal entries of the linear operator.
+        """
+        m, n = self.shape
+        k = min(m, n)
+        diag = np.empty(shape=(k,), dtype=_inexact_dtype(self.dtype))
+        block_size = 128
+        for start in range(0, k, block_size):
+            idx = np.arange(start, min(start + block_size, k))
+            unit_vecs = np.zeros(shape=(n, len(idx)), dtype=self.dtype)
+            unit_vecs[idx, np.arange(len(idx))] = 1
+            diag[idx] = np.asarray(self.matmat(unit_vecs))[idx, np.arange(len(idx))]
+        return diag
 
 
 class _CustomLinearOperator(
@@ -310,6 +411,10 @@ class _CustomLinearOperator(
             dtype=dtype,
         )
 
+    def _matmat(self, X):
+        """Apply the user-specified operations to blocks of columns of X, possibly in parallel."""
+        return _parallel_matmat(super()._matmat, X, self.num_threads)
+
 
 # TODO: inheritance from _TransposedLinearOperator causes dependency on scipy>=1.4, maybe implement our own instead?
 class _TransposedLinearOperator(
@@ -327,9 +432,53 @@ class _TransposedLinearOperator(
     def inv(self):
         return self.A.inv().T
 
+    def diagonal(self):
+        return self.A.diagonal()
+
+    def trace(self):
+        return self.A.trace()
+
+    def det(self):
+        return self.A.det()
+
+    def logabsdet(self):
+        return self.A.logabsdet()
+
+
+class _LazilySimplifiedLinearOperator:
+    """
+    Composite linear operator which is simplified on its first application.
+
+    The expression tree of the composite linear operator is flattened once into nested sums and products of its
+    operands with folded scalar coefficients, which is cached and used for all subsequent matrix-vector and
+    matrix-matrix products. Matrices of the operands are only combined by an explicit call to :func:`simplify`.
+    """
+
+    def _simplified_linop(self):
+        try:
+            return self._simplified
+        except AttributeError:
+            from probnum.linalg.linops.simplification import _application_plan
+
+            return _application_plan(self)
+
+    def _matvec(self, x):
+        if self.__dict__.get("_num_threads") is not None:
+            with parallel_execution(self._num_threads):
+                return self._simplified_linop().matvec(x)
+        return self._simplified_linop().matvec(x)
+
+    def _matmat(self, X):
+        if self.__dict__.get("_num_threads") is not None:
+            with parallel_execution(self._num_threads):
+                return self._simplified_linop().matmat(X)
+        return self._simplified_linop().matmat(X)
+
 
 class _SumLinearOperator(
-    scipy.sparse.linalg.interface._SumLinearOperator, LinearOperator
+    _LazilySimplifiedLinearOperator,
+    scipy.sparse.linalg.interface._SumLinearOperator,
+    LinearOperator,
 ):
     """Sum of two linear operators."""
 
@@ -347,9 +496,14 @@ class _SumLinearOperator(
     def trace(self):
         return self.A.trace() + self.B.trace()
 
+    def diagonal(self):
+        return self.A.diagonal() + self.B.diagonal()
+
 
 class _ProductLinearOperator(
-    scipy.sparse.linalg.interface._ProductLinearOperator, LinearOperator
+    _LazilySimplifiedLinearOperator,
+    scipy.sparse.linalg.interface._ProductLinearOperator,
+    LinearOperator,
 ):
     """(Operator) Product of two linear operators."""
 
@@ -361,9 +515,23 @@ class _ProductLinearOperator(
     def todense(self):
         return self.A.todense() @ self.B.todense()
 
+    def det(self):
+        if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
+            return self.A.det() * self.B.det()
+        else:
+            raise NotImplementedError
+
+    def logabsdet(self):
+        if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
+            return self.A.logabsdet() + self.B.logabsdet()
+        else:
+            raise NotImplementedError
+
 
 class _ScaledLinearOperator(
-    scipy.sparse.linalg.interface._ScaledLinearOperator, LinearOperator
+    _LazilySimplifiedLinearOperator,
+    scipy.sparse.linalg.interface._ScaledLinearOperator,
+    LinearOperator,
 ):
     """Linear operator scaled with a scalar."""
 
@@ -382,30 +550,107 @@ class _ScaledLinearOperator(
         A, alpha = self.args
         return alpha * A.trace()
 
+    def diagonal(self):
+        A, alpha = self.args
+        return alpha * A.diagonal()
+
+    def det(self):
+        A, alpha = self.args
+        return alpha ** self.shape[0] * A.det()
+
+    def logabsdet(self):
+        A, alpha = self.args
+        return self.shape[0] * np.log(np.abs(alpha)) + A.logabsdet()
+
 
 class _PowerLinearOperator(
-    scipy.sparse.linalg.interface._PowerLinearOperator, LinearOperator
+    _LazilySimplifiedLinearOperator,
+    scipy.sparse.linalg.interface._PowerLinearOperator,
+    LinearOperator,
 ):
     """Linear operator raised to a non-negative integer power."""
 
     def __init__(self, A, p):
         super().__init__(A=A, p=p)
 
+    def det(self):
+        A, p = self.args
+        return A.det() ** p
+
+    def logabsdet(self):
+        A, p = self.args
+        return p * A.logabsdet()
+
 
 class Diagonal(LinearOperator):
     """
     A linear operator representing the diagonal from another linear operator.
 
+    The diagonal is extracted via :meth:`LinearOperator.diagonal`, which exploits the structure of ``Op`` if
+    available. Alternatively, the diagonal entries can be given directly.
+
     Parameters
     ----------
-    Op : LinearOperator
-        Linear operator of which to represent the diagonal.
+    Op : LinearOperator or array-like
+        Linear operator of which to represent the diagonal or vector of diagonal entries.
     """
 
-    # TODO: should this be an operator itself or a function of a LinearOperator?
-    #   - a function allows subclasses (e.g. MatrixMult) to implement more efficient versions than n products e_i A e_i
     def __init__(self, Op):
-        raise NotImplementedError
+        if isinstance(Op, scipy.sparse.linalg.LinearOperator):
+            if Op.shape[0] != Op.shape[1]:
+                raise ValueError("The diagonal operator must be square.")
+            diag = aslinop(Op).diagonal()
+        else:
+            diag = np.asarray(Op)
+            if diag.ndim != 1:
+                raise ValueError("Diagonal entries must be given as a vector.")
+        self.diag = diag
+        super().__init__(
+            shape=(diag.shape[0], diag.shape[0]), dtype=_inexact_dtype(diag.dtype),
+        )
+
+    def _matvec(self, x):
+        return self.diag * np.ravel(x)
+
+    def _matmat(self, X):
+        return self.diag[:, None] * X
+
+    def _transpose(self):
+        return self
+
+    def _adjoint(self):
+        return Diagonal(Op=np.conj(self.diag))
+
+    def todense(self):
+        return np.diag(self.diag)
+
+    def astype(self, dtype):
+        return Diagonal(Op=self.diag.astype(dtype))
+
+    def inv(self):
+        return Diagonal(Op=1 / self.diag)
+
+    # Properties
+    def rank(self):
+        return np.count_nonzero(self.diag)
+
+    def eigvals(self):
+        return self.diag
+
+    def cond(self, p=None):
+        return np.linalg.cond(np.diag(self.diag), p=p)
+
+    def det(self):
+        return np.prod(self.diag)
+
+    def logabsdet(self):
+        return np.sum(np.log(np.abs(self.diag)))
+
+    def trace(self):
+        return np.sum(self.diag)
+
+    def diagonal(self):
+        return self.diag
 
 
 class ScalarMult(LinearOperator):
@@ -418,11 +663,13 @@ class ScalarMult(LinearOperator):
         Matrix dimensions (M, N).
     scalar : float
         Scalar to multiply by.
+    dtype : dtype
+        Data type of the operator.
     """
 
-    def __init__(self, shape, scalar):
+    def __init__(self, shape, scalar, dtype=float):
         self.scalar = scalar
-        super().__init__(shape=shape, dtype=float)
+        super().__init__(shape=shape, dtype=dtype)
 
     def _matvec(self, x):
         return self.scalar * x
@@ -430,11 +677,26 @@ class ScalarMult(LinearOperator):
     def _matmat(self, X):
         return self.scalar * X
 
+    def _transpose(self):
+        return ScalarMult(
+            shape=(self.shape[1], self.shape[0]), scalar=self.scalar, dtype=self.dtype
+        )
+
+    def _adjoint(self):
+        return ScalarMult(
+            shape=(self.shape[1], self.shape[0]),
+            scalar=np.conj(self.scalar),
+            dtype=self.dtype,
+        )
+
     def todense(self):
-        return np.eye(self.shape[0]) * self.scalar
+        return np.eye(self.shape[0], dtype=self.dtype) * self.scalar
+
+    def astype(self, dtype):
+        return ScalarMult(shape=self.shape, scalar=self.scalar, dtype=dtype)
 
     def inv(self):
-        return ScalarMult(shape=self.shape, scalar=1 / self.scalar)
+        return ScalarMult(shape=self.shape, scalar=1 / self.scalar, dtype=self.dtype)
 
     # Properties
     def rank(self):
@@ -450,11 +712,14 @@ class ScalarMult(LinearOperator):
         return self.scalar ** self.shape[0]
 
     def logabsdet(self):
-        return np.log(np.abs(self.scalar))
+        return self.shape[0] * np.log(np.abs(self.scalar))
 
     def trace(self):
         return self.scalar * self.shape[0]
 
+    def diagonal(self):
+        return self.scalar * np.ones(min(self.shape))
+
 
 class Identity(ScalarMult):
     """
@@ -464,9 +729,11 @@ class Identity(ScalarMult):
     ----------
     shape : int or tuple
         Shape of the identity operator.
+    dtype : dtype
+        Data type of the operator.
     """
 
-    def __init__(self, shape):
+    def __init__(self, shape, dtype=float):
         # Check shape
         if np.isscalar(shape):
             _shape = (shape, shape)
@@ -475,10 +742,19 @@ class Identity(ScalarMult):
         else:
             _shape = shape
         # Initiator of super class
-        super().__init__(shape=_shape, scalar=1.0)
+        super().__init__(shape=_shape, scalar=1.0, dtype=dtype)
+
+    def _transpose(self):
+        return self
+
+    def _adjoint(self):
+        return self
 
     def todense(self):
-        return np.eye(self.shape[0])
+        return np.eye(self.shape[0], dtype=self.dtype)
+
+    def astype(self, dtype):
+        return Identity(shape=self.shape, dtype=dtype)
 
     def inv(self):
         return self
@@ -502,20 +778,171 @@ class Identity(ScalarMult):
     def trace(self):
         return self.shape[0]
 
+    def diagonal(self):
+        return np.ones(self.shape[0])
+
+
+class _MatrixFactorization:
+    """
+    Factorization of a square matrix.
+
+    Depending on the declared properties of the matrix a Cholesky decomposition (symmetric positive definite), an
+    eigendecomposition (symmetric) or an LU decomposition (general) is computed. Sparse matrices are factorized via a
+    sparse LU decomposition. Sparse symmetric positive definite matrices are factorized via a sparse Cholesky
+    decomposition if ``scikit-sparse`` is installed and otherwise via a sparse LU decomposition with a symmetric fill-in
+    reducing ordering and without pivoting.
+
+    Parameters
+    ----------
+    A : array-like or scipy.sparse.spmatrix, shape=(n,n)
+        Matrix to factorize.
+    symmetric : bool
+        Whether the matrix is symmetric.
+    positive_definite : bool
+        Whether the matrix is symmetric positive definite.
+    """
+
+    def __init__(self, A, symmetric=False, positive_definite=False):
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("Only square matrices can be factorized.")
+        if isinstance(A, scipy.sparse.spmatrix) and positive_definite:
+            if _SKSPARSE_AVAILABLE:
+                self.kind = "cholmod"
+                self.factors = sksparse.cholmod.cholesky(scipy.sparse.csc_matrix(A))
+            else:
+                self.kind = "splu"
+                self.factors = scipy.sparse.linalg.splu(
+                    scipy.sparse.csc_matrix(A),
+                    permc_spec="MMD_AT_PLUS_A",
+                    diag_pivot_thresh=0.0,
+                    options={"SymmetricMode": True},
+                )
+        elif isinstance(A, scipy.sparse.spmatrix):
+            self.kind = "splu"
+            self.factors = scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(A))
+        elif positive_definite:
+            self.kind = "cholesky"
+            self.factors = scipy.linalg.cho_factor(A, lower=True)
+        elif symmetric:
+            self.kind = "eigh"
+            self.factors = scipy.linalg.eigh(A)
+        else:
+            self.kind = "lu"
+            self.factors = scipy.linalg.lu_factor(A)
+
+    def solve(self, B, trans=False):
+        """Solve :math:`AX=B` or :math:`A^\\top X = B` if ``trans=True``."""
+        if self.kind == "cholmod":
+            return self.factors(np.asarray(B))
+        elif self.kind == "splu":
+            return self.factors.solve(np.asarray(B), trans="T" if trans else "N")
+        elif self.kind == "cholesky":
+            return scipy.linalg.cho_solve(self.factors, B)
+        elif self.kind == "eigh":
+            eigvals, eigvecs = self.factors
+            QtB = eigvecs.T @ B
+            return eigvecs @ (QtB / eigvals.reshape((-1,) + (1,) * (QtB.ndim - 1)))
+        else:
+            return scipy.linalg.lu_solve(self.factors, B, trans=int(trans))
+
+    def slogdet(self):
+        """Sign and natural logarithm of the absolute value of the determinant."""
+        if self.kind == "cholmod":
+            return 1.0, self.factors.logdet()
+        elif self.kind == "splu":
+            diag = self.factors.U.diagonal()
+            sign = (
+                np.prod(np.sign(diag))
+                * _permutation_sign(self.factors.perm_r)
+                * _permutation_sign(self.factors.perm_c)
+            )
+        elif self.kind == "cholesky":
+            diag = np.diagonal(self.factors[0]) ** 2
+            sign = 1.0
+        elif self.kind == "eigh":
+            diag = self.factors[0]
+            sign = np.prod(np.sign(diag))
+        else:
+            lu, piv = self.factors
+            diag = np.diagonal(lu)
+            sign = np.prod(np.sign(diag)) * (-1.0) ** np.sum(
+                piv != np.arange(piv.shape[0])
+            )
+        return sign, np.sum(np.log(np.abs(diag)))
+
+
+def _inexact_dtype(*dtypes):
+    """Floating point data type of the result of linear algebra routines applied to the given data types."""
+    dtype = np.result_type(*dtypes)
+    if not np.issubdtype(dtype, np.inexact):
+        dtype = np.result_type(dtype, float)
+    return dtype
+
+
+def _permutation_sign(perm):
+    """Sign of a permutation given as an array of indices."""
+    visited = np.zeros(perm.shape[0], dtype=bool)
+    ntranspositions = 0
+    for i in range(perm.shape[0]):
+        cycle_length = 0
+        while not visited[i]:
+            visited[i] = True
+            i = perm[i]
+            cycle_length += 1
+        ntranspositions += max(cycle_length - 1, 0)
+    return (-1.0) ** ntranspositions
+
 
 class MatrixMult(scipy.sparse.linalg.interface.MatrixLinearOperator, LinearOperator):
     """
     A linear operator defined via a matrix.
 
+    Linear systems, the inverse and the determinant are computed from a factorization of the matrix, which is chosen
+    based on the declared properties of the matrix: a Cholesky decomposition if it is positive definite, an
+    eigendecomposition if it is symmetric and an LU decomposition otherwise. Optionally, the factorization can be cached,
+    such that it is computed only once. The cache is cleared when the matrix is reassigned.
+
     Parameters
     ----------
     A : array-like or scipy.sparse.spmatrix
         The explicit matrix.
+    symmetric : bool
+        Whether the matrix is symmetric.
+    positive_definite : bool
+        Whether the matrix is symmetric positive definite.
+    cache_factorization : bool
+        Whether to cache the factorization of the matrix.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import MatrixMult
+    >>> A = MatrixMult(np.array([[4., 2.], [2., 3.]]), positive_definite=True, cache_factorization=True)
+    >>> A.solve(np.array([2., 1.]))
+    array([0.5, 0. ])
+    >>> np.round(A.logabsdet(), 6)
+    2.079442
     """
 
-    def __init__(self, A):
+    def __init__(
+        self, A, symmetric=False, positive_definite=False, cache_factorization=False
+    ):
+        self.symmetric = symmetric or positive_definite
+        self.positive_definite = positive_definite
+        self.cache_factorization = cache_factorization
         super().__init__(A=A)
 
+    @property
+    def A(self):
+        """Matrix representing the linear operator."""
+        return self._A
+
+    @A.setter
+    def A(self, A):
+        self._A = A
+        self.args = (A,)
+        self._factorization = None
+
     def _matvec(self, x):
         return self.A @ x  # Needed to call __matmul__ instead of np.dot or np.matmul
 
@@ -528,12 +955,49 @@ class MatrixMult(scipy.sparse.linalg.interface.MatrixLinearOperator, LinearOpera
         else:
             return np.asarray(self.A)
 
+    def factorize(self):
+        """
+        Factorization of the matrix.
+
+        Returns the cached factorization if available.
+        """
+        if self._factorization is not None:
+            return self._factorization
+        factorization = _MatrixFactorization(
+            self.A, symmetric=self.symmetric, positive_definite=self.positive_definite
+        )
+        if self.cache_factorization:
+            self._factorization = factorization
+        return factorization
+
+    def solve(self, B):
+        """
+        Solve the linear system :math:`AX=B`.
+
+        Parameters
+        ----------
+        B : array-like, shape=(n,) or (n,k)
+            Right hand side(s) of the linear system.
+
+        Returns
+        -------
+        X : np.ndarray, shape=(n,) or (n,k)
+            Solution(s) of the linear system.
+        """
+        return self.factorize().solve(B)
+
+    def astype(self, dtype):
+        if np.dtype(dtype) == self.dtype:
+            return self
+        return type(self)(
+            A=self.A.astype(dtype),
+            symmetric=self.symmetric,
+            positive_definite=self.positive_definite,
+            cache_factorization=self.cache_factorization,
+        )
+
     def inv(self):
-        if isinstance(self.A, scipy.sparse.spmatrix):
-            invmat = scipy.sparse.linalg.inv(self.A)
-        else:
-            invmat = np.linalg.inv(self.A)
-        return MatrixMult(invmat)
+        return _InverseMatrixMult(Op=self, factorization=self.factorize())
 
     # Arithmetic operations
     # TODO: perform arithmetic operations between MatrixMult operators explicitly
@@ -549,17 +1013,164 @@ class MatrixMult(scipy.sparse.linalg.interface.MatrixLinearOperator, LinearOpera
         return np.linalg.cond(self.A, p=p)
 
     def det(self):
-        return np.linalg.det(self.A)
+        sign, logabsdet = self.factorize().slogdet()
+        return sign * np.exp(logabsdet)
 
     def logabsdet(self):
-        sign, logdet = np.linalg.slogdet(self.A)
-        return logdet
+        _, logabsdet = self.factorize().slogdet()
+        return logabsdet
+
+    def trace(self):
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("The trace is only defined for square linear operators.")
+        else:
+            return self.A.diagonal().sum()
+
+    def diagonal(self):
+        if isinstance(self.A, scipy.sparse.spmatrix):
+            return self.A.diagonal()
+        else:
+            return np.diagonal(np.asarray(self.A))
+
+
+class SparseMatrixMult(MatrixMult):
+    """
+    A linear operator defined via a sparse matrix.
+
+    The matrix is stored in compressed sparse row (CSR) or column (CSC) format. Products with (multiple) vectors are
+    computed as a single sparse-dense matrix product and the diagonal and trace are computed in
+    :math:`\\mathcal{O}(\\operatorname{nnz})` operations. Linear systems, the inverse and the determinant are computed
+    from a sparse Cholesky or LU decomposition, which can be cached.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix or array-like
+        The explicit matrix. Matrices not in CSR or CSC format are converted to CSR format.
+    symmetric : bool
+        Whether the matrix is symmetric.
+    positive_definite : bool
+        Whether the matrix is symmetric positive definite.
+    cache_factorization : bool
+        Whether to cache the factorization of the matrix.
+
+    See Also
+    --------
+    MatrixMult : A linear operator defined via a matrix.
+
+    Examples
+    --------
+    >>> import scipy.sparse
+    >>> from probnum.linalg.linops import SparseMatrixMult
+    >>> A = SparseMatrixMult(scipy.sparse.diags([1., 2., 4.]), positive_definite=True)
+    >>> A
+    <3x3 SparseMatrixMult with dtype=float64>
+    >>> A.trace()
+    7.0
+    >>> A.solve(np.ones(3))
+    array([1.  , 0.5 , 0.25])
+    """
+
+    def __init__(
+        self, A, symmetric=False, positive_definite=False, cache_factorization=False
+    ):
+        if not (scipy.sparse.isspmatrix_csr(A) or scipy.sparse.isspmatrix_csc(A)):
+            A = scipy.sparse.csr_matrix(A)
+        super().__init__(
+            A=A,
+            symmetric=symmetric,
+            positive_definite=positive_definite,
+            cache_factorization=cache_factorization,
+        )
+
+    def _transpose(self):
+        return SparseMatrixMult(
+            A=self.A.T,
+            symmetric=self.symmetric,
+            positive_definite=self.positive_definite,
+            cache_factorization=self.cache_factorization,
+        )
+
+    def _adjoint(self):
+        return SparseMatrixMult(
+            A=self.A.conj().T,
+            symmetric=self.symmetric,
+            positive_definite=self.positive_definite,
+            cache_factorization=self.cache_factorization,
+        )
+
+    def todense(self):
+        return self.A.toarray()
+
+    # Properties
+    def rank(self):
+        return np.linalg.matrix_rank(self.todense())
+
+    def eigvals(self):
+        return np.linalg.eigvals(self.todense())
+
+    def cond(self, p=None):
+        return np.linalg.cond(self.todense(), p=p)
 
     def trace(self):
         if self.shape[0] != self.shape[1]:
             raise ValueError("The trace is only defined for square linear operators.")
         else:
-            return np.trace(self.A)
+            return self.A.diagonal().sum()
+
+    def diagonal(self):
+        return self.A.diagonal()
+
+
+class _InverseMatrixMult(LinearOperator):
+    """
+    Inverse of a matrix, which is applied via a factorization of the matrix.
+
+    Parameters
+    ----------
+    Op : MatrixMult
+        Linear operator to invert.
+    factorization : _MatrixFactorization
+        Factorization of the matrix of ``Op``.
+    trans : bool
+        Whether to represent the transpose of the inverse.
+    """
+
+    def __init__(self, Op, factorization, trans=False):
+        self.Op = Op
+        self._factorization = factorization
+        self._trans = trans
+        super().__init__(
+            dtype=_inexact_dtype(Op.dtype), shape=(Op.shape[1], Op.shape[0])
+        )
+
+    def _matvec(self, x):
+        return self._factorization.solve(x, trans=self._trans)
+
+    def _matmat(self, X):
+        return self._factorization.solve(X, trans=self._trans)
+
+    def _transpose(self):
+        return _InverseMatrixMult(
+            Op=self.Op, factorization=self._factorization, trans=not self._trans
+        )
+
+    def _adjoint(self):
+        return self._transpose()
+
+    def todense(self):
+        return self.matmat(np.eye(self.shape[1], dtype=self.dtype))
+
+    def inv(self):
+        return self.Op.T if self._trans else self.Op
+
+    # Properties
+    def det(self):
+        sign, logabsdet = self._factorization.slogdet()
+        return sign * np.exp(-logabsdet)
+
+    def logabsdet(self):
+        _, logabsdet = self._factorization.slogdet()
+        return -logabsdet
 
 
 def aslinop(A):
@@ -588,10 +1199,15 @@ def aslinop(A):
     >>> M = np.array([[1,2,3],[4,5,6]], dtype=np.int32)
     >>> aslinop(M)
     <2x3 MatrixMult with dtype=int32>
+    >>> import scipy.sparse
+    >>> aslinop(scipy.sparse.eye(3))
+    <3x3 SparseMatrixMult with dtype=float64>
     """
     if isinstance(A, scipy.sparse.linalg.LinearOperator):
         return A
-    elif isinstance(A, (np.ndarray, scipy.sparse.spmatrix)):
+    elif isinstance(A, scipy.sparse.spmatrix):
+        return SparseMatrixMult(A=A)
+    elif isinstance(A, np.ndarray):
         return MatrixMult(A=A)
     else:
         op = scipy.sparse.linalg.aslinearoperator(A)
@@ -0,0 +1,244 @@
+"""
+Low-rank updates of linear operators.
+
+This module implements linear operators of the form :math:`A + UV^\\top`, where :math:`U` and :math:`V` are tall
+matrices. Such operators arise as iterates of (probabilistic) linear solvers, where in each iteration a low-rank update
+is added to the current estimate.
+"""
+import copy
+
+import numpy as np
+
+from probnum.linalg.linops.linearoperators import LinearOperator, aslinop
+
+
+class _FactorBuffer:
+    """
+    Preallocated storage for the factors of a low-rank update.
+
+    Several :class:`LowRankUpdate` operators of increasing rank can share the same buffer. Each operator only views the
+    leading columns of the buffer, which are never modified once written.
+    """
+
+    def __init__(self, U, V, size):
+        self.U = U
+        self.V = V
+        self.size = size
+
+    @classmethod
+    def empty(cls, shape, capacity, dtype):
+        return cls(
+            U=np.empty((shape[0], capacity), dtype=dtype),
+            V=np.empty((shape[1], capacity), dtype=dtype),
+            size=0,
+        )
+
+    @property
+    def capacity(self):
+        return self.U.shape[1]
+
+
+class LowRankUpdate(LinearOperator):
+    """
+    Low-rank update of a linear operator.
+
+    Represents the linear operator :math:`A + UV^\\top`, where :math:`U \\in \\mathbb{R}^{m \\times k}` and
+    :math:`V \\in \\mathbb{R}^{n \\times k}`. The factors are stored in preallocated arrays, such that further updates
+    via :meth:`update` do not require copying. Independent of the rank :math:`k`, an application of the low-rank term
+    consists of only two dense matrix products.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator, shape=(m,n)
+        Linear operator to be updated.
+    U : array-like, shape=(m,k), optional
+        Left factor of the update.
+    V : array-like, shape=(n,k), optional
+        Right factor of the update.
+    maxrank : int, optional
+        Number of columns to preallocate for the factors. If the rank of the update exceeds ``maxrank`` the storage
+        is extended automatically.
+    dtype : dtype
+        Data type of the operator.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import LowRankUpdate, Identity
+    >>> A = LowRankUpdate(A=Identity(shape=3), maxrank=2)
+    >>> A = A.update(U=np.ones(3), V=np.array([1., 0., 0.]))
+    >>> A.todense()
+    array([[2., 0., 0.],
+           [1., 1., 0.],
+           [1., 0., 1.]])
+    """
+
+    def __init__(self, A, U=None, V=None, maxrank=None, dtype=None):
+        # Avoid nesting of low-rank updates
+        if isinstance(A, LowRankUpdate):
+            _A = A.A
+            if U is None:
+                U, V = A.U, A.V
+            else:
+                U = np.hstack((A.U, self._as_factor(U, A.shape[0])))
+                V = np.hstack((A.V, self._as_factor(V, A.shape[1])))
+        else:
+            _A = aslinop(A)
+        self.A = _A
+
+        # Factors
+        if U is None:
+            U = np.empty((_A.shape[0], 0), dtype=_A.dtype)
+            V = np.empty((_A.shape[1], 0), dtype=_A.dtype)
+        U = self._as_factor(U, _A.shape[0])
+        V = self._as_factor(V, _A.shape[1])
+        if U.shape[1] != V.shape[1]:
+            raise ValueError(
+                "Factors U and V of the low-rank update must have the same number of columns."
+            )
+        if dtype is None:
+            dtype = np.result_type(_A.dtype, U.dtype, V.dtype)
+
+        # Preallocate storage for the factors
+        rank = U.shape[1]
+        if maxrank is not None and maxrank > rank:
+            self._buffer = _FactorBuffer.empty(
+                shape=_A.shape, capacity=maxrank, dtype=dtype
+            )
+            self._buffer.U[:, :rank] = U
+            self._buffer.V[:, :rank] = V
+            self._buffer.size = rank
+        else:
+            self._buffer = _FactorBuffer(U=U, V=V, size=rank)
+        self._rank = rank
+
+        super().__init__(dtype=dtype, shape=_A.shape)
+
+    @staticmethod
+    def _as_factor(W, dim):
+        """Transform a vector or array into a factor with ``dim`` rows."""
+        W = np.asarray(W)
+        if W.ndim == 1:
+            W = W[:, None]
+        if W.ndim != 2 or W.shape[0] != dim:
+            raise ValueError(
+                "Dimension mismatch between linear operator and low-rank factor."
+            )
+        return W
+
+    @property
+    def U(self):
+        """Left factor :math:`U` of the low-rank update."""
+        return self._buffer.U[:, : self._rank]
+
+    @property
+    def V(self):
+        """Right factor :math:`V` of the low-rank update."""
+        return self._buffer.V[:, : self._rank]
+
+    @property
+    def update_rank(self):
+        """Number of columns :math:`k` of the factors of the low-rank update."""
+        return self._rank
+
+    def update(self, U, V):
+        """
+        Add a further low-rank update to the linear operator.
+
+        Returns a new linear operator representing :math:`A + UV^\\top + U_{\\text{new}} V_{\\text{new}}^\\top`. The
+        new factors are appended to the preallocated storage, which is shared with this operator, i.e. this operation
+        does not copy the existing factors.
+
+        Parameters
+        ----------
+        U : array-like, shape=(m,) or (m,l)
+            Left factor of the additional update.
+        V : array-like, shape=(n,) or (n,l)
+            Right factor of the additional update.
+
+        Returns
+        -------
+        updated_linop : LowRankUpdate
+            Updated linear operator.
+        """
+        U = self._as_factor(U, self.shape[0])
+        V = self._as_factor(V, self.shape[1])
+        newrank = self._rank + U.shape[1]
+
+        # Reallocate if this operator is not the most recent one sharing the buffer or the buffer is full
+        buffer = self._buffer
+        if buffer.size != self._rank or buffer.capacity < newrank:
+            buffer = _FactorBuffer.empty(
+                shape=self.shape,
+                capacity=max(newrank, 2 * self._buffer.capacity),
+                dtype=self.dtype,
+            )
+            buffer.U[:, : self._rank] = self.U
+            buffer.V[:, : self._rank] = self.V
+        buffer.U[:, self._rank : newrank] = U
+        buffer.V[:, self._rank : newrank] = V
+        buffer.size = newrank
+
+        updated_linop = copy.copy(self)
+        updated_linop._buffer = buffer
+        updated_linop._rank = newrank
+        return updated_linop
+
+    def _matvec(self, x):
+        return self.A @ x + self.U @ (self.V.T @ x)
+
+    def _matmat(self, X):
+        return self.A.matmat(X) + self.U @ (self.V.T @ X)
+
+    def _transpose(self):
+        return LowRankUpdate(A=self.A.T, U=self.V, V=self.U, dtype=self.dtype)
+
+    def _adjoint(self):
+        return LowRankUpdate(
+            A=self.A.H, U=self.V.conj(), V=self.U.conj(), dtype=self.dtype
+        )
+
+    def todense(self):
+        return self.A.todense() + self.U @ self.V.T
+
+    def inv(self):
+        """
+        Inverse via the Sherman-Morrison-Woodbury formula.
+
+        :math:`(A + UV^\\top)^{-1} = A^{-1} - A^{-1}U(I + V^\\top A^{-1} U)^{-1}V^\\top A^{-1}`
+        """
+        Ainv = self.A.inv()
+        AinvU = Ainv @ self.U
+        capmat = np.eye(self._rank) + self.V.T @ AinvU
+        return LowRankUpdate(
+            A=Ainv,
+            U=-np.linalg.solve(capmat.T, AinvU.T).T,
+            V=Ainv.T @ self.V,
+            dtype=self.dtype,
+        )
+
+    # Properties
+    def trace(self):
+        """
+        tr(A + UV^T) = tr(A) + tr(V^T U)
+        """
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("The trace is only defined for square linear operators.")
+        else:
+            return self.A.trace() + np.einsum("ij,ij->", self.U, self.V)
+
+    def diagonal(self):
+        k = min(self.shape)
+        return self.A.diagonal() + np.einsum("ij,ij->i", self.U[:k], self.V[:k])
+
+    def det(self):
+        """
+        Determinant via the matrix determinant lemma: det(A + UV^T) = det(I + V^T A^{-1} U) det(A).
+        """
+        capmat = np.eye(self._rank) + self.V.T @ (self.A.inv() @ self.U)
+        return np.linalg.det(capmat) * self.A.det()
+
+    def logabsdet(self):
+        capmat = np.eye(self._rank) + self.V.T @ (self.A.inv() @ self.U)
+        _, logabsdet_capmat = np.linalg.slogdet(capmat)
+        return logabsdet_capmat + self.A.logabsdet()
@@ -0,0 +1,113 @@
+"""
+Out-of-core linear operators.
+
+This module implements linear operators defined via dense matrices, which are stored on disk and memory-mapped. Only
+blocks of rows of the matrix are loaded into memory during matrix-vector products, such that (probabilistic) linear
+solvers, which only require matrix-vector products, can be applied to matrices that do not fit into memory.
+"""
+import os
+
+import numpy as np
+
+from probnum.linalg.linops.linearoperators import LinearOperator
+from probnum.linalg.linops.parallel import _map_partitions
+
+
+class MemoryMappedMatrixMult(LinearOperator):
+    """
+    A linear operator defined via a memory-mapped dense matrix.
+
+    Matrix-vector and matrix-matrix products are computed by streaming blocks of rows of the matrix from disk. The blocks
+    can optionally be processed in parallel by a pool of threads, since NumPy releases the global interpreter lock
+    during matrix products.
+
+    Parameters
+    ----------
+    A : np.memmap or np.ndarray or str or os.PathLike, shape=(m,n)
+        Memory-mapped matrix or path to a ``.npy`` file containing the matrix. Files are opened read-only.
+    block_size : int, optional
+        Number of rows per block. Defaults to blocks of roughly 64 MB.
+    num_threads : int, optional
+        Number of threads processing blocks in parallel. Defaults to the setting of :func:`parallel_execution`, i.e.
+        blocks are processed sequentially outside of a :func:`parallel_execution` context.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import MemoryMappedMatrixMult
+    >>> fpath = os.path.join(tempfile.mkdtemp(), "matrix.npy")
+    >>> np.save(fpath, np.arange(12.).reshape(4, 3))
+    >>> A = MemoryMappedMatrixMult(fpath, block_size=3)
+    >>> A
+    <4x3 MemoryMappedMatrixMult with dtype=float64>
+    >>> A @ np.ones(3)
+    array([ 3., 12., 21., 30.])
+    """
+
+    def __init__(self, A, block_size=None, num_threads=None):
+        if isinstance(A, (str, os.PathLike)):
+            A = np.load(A, mmap_mode="r")
+        if A.ndim != 2:
+            raise ValueError("The memory-mapped matrix must be two-dimensional.")
+        self.A = A
+
+        if block_size is None:
+            block_size = max(1, (64 * 2 ** 20) // max(1, A.shape[1] * A.itemsize))
+        if block_size < 1:
+            raise ValueError("The block size must be a positive integer.")
+        self.block_size = int(block_size)
+
+        super().__init__(dtype=A.dtype, shape=A.shape)
+        self.num_threads = num_threads
+
+    def _row_blocks(self):
+        """Slices of the blocks of rows of the matrix."""
+        return [
+            slice(start, min(start + self.block_size, self.shape[0]))
+            for start in range(0, self.shape[0], self.block_size)
+        ]
+
+    def _map_row_blocks(self, fun):
+        """Apply a function to all blocks of rows, possibly in parallel."""
+        return _map_partitions(fun, self._row_blocks(), num_threads=self.num_threads)
+
+    def _matmat(self, X):
+        X = np.asarray(X)
+        Y = np.empty(
+            (self.shape[0], X.shape[1]), dtype=np.result_type(self.dtype, X.dtype)
+        )
+
+        def _apply_block(rows):
+            Y[rows] = np.asarray(self.A[rows]) @ X
+
+        self._map_row_blocks(_apply_block)
+        return Y
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1)))
+
+    def _rmatmat(self, X):
+        X = np.asarray(X)
+        partial_products = self._map_row_blocks(
+            lambda rows: np.asarray(self.A[rows]).conj().T @ X[rows]
+        )
+        return np.sum(partial_products, axis=0)
+
+    def _rmatvec(self, x):
+        return self._rmatmat(np.reshape(x, (-1, 1)))
+
+    def todense(self):
+        return np.array(self.A)
+
+    # Properties
+    def diagonal(self):
+        k = min(self.shape)
+        diag = np.empty(k, dtype=self.dtype)
+        for rows in self._row_blocks():
+            if rows.start >= k:
+                break
+            rows = slice(rows.start, min(rows.stop, k))
+            diag[rows] = np.diagonal(np.asarray(self.A[rows, rows]))
+        return diag
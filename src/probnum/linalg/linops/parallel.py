@@ -0,0 +1,110 @@
+"""
+Multithreaded application of linear operators.
+
+Linear operators with a natural partition of their computations, such as sums, Kronecker products or operators defined
+via (user-defined) matrix-vector products, can dispatch the partitions to a pool of threads. This is beneficial
+whenever the partitions release the global interpreter lock, as is the case for most NumPy and SciPy linear algebra
+routines. By default linear operators are applied sequentially. The number of threads can be set per linear operator
+via its ``num_threads`` attribute or for all linear operators within a :func:`parallel_execution` context.
+"""
+import concurrent.futures
+import contextlib
+import threading
+
+import numpy as np
+
+_thread_state = threading.local()
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def parallel_execution(num_threads):
+    """
+    Context manager setting the default number of threads used to apply linear operators.
+
+    Linear operators whose ``num_threads`` attribute is not set explicitly use this default. Linear operators applied
+    within a thread of the pool are always applied sequentially to avoid nested parallelism.
+
+    Parameters
+    ----------
+    num_threads : int
+        Default number of threads.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import Kronecker, parallel_execution
+    >>> A = Kronecker(A=np.eye(3), B=2 * np.eye(3))
+    >>> with parallel_execution(num_threads=2):
+    ...     A.num_threads
+    ...     A @ np.ones(9)
+    2
+    array([2., 2., 2., 2., 2., 2., 2., 2., 2.])
+    >>> A.num_threads
+    1
+    """
+    _check_num_threads(num_threads)
+    previous = _get_default_num_threads()
+    _thread_state.num_threads = num_threads
+    try:
+        yield
+    finally:
+        _thread_state.num_threads = previous
+
+
+def _check_num_threads(num_threads):
+    if not isinstance(num_threads, (int, np.integer)) or num_threads < 1:
+        raise ValueError("The number of threads must be a positive integer.")
+
+
+def _get_default_num_threads():
+    """Default number of threads in the current thread."""
+    return getattr(_thread_state, "num_threads", 1)
+
+
+def _mark_worker_thread():
+    """Initializer of worker threads, which disables nested parallelism."""
+    _thread_state.is_worker = True
+    _thread_state.num_threads = 1
+
+
+def _get_executor(num_threads):
+    """Thread pool with the given number of threads, which is reused across calls."""
+    with _executors_lock:
+        if num_threads not in _executors:
+            _executors[num_threads] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=num_threads, initializer=_mark_worker_thread
+            )
+        return _executors[num_threads]
+
+
+def _partition(n, num_parts):
+    """Partition ``range(n)`` into at most ``num_parts`` contiguous slices of (almost) equal size."""
+    num_parts = max(1, min(num_parts, n))
+    bounds = np.linspace(0, n, num_parts + 1).astype(int)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _map_partitions(fun, partitions, num_threads):
+    """Apply a function to all partitions, in parallel if more than one thread is requested."""
+    if (
+        num_threads <= 1
+        or len(partitions) <= 1
+        or getattr(_thread_state, "is_worker", False)
+    ):
+        return [fun(partition) for partition in partitions]
+    return list(_get_executor(num_threads).map(fun, partitions))
+
+
+def _parallel_matmat(matmat, X, num_threads):
+    """Apply a matrix-matrix product to blocks of columns of ``X`` in parallel."""
+    if num_threads <= 1 or X.shape[1] <= 1:
+        return matmat(X)
+    return np.hstack(
+        _map_partitions(
+            lambda cols: matmat(X[:, cols]),
+            _partition(X.shape[1], num_threads),
+            num_threads,
+        )
+    )
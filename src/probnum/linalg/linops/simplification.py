@@ -0,0 +1,450 @@
+"""
+Algebraic simplification of linear operators.
+
+Arithmetic with linear operators builds expression trees of binary sums, products and scalings. Applying such a tree
+requires a traversal of all its nodes. This module rewrites expression trees into a flat normal form consisting of
+n-ary linear combinations and operator chains, where scalars are folded into coefficients and scalar multiples of the
+identity are combined. Explicit simplification additionally combines dense matrices and low-rank updates.
+"""
+import numpy as np
+import scipy.sparse
+
+from probnum.linalg.linops.linearoperators import (
+    LinearOperator,
+    ScalarMult,
+    Identity,
+    MatrixMult,
+    SparseMatrixMult,
+    aslinop,
+    _SumLinearOperator,
+    _ProductLinearOperator,
+    _ScaledLinearOperator,
+    _PowerLinearOperator,
+    _TransposedLinearOperator,
+)
+from probnum.linalg.linops.lowrank import LowRankUpdate
+from probnum.linalg.linops.parallel import _map_partitions
+
+
+class _LinearCombination(LinearOperator):
+    """
+    Linear combination :math:`\\sum_{i=1}^k c_i A_i` of linear operators.
+
+    Parameters
+    ----------
+    terms : list of LinearOperator
+        Linear operators :math:`A_i` of identical shape.
+    coefficients : list of scalars
+        Coefficients :math:`c_i`.
+    dtype : dtype
+        Data type of the operator.
+    """
+
+    def __init__(self, terms, coefficients, dtype=None):
+        self.terms = tuple(terms)
+        self.coefficients = tuple(coefficients)
+        if dtype is None:
+            dtype = np.result_type(
+                *[term.dtype for term in self.terms], *self.coefficients
+            )
+        super().__init__(dtype=dtype, shape=self.terms[0].shape)
+
+    def _combine(self, results):
+        y = None
+        for coefficient, res in zip(self.coefficients, results):
+            if coefficient != 1:
+                res = coefficient * res
+            y = res if y is None else y + res
+        return y
+
+    def _apply_terms(self, apply_term):
+        """Apply all terms, in parallel if more than one thread is used."""
+        return self._combine(
+            _map_partitions(apply_term, self.terms, num_threads=self.num_threads)
+        )
+
+    def _matvec(self, x):
+        return self._apply_terms(lambda term: term.matvec(x))
+
+    def _matmat(self, X):
+        return self._apply_terms(lambda term: term.matmat(X))
+
+    def _transpose(self):
+        return _LinearCombination(
+            terms=[term.T for term in self.terms],
+            coefficients=self.coefficients,
+            dtype=self.dtype,
+        )
+
+    def _adjoint(self):
+        return _LinearCombination(
+            terms=[term.H for term in self.terms],
+            coefficients=np.conj(self.coefficients),
+            dtype=self.dtype,
+        )
+
+    def todense(self):
+        return self._combine(term.todense() for term in self.terms)
+
+    def inv(self):
+        if len(self.terms) == 1:
+            return _LinearCombination(
+                terms=[self.terms[0].inv()],
+                coefficients=[1 / self.coefficients[0]],
+                dtype=self.dtype,
+            )
+        raise NotImplementedError
+
+    # Properties
+    def trace(self):
+        return self._combine(term.trace() for term in self.terms)
+
+    def diagonal(self):
+        return self._combine(term.diagonal() for term in self.terms)
+
+    def det(self):
+        if len(self.terms) == 1:
+            return self.coefficients[0] ** self.shape[0] * self.terms[0].det()
+        raise NotImplementedError
+
+    def logabsdet(self):
+        if len(self.terms) == 1:
+            return (
+                self.shape[0] * np.log(np.abs(self.coefficients[0]))
+                + self.terms[0].logabsdet()
+            )
+        raise NotImplementedError
+
+
+class _OperatorChain(LinearOperator):
+    """
+    Scaled product :math:`c A_1 A_2 \\cdots A_k` of linear operators.
+
+    Parameters
+    ----------
+    factors : list of LinearOperator
+        Linear operators :math:`A_i` with matching inner dimensions.
+    coefficient : scalar
+        Coefficient :math:`c`.
+    dtype : dtype
+        Data type of the operator.
+    """
+
+    def __init__(self, factors, coefficient=1, dtype=None):
+        self.factors = tuple(factors)
+        self.coefficient = coefficient
+        if dtype is None:
+            dtype = np.result_type(
+                *[factor.dtype for factor in self.factors], self.coefficient
+            )
+        super().__init__(
+            dtype=dtype, shape=(self.factors[0].shape[0], self.factors[-1].shape[1])
+        )
+
+    def _apply(self, X, apply_factor):
+        for factor in reversed(self.factors):
+            X = apply_factor(factor, X)
+        if self.coefficient != 1:
+            X = self.coefficient * X
+        return X
+
+    def _matvec(self, x):
+        return self._apply(x, lambda factor, y: factor.matvec(y))
+
+    def _matmat(self, X):
+        return self._apply(X, lambda factor, Y: factor.matmat(Y))
+
+    def _transpose(self):
+        return _OperatorChain(
+            factors=[factor.T for factor in reversed(self.factors)],
+            coefficient=self.coefficient,
+            dtype=self.dtype,
+        )
+
+    def _adjoint(self):
+        return _OperatorChain(
+            factors=[factor.H for factor in reversed(self.factors)],
+            coefficient=np.conj(self.coefficient),
+            dtype=self.dtype,
+        )
+
+    def todense(self):
+        return self._apply(
+            np.eye(self.shape[1], dtype=self.dtype),
+            lambda factor, Y: factor.todense() @ Y,
+        )
+
+    def _square_factors(self):
+        return all(factor.shape[0] == factor.shape[1] for factor in self.factors)
+
+    def inv(self):
+        if not self._square_factors():
+            raise NotImplementedError
+        return _OperatorChain(
+            factors=[factor.inv() for factor in reversed(self.factors)],
+            coefficient=1 / self.coefficient,
+            dtype=self.dtype,
+        )
+
+    # Properties
+    def det(self):
+        if not self._square_factors():
+            raise NotImplementedError
+        return self.coefficient ** self.shape[0] * np.prod(
+            [factor.det() for factor in self.factors]
+        )
+
+    def logabsdet(self):
+        if not self._square_factors():
+            raise NotImplementedError
+        return self.shape[0] * np.log(np.abs(self.coefficient)) + np.sum(
+            [factor.logabsdet() for factor in self.factors]
+        )
+
+
+def _is_dense(A):
+    """Check whether a linear operator is given by a dense matrix."""
+    return isinstance(A, MatrixMult) and isinstance(A.A, np.ndarray)
+
+
+def _is_sparse(A):
+    """Check whether a linear operator is given by a sparse matrix."""
+    return isinstance(A, MatrixMult) and isinstance(A.A, scipy.sparse.spmatrix)
+
+
+def _cached_plan(A, fuse):
+    """
+    Cached application plan of a linear operator or the operator itself.
+
+    Plans only reference the operands of the expression tree and are reused when flattening. Explicit simplification
+    combines matrices and therefore always starts from the original expression tree.
+    """
+    if fuse:
+        return A
+    return A.__dict__.get("_simplified", A)
+
+
+def _simplify(A, fuse=True):
+    """
+    Rewrite a linear operator into normal form.
+
+    If ``fuse`` is false, sums and products are only flattened, such that the result references the operands of the
+    expression tree instead of combining their matrices.
+    """
+    A = _cached_plan(A, fuse)
+    if isinstance(A, (_SumLinearOperator, _ScaledLinearOperator)):
+        return _combine_terms(_terms(A, fuse), shape=A.shape, dtype=A.dtype, fuse=fuse)
+    elif isinstance(A, (_ProductLinearOperator, _PowerLinearOperator)):
+        coefficient, factors = _factors(A, fuse)
+        return _combine_factors(
+            coefficient, factors, shape=A.shape, dtype=A.dtype, fuse=fuse
+        )
+    elif isinstance(A, _TransposedLinearOperator):
+        simplified = _simplify(A.A, fuse)
+        return A if simplified is A.A else simplified.T
+    return A
+
+
+def _terms(A, fuse):
+    """Expand a linear operator into a flat list of (coefficient, term) pairs."""
+    A = _cached_plan(A, fuse)
+    if isinstance(A, _SumLinearOperator):
+        return _terms(A.args[0], fuse) + _terms(A.args[1], fuse)
+    elif isinstance(A, _ScaledLinearOperator):
+        B, alpha = A.args
+        return [(alpha * coefficient, term) for coefficient, term in _terms(B, fuse)]
+
+    A = _simplify(A, fuse)
+    if isinstance(A, _LinearCombination):
+        return list(zip(A.coefficients, A.terms))
+    elif isinstance(A, _OperatorChain) and A.coefficient != 1:
+        return [(A.coefficient, _OperatorChain(factors=A.factors, dtype=A.dtype))]
+    return [(1, A)]
+
+
+def _factors(A, fuse):
+    """Expand a linear operator into a coefficient and a flat list of factors."""
+    A = _cached_plan(A, fuse)
+    if isinstance(A, _ProductLinearOperator):
+        coefficient0, factors0 = _factors(A.args[0], fuse)
+        coefficient1, factors1 = _factors(A.args[1], fuse)
+        return coefficient0 * coefficient1, factors0 + factors1
+    elif isinstance(A, _PowerLinearOperator):
+        B, p = A.args
+        coefficient, factors = _factors(B, fuse)
+        return coefficient ** p, factors * p
+
+    A = _simplify(A, fuse)
+    if isinstance(A, _OperatorChain):
+        return A.coefficient, list(A.factors)
+    elif isinstance(A, ScalarMult):
+        return A.scalar, []
+    elif isinstance(A, _LinearCombination) and len(A.terms) == 1:
+        coefficient, factors = _factors(A.terms[0], fuse)
+        return A.coefficients[0] * coefficient, factors
+    return 1, [A]
+
+
+def _combine_terms(terms, shape, dtype, fuse):
+    """Combine a list of (coefficient, term) pairs into a linear combination."""
+    if len(terms) == 1 and terms[0][0] == 1:
+        return terms[0][1]
+
+    # Low-rank updates are merged into a single update of the sum of all remaining terms
+    lowrank_terms = [(c, term) for c, term in terms if isinstance(term, LowRankUpdate)]
+    if fuse and len(lowrank_terms) > 0:
+        remaining_terms = [
+            (c, term) for c, term in terms if not isinstance(term, LowRankUpdate)
+        ]
+        remaining_terms += [(c, term.A) for c, term in lowrank_terms]
+        return LowRankUpdate(
+            A=_combine_terms(remaining_terms, shape=shape, dtype=dtype, fuse=fuse),
+            U=np.hstack([c * term.U for c, term in lowrank_terms]),
+            V=np.hstack([term.V for _, term in lowrank_terms]),
+        )
+
+    # Scalar multiples of the identity are summed explicitly, as are dense and sparse matrices if they are fused
+    scalar = None
+    dense = None
+    sparse = None
+    other_terms = []
+    for c, term in terms:
+        if isinstance(term, ScalarMult):
+            scalar = c * term.scalar if scalar is None else scalar + c * term.scalar
+        elif fuse and _is_dense(term):
+            dense = c * term.A if dense is None else dense + c * term.A
+        elif fuse and _is_sparse(term):
+            sparse = c * term.A if sparse is None else sparse + c * term.A
+        else:
+            # Repeated occurrences of the same operator only need to be applied once
+            for i, (c_other, term_other) in enumerate(other_terms):
+                if term_other is term:
+                    other_terms[i] = (c_other + c, term)
+                    break
+            else:
+                other_terms.append((c, term))
+
+    combined_terms = []
+    if dense is not None:
+        if scalar is not None:
+            dense = dense + scalar * np.eye(*shape)
+            scalar = None
+        combined_terms.append((1, MatrixMult(A=dense)))
+    if sparse is not None:
+        combined_terms.append((1, SparseMatrixMult(A=sparse)))
+    if scalar is not None:
+        if scalar == 1 and shape[0] == shape[1]:
+            combined_terms.append((1, Identity(shape=shape)))
+        else:
+            combined_terms.append((1, ScalarMult(shape=shape, scalar=scalar)))
+    combined_terms += other_terms
+
+    if len(combined_terms) == 1 and combined_terms[0][0] == 1:
+        return combined_terms[0][1]
+    return _LinearCombination(
+        terms=[term for _, term in combined_terms],
+        coefficients=[c for c, _ in combined_terms],
+        dtype=dtype,
+    )
+
+
+def _fuse_factors(A, B):
+    """Multiply two adjacent factors explicitly if this does not increase storage, otherwise return ``None``."""
+    m, k = A.shape
+    n = B.shape[1]
+    if m * n > m * k + k * n:
+        return None
+    if _is_dense(A) and _is_dense(B):
+        return MatrixMult(A=A.A @ B.A)
+    elif _is_dense(A) and isinstance(B, LowRankUpdate) and _is_dense(B.A):
+        return LowRankUpdate(A=A.A @ B.A.A, U=A.A @ B.U, V=B.V)
+    elif isinstance(A, LowRankUpdate) and _is_dense(A.A) and _is_dense(B):
+        return LowRankUpdate(A=A.A.A @ B.A, U=A.U, V=B.A.T @ A.V)
+    return None
+
+
+def _combine_factors(coefficient, factors, shape, dtype, fuse):
+    """Combine a coefficient and a list of factors into an operator chain."""
+    fused_factors = []
+    for factor in factors:
+        fused = (
+            _fuse_factors(fused_factors[-1], factor) if fuse and fused_factors else None
+        )
+        if fused is None:
+            fused_factors.append(factor)
+        else:
+            fused_factors[-1] = fused
+
+    if len(fused_factors) == 0:
+        if coefficient == 1 and shape[0] == shape[1]:
+            return Identity(shape=shape)
+        return ScalarMult(shape=shape, scalar=coefficient)
+
+    # Fold the coefficient into a dense factor
+    if fuse and coefficient != 1:
+        for i, factor in enumerate(fused_factors):
+            if _is_dense(factor):
+                fused_factors[i] = MatrixMult(A=coefficient * factor.A)
+                coefficient = 1
+                break
+
+    if len(fused_factors) == 1:
+        if coefficient == 1:
+            return fused_factors[0]
+        return _LinearCombination(
+            terms=fused_factors, coefficients=[coefficient], dtype=dtype
+        )
+    return _OperatorChain(factors=fused_factors, coefficient=coefficient, dtype=dtype)
+
+
+def simplify(A):
+    """
+    Simplify a linear operator.
+
+    Rewrites the expression tree of a linear operator resulting from linear operator arithmetic into an equivalent
+    linear operator which is cheaper to apply. Nested sums are flattened into a single linear combination and nested
+    products into a single chain of factors, where scalars are folded into the coefficients. Scalar multiples of the
+    identity, dense matrices and low-rank updates in a sum are combined into single terms. Adjacent dense and low-rank
+    factors in a product are multiplied explicitly if this does not increase the memory footprint.
+
+    Since matrices are combined explicitly, the simplified operator does not reflect later (in-place) changes of the
+    operands of ``A``. Sums, products, scalings and powers of linear operators are flattened automatically on their
+    first application to a vector, without combining matrices, such that they keep referencing their operands.
+
+    Parameters
+    ----------
+    A : array-like or LinearOperator
+        Linear operator to simplify.
+
+    Returns
+    -------
+    simplified : LinearOperator
+        Simplified linear operator.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.linalg.linops import MatrixMult, Identity, simplify
+    >>> A = MatrixMult(np.array([[1., 2.], [3., 4.]]))
+    >>> Op = 2 * A - Identity(2) + 0.5 * (A + A)
+    >>> simplify(Op)
+    <2x2 MatrixMult with dtype=float64>
+    >>> simplify(Op).todense()
+    array([[ 2.,  6.],
+           [ 9., 11.]])
+    """
+    return _simplify(aslinop(A))
+
+
+def _application_plan(A):
+    """
+    Flattened expression tree of a linear operator used for its application.
+
+    Nested sums and products are flattened and scalars folded into coefficients, but matrices are not combined, such
+    that the plan references the operands of ``A`` and remains valid if they change. The plan is cached on ``A``.
+    """
+    try:
+        return A._simplified
+    except AttributeError:
+        A._simplified = _simplify(A, fuse=False)
+        return A._simplified
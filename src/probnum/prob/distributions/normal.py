@@ -99,7 +99,7 @@ class Normal(Distribution):
     def __init__(self, mean=0.0, cov=1.0, random_state=None):
         super().__init__(
             parameters={"mean": mean, "cov": cov},
-            dtype=float,
+            dtype=_get_dtype(mean, cov),
             random_state=random_state,
         )
 
@@ -291,6 +291,24 @@ class Normal(Distribution):
             return NotImplemented
 
 
+def _get_dtype(mean, cov):
+    """
+    Floating point data type of a normal distribution with the given parameters.
+
+    Single precision parameters result in a single precision distribution, all other parameters in a double precision
+    distribution.
+    """
+    dtype = np.result_type(
+        *[
+            param.dtype if hasattr(param, "dtype") else np.asarray(param).dtype
+            for param in (mean, cov)
+        ]
+    )
+    if not np.issubdtype(dtype, np.inexact):
+        dtype = np.dtype(float)
+    return dtype
+
+
 def _both_are_univariate(mean, cov):
     """
     Checks whether mean and kernels correspond to the
@@ -405,29 +423,54 @@ class _MultivariateNormal(Normal):
             )
         super().__init__(mean=mean, cov=cov, random_state=random_state)
 
+        # Factorizations of the covariance are computed once on first use
+        self._frozen_dist = None
+        self._cov_sqrtm = None
+
+    def _get_frozen_dist(self):
+        """Frozen scipy distribution, which stores a factorization of the covariance."""
+        if self._frozen_dist is None:
+            self._frozen_dist = scipy.stats.multivariate_normal(
+                mean=self.mean(), cov=self.cov()
+            )
+        return self._frozen_dist
+
+    def _get_cov_sqrtm(self):
+        """Square root of the covariance computed via a singular value decomposition as in numpy."""
+        if self._cov_sqrtm is None:
+            _, s, vh = np.linalg.svd(np.asarray(self.cov(), dtype=float))
+            self._cov_sqrtm = np.sqrt(s)[:, None] * vh
+        return self._cov_sqrtm
+
     def var(self):
         return np.diag(self.cov())
 
     def pdf(self, x):
-        return scipy.stats.multivariate_normal.pdf(x, mean=self.mean(), cov=self.cov())
+        return self._get_frozen_dist().pdf(x)
 
     def logpdf(self, x):
-        return scipy.stats.multivariate_normal.logpdf(
-            x, mean=self.mean(), cov=self.cov()
-        )
+        return self._get_frozen_dist().logpdf(x)
 
     def cdf(self, x):
-        return scipy.stats.multivariate_normal.cdf(x, mean=self.mean(), cov=self.cov())
+        return self._get_frozen_dist().cdf(x)
 
     def logcdf(self, x):
-        return scipy.stats.multivariate_normal.logcdf(
-            x, mean=self.mean(), cov=self.cov()
-        )
+        return self._get_frozen_dist().logcdf(x)
 
     def sample(self, size=()):
-        return scipy.stats.multivariate_normal.rvs(
-            mean=self.mean(), cov=self.cov(), size=size, random_state=self.random_state
-        )
+        if isinstance(size, (int, np.integer)):
+            size = [size]
+        mean = np.asarray(self.mean(), dtype=float).ravel()
+        final_shape = list(size) + [mean.shape[0]]
+
+        # Scale and shift standard normal samples (equivalent to numpy's multivariate normal sampling)
+        stdnormal_samples = self.random_state.standard_normal(final_shape)
+        samples = stdnormal_samples.reshape(-1, mean.shape[0]) @ self._get_cov_sqrtm()
+        samples += mean
+        samples = samples.reshape(final_shape).squeeze()
+        if samples.ndim == 0:
+            samples = samples[()]
+        return samples
 
     def reshape(self, newshape):
         raise NotImplementedError
@@ -644,6 +687,7 @@ class _SymmetricKroneckerIdenticalFactorsNormal(_OperatorvariateNormal):
         _check_shapes_if_symmetric_kronecker(mean, cov)
         self._n = mean.shape[1]
         super().__init__(mean=mean, cov=cov, random_state=random_state)
+        self._cov_cholesky = None
 
     def sample(self, size=()):
 
@@ -655,11 +699,13 @@ class _SymmetricKroneckerIdenticalFactorsNormal(_OperatorvariateNormal):
             size=size_sample, random_state=self.random_state
         )
 
-        # Cholesky decomposition
-        eps = 10 ** -12  # damping needed to avoid negative definite covariances
-        cholA = scipy.linalg.cholesky(
-            self.cov().A.todense() + eps * np.eye(self._n), lower=True
-        )
+        # Cholesky decomposition (computed once)
+        if self._cov_cholesky is None:
+            eps = 10 ** -12  # damping needed to avoid negative definite covariances
+            self._cov_cholesky = scipy.linalg.cholesky(
+                self.cov().A.todense() + eps * np.eye(self._n), lower=True
+            )
+        cholA = self._cov_cholesky
 
         # Scale and shift
         # TODO: can we avoid todense here and just return operator samples?
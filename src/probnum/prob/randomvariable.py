@@ -324,6 +324,36 @@ class RandomVariable:
         )
 
 
+class _LazyRandomVariable(RandomVariable):
+    """
+    Random variable whose distribution is only constructed once it is accessed.
+
+    Used by iterative methods to pass intermediate random variables to callbacks without constructing them in every
+    iteration.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of realizations of this random variable.
+    dtype : numpy.dtype or object
+        Data type of realizations of this random variable.
+    distribution_factory : callable
+        Function without arguments returning the distribution of the random variable.
+    """
+
+    def __init__(self, shape, dtype, distribution_factory):
+        self._shape = shape
+        self._dtype = np.dtype(dtype)
+        self._distribution_factory = distribution_factory
+        self._lazy_distribution = None
+
+    @property
+    def _distribution(self):
+        if self._lazy_distribution is None:
+            self._lazy_distribution = self._distribution_factory()
+        return self._lazy_distribution
+
+
 def asrandvar(obj):
     """
     Return ``obj`` as a :class:`RandomVariable`.
@@ -3,6 +3,9 @@
 import unittest
 from tests.testing import NumpyAssertions
 import os
+import importlib.util
+from unittest import mock
+import tempfile
 
 import numpy as np
 import scipy.sparse
@@ -11,6 +14,10 @@ import scipy.sparse.linalg
 from probnum import prob
 from probnum import linalg
 from probnum.linalg import linops
+from probnum.linalg.linearsolvers.matrixbased import _RandomMatvecOracle
+
+# GPy is an optional dependency only required for the "gpkern" calibration
+GPY_AVAILABLE = importlib.util.find_spec("GPy") is not None
 
 
 class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
@@ -203,6 +210,33 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                     + " not match scipy.sparse.linalg.spsolve.",
                 )
 
+    def test_single_and_mixed_precision(self):
+        """Solver iterations in single and mixed precision."""
+        np.random.seed(42)
+        n = 40
+        A = np.random.rand(n, n)
+        A = 0.5 * (A + A.T) + n * np.eye(n)
+        x_true = np.random.normal(size=(n,))
+        b = A @ x_true
+
+        x, _, Ainv, _ = linalg.problinsolve(A=A, b=b, precision="single")
+        self.assertEqual(x.mean().dtype, np.float32)
+        self.assertEqual(Ainv.mean().dtype, np.float32)
+        self.assertAllClose(x.mean(), x_true, rtol=1e-4, atol=1e-4)
+
+        x, _, _, info = linalg.problinsolve(
+            A=A, b=b, precision="mixed", atol=10 ** -10, rtol=10 ** -10
+        )
+        self.assertEqual(x.mean().dtype, np.float64)
+        self.assertGreater(info["refinement_steps"], 1)
+        self.assertLessEqual(
+            np.linalg.norm(A @ x.mean() - b), 10 ** -10 * np.linalg.norm(b)
+        )
+        self.assertAllClose(x.mean(), x_true, rtol=1e-8, atol=1e-8)
+
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=A, b=b, precision="half")
+
     def test_residual_matches_error(self):
         """Test whether the residual norm matches the error of the computed solution estimate."""
         A, b, x_true = self.rbf_kernel_linear_system
@@ -237,7 +271,7 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         """
         A, b, x_true = self.rbf_kernel_linear_system
 
-        for calibrate in [False, 0.0, 0.00000001, 2.8]:
+        for calibrate in [False, 0.0, 0.0001, 2.8]:
             with self.subTest():
                 # Define callback function to obtain search directions
                 S = []  # search directions
@@ -421,8 +455,10 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         """The solver's returned value for the trace must match the actual trace of the solution covariance."""
         A, b, x_true = self.rbf_kernel_linear_system
 
-        for calib_method in [None, 0, 1.0, "adhoc", "weightedmean", "gpkern"]:
-            with self.subTest():
+        for calib_method in [None, 0, 1.0, "adhoc", "weightedmean", "lstsq", "gpkern"]:
+            with self.subTest(calibration=calib_method):
+                if calib_method == "gpkern" and not GPY_AVAILABLE:
+                    self.skipTest("GPy is not installed.")
                 x_est, Ahat, Ainvhat, info = linalg.problinsolve(
                     A=A, b=b, calibration=calib_method
                 )
@@ -432,13 +468,50 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                     msg="Iteratively computed trace not equal to trace of solution covariance.",
                 )
 
+    def test_uncertainty_calibration_on_termination(self):
+        """Uncertainty is calibrated once on termination unless the callback accesses the output random variables."""
+        A, b, x_true = self.rbf_kernel_linear_system
+        solver = linalg.SymmetricMatrixBasedSolver
+        with mock.patch.object(
+            solver,
+            "_calibrate_uncertainty",
+            autospec=True,
+            side_effect=solver._calibrate_uncertainty,
+        ) as calibrate:
+            linalg.problinsolve(
+                A=A, b=b, calibration="lstsq", callback=lambda **kwargs: None
+            )
+            self.assertEqual(calibrate.call_count, 1)
+
+            calibrate.reset_mock()
+            traces = []
+            _, _, _, info = linalg.problinsolve(
+                A=A,
+                b=b,
+                calibration="lstsq",
+                callback=lambda xk, **kwargs: traces.append(xk.cov().trace()),
+            )
+            self.assertEqual(calibrate.call_count, info["iter"] + 1)
+            self.assertAlmostEqual(traces[-1], info["trace_sol_cov"])
+
+    def test_uncertainty_calibration_without_gpy(self):
+        """The native calibration does not require GPy."""
+        A, b, x_true = self.rbf_kernel_linear_system
+        with mock.patch.dict("sys.modules", {"GPy": None}):
+            x_est, _, _, _ = linalg.problinsolve(A=A, b=b, calibration="lstsq")
+            self.assertGreater(x_est.cov().trace(), 0)
+            with self.assertRaises(ImportError):
+                linalg.problinsolve(A=A, b=b, calibration="gpkern")
+
     def test_uncertainty_calibration_error(self):
         """Test if the available uncertainty calibration procedures affect the error of the returned solution."""
         tol = 10 ** -6
         A, b, x_true = self.rbf_kernel_linear_system
 
-        for calib_method in [None, 0, "adhoc", "weightedmean", "gpkern"]:
-            with self.subTest():
+        for calib_method in [None, 0, "adhoc", "weightedmean", "lstsq", "gpkern"]:
+            with self.subTest(calibration=calib_method):
+                if calib_method == "gpkern" and not GPY_AVAILABLE:
+                    self.skipTest("GPy is not installed.")
                 x_est, Ahat, Ainvhat, info = linalg.problinsolve(
                     A=A, b=b, calibration=calib_method
                 )
@@ -516,3 +589,592 @@ class MatrixBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                 # Positive definiteness
                 self.assertTrue(np.all(np.linalg.eigvals(Ainv0_mean_dense) > 0))
                 self.assertTrue(np.all(np.linalg.eigvals(A0_mean_dense) > 0))
+
+    def test_krylov_workspace(self):
+        """The workspace provides views of the search directions and observations collected by the solver."""
+        A, b = self.poisson_linear_system
+        searchdirs = []
+        obs = []
+
+        def callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+            searchdirs.append(np.ravel(sk))
+            obs.append(np.ravel(yk))
+
+        smbs = linalg.SymmetricMatrixBasedSolver(A=A, b=b[:, None])
+        smbs.solve(callback=callback, maxiter=10, atol=10 ** -6, rtol=10 ** -6)
+        workspace = smbs.workspace
+
+        self.assertEqual(workspace.size, len(searchdirs))
+        self.assertEqual(workspace.capacity, 10)
+        self.assertAllClose(workspace.search_dirs, np.array(searchdirs).T)
+        self.assertAllClose(workspace.observations, np.array(obs).T)
+        self.assertAllClose(
+            workspace.inner_products,
+            np.einsum("ij,ij->j", workspace.search_dirs, workspace.observations),
+        )
+        self.assertTrue(np.shares_memory(workspace.search_dirs, workspace._S))
+
+        # Storage grows beyond its initial capacity
+        workspace.append(s=b, y=A @ b, sy=b @ (A @ b))
+        self.assertEqual(workspace.size, len(searchdirs) + 1)
+        self.assertAllClose(workspace.search_dirs[:, :-1], np.array(searchdirs).T)
+        self.assertAllClose(workspace.search_dirs[:, -1], b)
+
+    def test_posterior_storage_grows_on_demand(self):
+        """Storage for the posterior iterates is not preallocated for the maximum number of iterations."""
+        n = 20000
+        A = scipy.sparse.diags(np.tile([1.0, 2.0, 3.0], n // 3 + 1)[:n])
+        b = np.ones((n, 1))
+        smbs = linalg.SymmetricMatrixBasedSolver(A=A, b=b)
+        x, _, _, info = smbs.solve(maxiter=10 * n, atol=10 ** -6, rtol=10 ** -6)
+        self.assertAllClose(x.mean(), scipy.sparse.linalg.spsolve(A, b[:, 0]))
+        self.assertLess(info["iter"], 10)
+        for linop in [smbs.A_mean, smbs.Ainv_mean, smbs.A_covfactor]:
+            self.assertLess(linop._buffer.capacity, 100)
+        self.assertLess(smbs.workspace.capacity, 100)
+
+    def test_incremental_calibration_factors(self):
+        """Factorizations used for uncertainty calibration agree with the search directions and observations."""
+        A, b = self.poisson_linear_system
+        x0 = np.ones_like(b)
+        smbs = linalg.SymmetricMatrixBasedSolver(A=A, b=b[:, None], x0=x0[:, None])
+        smbs.solve(maxiter=10, calibration=2.0, atol=10 ** -6, rtol=10 ** -6)
+        S = smbs.workspace.search_dirs
+        Y = smbs.workspace.observations
+
+        # QR factorization of the search directions
+        Q = smbs.S_factor.basis(S)
+        self.assertAllClose(Q @ smbs.S_factor.R, S, atol=10 ** -12)
+        self.assertAllClose(Q.T @ Q, np.eye(S.shape[1]), atol=10 ** -12)
+
+        # Cholesky factorization of the Gram matrix Y'H0Y
+        H0Y = smbs.Ainv_mean0 @ Y
+        L = smbs.Ainv_gram_factor.L
+        self.assertAllClose(L, np.tril(L))
+        self.assertAllClose(L @ L.T, Y.T @ H0Y, rtol=10 ** -10, atol=10 ** -12)
+        self.assertApproxEqual(
+            smbs.Ainv_gram_factor.trace(Y),
+            np.trace(H0Y @ np.linalg.solve(Y.T @ H0Y, H0Y.T)),
+            significant=8,
+        )
+
+    def test_block_solver_multiple_rhs(self):
+        """The block solver observes one block per iteration and its posterior is consistent with all observations."""
+        np.random.seed(1)
+        n = 30
+        M = np.random.normal(size=(n, n))
+        A = M @ M.T + n * np.eye(n)
+        B = np.random.normal(size=(n, 4))
+        S = []
+        Y = []
+
+        def callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+            S.append(sk)
+            Y.append(yk)
+
+        x, Ahat, Ainvhat, info = linalg.problinsolve(
+            A=A, b=B, callback=callback, maxiter=3
+        )
+        S = np.hstack(S)
+        Y = np.hstack(Y)
+
+        self.assertEqual(x.shape, B.shape)
+        self.assertEqual(info["iter"], 3)
+        self.assertEqual(S.shape[1], 12)
+        self.assertAllClose(S.T @ A @ S, np.eye(12), atol=1e-8)
+        self.assertAllClose(Ahat.mean() @ S, Y)
+        self.assertAllClose(Ainvhat.mean() @ Y, S)
+        self.assertAllClose(Ainvhat.cov().A @ Y, np.zeros_like(Y), atol=1e-10)
+        self.assertAllClose(Ahat.mean().todense(), Ahat.mean().todense().T, atol=1e-10)
+
+        # Convergence to the solution
+        x, _, _, info = linalg.problinsolve(A=A, b=B)
+        self.assertLessEqual(info["iter"], n)
+        self.assertAllClose(x.mean(), np.linalg.solve(A, B), rtol=1e-6, atol=1e-8)
+
+    def test_block_solver_storage_grows_on_demand(self):
+        """The block solver does not preallocate storage for the maximum number of iterations."""
+        n = 20000
+        A = scipy.sparse.diags(np.tile([1.0, 2.0, 3.0], n // 3 + 1)[:n])
+        B = np.column_stack((np.ones(n), np.arange(n) % 5))
+        solver = linalg.linearsolvers.BlockSymmetricMatrixBasedSolver(A=A, b=B)
+        x, _, _, info = solver.solve()
+        self.assertAllClose(x.mean(), B / A.diagonal()[:, None], atol=1e-12)
+        self.assertLess(info["iter"], 10)
+        for linop in [solver.A_mean, solver.Ainv_mean, solver.A_covfactor]:
+            self.assertLess(linop._buffer.capacity, 100)
+
+    def test_lazy_callback_randvars(self):
+        """Random variables passed to the callback are only constructed on access and reflect their iteration."""
+        A, b = self.poisson_linear_system
+        eager_means = []
+        lazy_randvars = []
+
+        def eager_callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+            eager_means.append((xk.mean(), Ak.mean().todense(), xk.cov().todense()))
+
+        def lazy_callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+            lazy_randvars.append((xk, Ak))
+
+        linalg.problinsolve(A=A, b=b, callback=eager_callback, maxiter=5)
+        linalg.problinsolve(A=A, b=b, callback=lazy_callback, maxiter=5)
+
+        self.assertEqual(len(eager_means), len(lazy_randvars))
+        for (x_mean, A_mean, x_cov), (xk, Ak) in zip(eager_means, lazy_randvars):
+            with self.subTest():
+                self.assertIsInstance(xk, prob.RandomVariable)
+                self.assertIsNone(xk._lazy_distribution)
+                self.assertEqual(xk.shape, (A.shape[0],))
+                self.assertAllClose(xk.mean(), x_mean)
+                self.assertAllClose(xk.cov().todense(), x_cov)
+                self.assertAllClose(Ak.mean().todense(), A_mean)
+
+    def test_recycled_subspace(self):
+        """Recycling deflates small eigenvalues of a sequence of slowly changing systems."""
+        np.random.seed(3)
+        n = 100
+        Q, _ = np.linalg.qr(np.random.normal(size=(n, n)))
+        eigvals = np.concatenate((np.logspace(-4, -2, 5), np.linspace(1, 2, n - 5)))
+        A = Q @ np.diag(eigvals) @ Q.T
+        recycle = linalg.RecycledSubspace(rank=8)
+
+        iters = []
+        for t in range(3):
+            At = A + 10 ** -4 * t * np.eye(n)
+            b = np.random.normal(size=n)
+            x, _, _, info = linalg.problinsolve(
+                A=At, b=b, recycle=recycle, atol=10 ** -8, rtol=10 ** -8
+            )
+            iters.append(info["iter"])
+            self.assertAllClose(x.mean(), np.linalg.solve(At, b), rtol=1e-5)
+            self.assertLessEqual(recycle.basis.shape[1], 8)
+
+        self.assertLess(max(iters[1:]), iters[0] / 2)
+
+        # Persisting the recycled subspace
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "recycle.npz")
+            recycle.save(fpath)
+            loaded = linalg.RecycledSubspace.load(fpath)
+        self.assertEqual(loaded.rank, recycle.rank)
+        self.assertAllClose(loaded.basis, recycle.basis)
+
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=A, b=b, Ainv0=np.eye(n), recycle=recycle)
+
+    def test_recycled_subspace_uncertainty(self):
+        """There is no uncertainty about the solution in the recycled subspace."""
+        rng = np.random.RandomState(3)
+        n = 20
+        Q, _ = np.linalg.qr(rng.normal(size=(n, n)))
+        eigvals = np.concatenate((np.logspace(-4, -2, 4), np.logspace(0, 2, n - 4)))
+        A = Q @ np.diag(eigvals) @ Q.T
+        recycle = linalg.RecycledSubspace(rank=4)
+
+        for t in range(3):
+            At = A + 10 ** -4 * t * np.eye(n)
+            if t > 0:
+                # Prior covariance factor of the inverse vanishes on the recycled subspace
+                _, Ainv0 = recycle.prior(At)
+                AU = At @ recycle.basis
+                self.assertAllClose(Ainv0.cov().A @ AU, np.zeros_like(AU), atol=1e-8)
+
+            # Solver explores the complement of the recycled subspace, hence the uncertainty matches the true error
+            b = rng.normal(size=n)
+            x, _, _, info = linalg.problinsolve(
+                A=At, b=b, recycle=recycle, atol=10 ** -12, rtol=10 ** -12
+            )
+            sqerr = np.linalg.norm(x.mean() - np.linalg.solve(At, b)) ** 2
+            self.assertLess(sqerr, 10 ** -10)
+            self.assertLess(info["trace_sol_cov"], 10 ** -10)
+
+
+class AsymmetricMatrixBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
+    """Tests the asymmetric matrix-based probabilistic linear solver."""
+
+    def setUp(self):
+        """Resources for tests."""
+        # Upwind discretization of a one-dimensional convection-diffusion equation
+        n = 50
+        h = 1 / (n + 1)
+        diffusion = 0.1
+        self.A = scipy.sparse.diags(
+            [
+                -diffusion / h ** 2 - 1 / h,
+                2 * diffusion / h ** 2 + 1 / h,
+                -diffusion / h ** 2 * np.ones(n - 1),
+            ],
+            [-1, 0, 1],
+            shape=(n, n),
+        ).tocsr()
+        self.b = np.random.RandomState(1).normal(size=n)
+        self.x_true = np.linalg.solve(self.A.toarray(), self.b)
+
+    def test_solution(self):
+        """The solver recovers the solution of a non-symmetric system with and without restarts."""
+        for assume_A, restart in [("gen", None), ("pos", 10)]:
+            with self.subTest():
+                x, A, Ainv, info = linalg.problinsolve(
+                    A=self.A,
+                    b=self.b,
+                    assume_A=assume_A,
+                    restart=restart,
+                    atol=10 ** -10,
+                    rtol=10 ** -10,
+                )
+                self.assertIsInstance(A.cov(), linops.Kronecker)
+                self.assertIsInstance(Ainv.cov(), linops.Kronecker)
+                self.assertEqual(info["restarts"] > 0, restart is not None)
+                self.assertAllClose(x.mean(), self.x_true, rtol=1e-7, atol=1e-7)
+
+    def test_storage_grows_on_demand(self):
+        """Without restarts storage is not preallocated for the maximum number of iterations."""
+        n = 20000
+        A = scipy.sparse.diags(np.tile([1.0, 2.0, 3.0], n // 3 + 1)[:n])
+        b = np.ones(n)
+        solver = linalg.AsymmetricMatrixBasedSolver(A=A, b=b)
+        x, _, _, info = solver.solve()
+        self.assertAllClose(x.mean(), scipy.sparse.linalg.spsolve(A, b))
+        self.assertLess(info["iter"], 10)
+        self.assertLess(solver.Ainv_mean._buffer.capacity, 100)
+        self.assertLess(solver.Ainv_covfactor._buffer.capacity, 100)
+        self.assertLess(solver.workspace.capacity, 100)
+
+    def test_posterior_mean_minimizes_residual(self):
+        """Without restarts the solution estimate minimizes the residual over the Krylov subspace (GMRES)."""
+        k = 5
+        x, _, _, _ = linalg.problinsolve(A=self.A, b=self.b, assume_A="gen", maxiter=k)
+
+        # Orthonormal basis of the Krylov subspace via the Arnoldi process
+        A = self.A.toarray()
+        r0 = self.b - A @ self.b
+        K = np.zeros((A.shape[0], k))
+        K[:, 0] = r0 / np.linalg.norm(r0)
+        for i in range(1, k):
+            v = A @ K[:, i - 1]
+            v = v - K[:, :i] @ (K[:, :i].T @ v)
+            K[:, i] = v / np.linalg.norm(v)
+        z = np.linalg.lstsq(A @ K, r0, rcond=None)[0]
+        self.assertAllClose(x.mean(), self.b + K @ z, rtol=1e-6, atol=1e-8)
+
+    def test_posterior_consistent_with_observations(self):
+        """The posterior means reproduce the observations and the covariances vanish in the observed directions."""
+        S = []
+        Y = []
+
+        def callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+            S.append(np.ravel(sk))
+            Y.append(np.ravel(yk))
+
+        x, A, Ainv, info = linalg.problinsolve(
+            A=self.A, b=self.b, assume_A="gen", maxiter=8, callback=callback
+        )
+        S = np.array(S).T
+        Y = np.array(Y).T
+
+        self.assertAllClose(Y, self.A @ S)
+        self.assertAllClose(Ainv.mean() @ Y, S)
+        self.assertAllClose(A.mean() @ S, Y)
+        self.assertAllClose(Ainv.cov().B @ Y, np.zeros_like(Y), atol=1e-10)
+        self.assertAllClose(A.cov().B @ S, np.zeros_like(S), atol=1e-10)
+        self.assertApproxEqual(
+            info["trace_sol_cov"], np.trace(x.cov().todense()), significant=7
+        )
+
+    def test_kronecker_prior(self):
+        """Priors with Kronecker covariance are used by the solver."""
+        n = self.A.shape[0]
+        V = np.diag(np.linspace(1, 2, n))
+        Ainv0 = prob.RandomVariable(
+            distribution=prob.Normal(
+                mean=linops.Identity(n), cov=linops.Kronecker(A=V, B=np.eye(n))
+            )
+        )
+        x, _, Ainv, _ = linalg.problinsolve(
+            A=self.A, b=self.b, Ainv0=Ainv0, assume_A="gen", maxiter=5
+        )
+        self.assertAllClose(Ainv.cov().A.todense(), V)
+        self.assertAllClose(x.cov().todense(), x.cov().todense()[0, 0] * V)
+
+
+class NoisySymmetricMatrixBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
+    """Tests the matrix-based probabilistic linear solver for noisy linear systems."""
+
+    def setUp(self):
+        """Resources for tests."""
+        self.rng = np.random.RandomState(42)
+        n = 30
+        B = self.rng.normal(size=(n, n))
+        self.A = B @ B.T / n + np.eye(n)
+        self.b = self.rng.normal(size=n)
+        self.x = np.linalg.solve(self.A, self.b)
+
+    def noisy_oracle(self, noise_std):
+        """Linear operator returning matrix-vector products with additive noise."""
+        return linops.LinearOperator(
+            shape=self.A.shape,
+            matvec=lambda v: self.A @ np.ravel(v)
+            + noise_std * self.rng.normal(size=self.A.shape[0]),
+        )
+
+    def test_exact_oracle_solution(self):
+        """Without noise the solver recovers the solution of the linear system."""
+        x, _, _, info = linalg.NoisySymmetricMatrixBasedSolver(
+            A=self.noisy_oracle(noise_std=0.0), b=self.b
+        ).solve(rtol=10 ** -8)
+        self.assertIn(info["conv_crit"], ["resid_atol", "resid_rtol"])
+        self.assertAllClose(x.mean(), self.x, rtol=10 ** -5)
+
+    def test_minibatch_averaging(self):
+        """Averaging mini-batches of noisy products estimates the noise and improves the solution."""
+        errors = []
+        for batch_size in [2, 64]:
+            with self.subTest(batch_size=batch_size):
+                x, _, _, info = linalg.NoisySymmetricMatrixBasedSolver(
+                    A=self.noisy_oracle(noise_std=10 ** -2), b=self.b
+                ).solve(batch_size=batch_size)
+                self.assertEqual(info["conv_crit"], "noise")
+                self.assertGreater(info["noise_scale"], 0.0)
+                errors.append(np.linalg.norm(x.mean() - self.x))
+        self.assertLess(errors[1], errors[0])
+        self.assertLess(errors[1], 10 ** -1 * np.linalg.norm(self.x))
+
+    def test_random_variable_oracle_noise(self):
+        """Noisy products with random linear operators follow the distribution of the operator."""
+        n = 4
+        W = self.A[:n, :n]
+        v = self.rng.normal(size=n)
+        Wv = W @ v
+        for cov, noise_cov in [
+            (linops.SymmetricKronecker(A=W), 0.5 * (Wv @ v * W + np.outer(Wv, Wv))),
+            (linops.Kronecker(A=W, B=np.eye(n)), v @ v * W),
+        ]:
+            with self.subTest(cov=cov):
+                A = prob.RandomVariable(
+                    distribution=prob.Normal(
+                        mean=linops.Identity(n), cov=cov, random_state=1
+                    )
+                )
+                oracle = _RandomMatvecOracle(A)
+                noise = np.array([oracle @ v - v for _ in range(5000)])
+                self.assertAllClose(
+                    np.cov(noise.T), noise_cov, atol=0.1 * np.max(noise_cov)
+                )
+
+    def test_reported_residual_matches_true_residual(self):
+        """Noisy solves do not claim convergence from the recursively updated residual."""
+        n = self.A.shape[0]
+        true_resids = []
+        for batch_size in [8, 128]:
+            with self.subTest(batch_size=batch_size):
+                A = prob.RandomVariable(
+                    distribution=prob.Normal(
+                        mean=linops.MatrixMult(self.A),
+                        cov=linops.SymmetricKronecker(A=0.1 * np.eye(n)),
+                        random_state=1,
+                    )
+                )
+                x, _, _, info = linalg.problinsolve(
+                    A=A, b=self.b, assume_A="symposnoise", batch_size=batch_size
+                )
+                true_resid = np.linalg.norm(self.A @ x.mean() - self.b)
+                self.assertEqual(info["conv_crit"], "noise")
+                self.assertLess(true_resid, 2 * info["resid_l2norm"])
+                self.assertLess(info["resid_l2norm"], 2 * true_resid)
+                true_resids.append(true_resid)
+        self.assertLess(true_resids[1], true_resids[0])
+
+    def test_reported_residual_without_noise_scale(self):
+        """Without a noise scale or mini-batches the residual tolerance is verified with an observed residual."""
+        x, _, _, info = linalg.problinsolve(
+            A=self.noisy_oracle(noise_std=0.1), b=self.b, assume_A="symposnoise"
+        )
+        true_resid = np.linalg.norm(self.A @ x.mean() - self.b)
+        self.assertNotIn(info["conv_crit"], ["resid_atol", "resid_rtol"])
+        self.assertLess(true_resid, 2 * info["resid_l2norm"])
+        self.assertLess(info["resid_l2norm"], 2 * true_resid)
+
+    def test_no_dense_samples(self):
+        """Noisy linear systems are solved without drawing samples of the system matrix or right hand side."""
+        n = self.A.shape[0]
+        A = prob.RandomVariable(
+            distribution=prob.Normal(
+                mean=linops.MatrixMult(self.A),
+                cov=linops.SymmetricKronecker(A=10 ** -6 * np.eye(n)),
+                random_state=1,
+            )
+        )
+        with mock.patch.object(prob.RandomVariable, "sample") as sample:
+            x, _, _, _ = linalg.problinsolve(
+                A=A, b=self.b, x0=np.ones(n), assume_A="symposnoise", batch_size=4
+            )
+        sample.assert_not_called()
+        self.assertAllClose(x.mean(), self.x, rtol=10 ** -2)
+
+
+class SolutionBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
+    """Tests the solution-based probabilistic linear solver BayesCG."""
+
+    def setUp(self):
+        """Resources for tests."""
+        fpath = os.path.join(os.path.dirname(__file__), "../../resources")
+        A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
+        f = np.load(file=fpath + "/rhs_poisson.npy")
+        self.poisson_linear_system = A, f
+
+    def test_solution_matches_spsolve(self):
+        """BayesCG should recover the solution with and without reorthogonalization."""
+        A, f = self.poisson_linear_system
+        u = scipy.sparse.linalg.spsolve(A=A.tocsc(), b=f)
+        for reorthogonalize in [False, True]:
+            with self.subTest():
+                x, info = linalg.bayescg(A=A, b=f, reorthogonalize=reorthogonalize)
+                self.assertIsInstance(x, prob.RandomVariable)
+                self.assertIn(info["conv_crit"], ["resid_atol", "resid_rtol"])
+                self.assertAllClose(x.mean(), u, rtol=1e-5, atol=1e-5)
+
+    def test_storage_grows_on_demand(self):
+        """Storage for the iterates is not preallocated for the maximum number of iterations."""
+        n = 20000
+        A = scipy.sparse.diags(np.tile([1.0, 2.0, 3.0], n // 3 + 1)[:n])
+        b = np.ones(n)
+        solver = linalg.SolutionBasedSolver(A=A, b=b)
+        x, info = solver.solve()
+        self.assertAllClose(x.mean(), scipy.sparse.linalg.spsolve(A, b))
+        self.assertLess(info["iter"], 10)
+        self.assertLess(solver.x_cov._buffer.capacity, 100)
+        self.assertLess(solver.workspace.capacity, 100)
+
+    def test_posterior_covariance(self):
+        """The posterior covariance vanishes in the explored space and its trace is tracked exactly."""
+        A, f = self.poisson_linear_system
+        searchdirs = []
+
+        def callback(xk, sk, yk, alphak, resid, **kwargs):
+            searchdirs.append(np.ravel(sk))
+
+        x, info = linalg.bayescg(A=A, b=f, maxiter=10, callback=callback)
+        Sigma = x.cov().todense()
+        S = np.array(searchdirs).T
+
+        self.assertEqual(x.cov().U.shape, (A.shape[0], 10))
+        self.assertAllClose(Sigma @ (A @ S), np.zeros_like(S), atol=1e-10)
+        self.assertAllClose(Sigma, Sigma.T, atol=1e-12)
+        self.assertApproxEqual(info["trace_sol_cov"], np.trace(Sigma), significant=10)
+
+    def test_natural_prior_recovers_cg(self):
+        """With prior covariance A^{-1} the posterior mean is the conjugate gradient iterate."""
+        A, f = self.poisson_linear_system
+        A_dense = A.toarray()
+        n = A.shape[0]
+        x0 = prob.RandomVariable(
+            distribution=prob.Normal(
+                mean=np.zeros(n), cov=linops.MatrixMult(np.linalg.inv(A_dense))
+            )
+        )
+
+        # Conjugate gradients
+        x_cg = np.zeros(n)
+        r = f - A_dense @ x_cg
+        p = r.copy()
+        for _ in range(5):
+            alpha = (r @ r) / (p @ A_dense @ p)
+            x_cg = x_cg + alpha * p
+            r_new = r - alpha * A_dense @ p
+            p = r_new + (r_new @ r_new) / (r @ r) * p
+            r = r_new
+
+        x, _ = linalg.bayescg(A=A, b=f, x0=x0, maxiter=5)
+        self.assertAllClose(x.mean(), x_cg, rtol=1e-8, atol=1e-10)
+
+    def test_lazy_callback_randvar(self):
+        """The solution passed to the callback is only constructed on access."""
+        A, f = self.poisson_linear_system
+        xks = []
+        linalg.bayescg(
+            A=A, b=f, maxiter=3, callback=lambda xk, **kwargs: xks.append(xk)
+        )
+        self.assertTrue(all(xk._lazy_distribution is None for xk in xks))
+        self.assertEqual(xks[-1].shape, (A.shape[0],))
+        self.assertFalse(np.allclose(xks[0].mean(), xks[-1].mean()))
+
+
+class DirectSolverTestCase(unittest.TestCase, NumpyAssertions):
+    """Tests the direct solver based on a factorization of the system matrix."""
+
+    def setUp(self):
+        """Resources for tests."""
+        fpath = os.path.join(os.path.dirname(__file__), "../../resources")
+        A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
+        f = np.load(file=fpath + "/rhs_poisson.npy")
+        self.poisson_linear_system = A, f
+        self.rng = np.random.RandomState(42)
+
+    def test_solution_matches_spsolve(self):
+        """The direct method recovers the solution for one or multiple right hand sides."""
+        A, f = self.poisson_linear_system
+        F = np.column_stack((f, self.rng.normal(size=(f.shape[0], 2))))
+        U = scipy.sparse.linalg.spsolve(A=A.tocsc(), b=F)
+        for assume_A in ["sympos", "gen"]:
+            for b, u in [(f, U[:, 0]), (F, U)]:
+                with self.subTest(assume_A=assume_A, shape=b.shape):
+                    x, Ahat, Ainvhat, info = linalg.problinsolve(
+                        A=A, b=b, assume_A=assume_A, method="direct"
+                    )
+                    self.assertEqual(x.shape, b.shape)
+                    self.assertEqual(info["conv_crit"], "direct")
+                    self.assertAllClose(x.mean(), u, rtol=1e-8, atol=1e-10)
+                    self.assertIsInstance(Ahat.mean(), linops.SparseMatrixMult)
+                    self.assertAllClose(Ainvhat.mean() @ b, x.mean())
+
+    def test_factorization_reused(self):
+        """The factorization is computed once and reused for subsequent right hand sides."""
+        A, f = self.poisson_linear_system
+        with mock.patch.object(
+            linops.linearoperators,
+            "_MatrixFactorization",
+            wraps=linops.linearoperators._MatrixFactorization,
+        ) as factorization:
+            _, Ahat, Ainvhat, _ = linalg.problinsolve(A=A, b=f, method="direct")
+            for _ in range(3):
+                b = self.rng.normal(size=f.shape[0])
+                x, _, _, _ = linalg.problinsolve(A=Ahat.mean(), b=b, method="direct")
+                self.assertAllClose(Ainvhat.mean() @ b, x.mean())
+        factorization.assert_called_once()
+
+    def test_posterior_covariance(self):
+        """The covariances propagate the backward error of the factorization to first order."""
+        n = 5
+        B = self.rng.normal(size=(n, n))
+        A = B @ B.T + n * np.eye(n)
+        b = self.rng.normal(size=(n, 2))
+        x, Ahat, Ainvhat, _ = linalg.problinsolve(
+            A=A, b=b, assume_A="gen", method="direct"
+        )
+        H = np.linalg.inv(A)
+        X = H @ b
+        delta = np.finfo(float).eps * np.max(np.abs(A))
+        self.assertAllClose(Ahat.cov().todense(), delta ** 2 * np.eye(n * n))
+        self.assertAllClose(
+            Ainvhat.cov().todense(), delta ** 2 * np.kron(H @ H.T, H.T @ H)
+        )
+        self.assertAllClose(
+            x.cov().todense(), delta ** 2 * np.kron(H @ H.T, X.T @ X), rtol=1e-8
+        )
+
+    def test_invalid_arguments(self):
+        """The direct method requires an explicit matrix and no prior information or noise."""
+        A, f = self.poisson_linear_system
+        n = A.shape[0]
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=A, b=f, method="cholesky")
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=A, b=f, method="direct", Ainv0=np.eye(n))
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=A, b=f, method="direct", assume_A="symposnoise")
+        with self.assertRaises(TypeError):
+            linalg.problinsolve(
+                A=linops.LinearOperator(shape=A.shape, matvec=lambda v: A @ v),
+                b=f,
+                method="direct",
+            )
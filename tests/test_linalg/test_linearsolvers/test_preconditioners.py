@@ -0,0 +1,130 @@
+"""Tests for preconditioners of linear solvers."""
+
+import unittest
+from tests.testing import NumpyAssertions
+import os
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+
+from probnum import linalg
+
+
+class PreconditionerTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for preconditioners."""
+
+    def setUp(self):
+        """Resources for tests."""
+        fpath = os.path.join(os.path.dirname(__file__), "../../resources")
+        self.A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
+        self.b = np.load(file=fpath + "/rhs_poisson.npy")
+        self.A_dense = self.A.toarray()
+        eigvals, eigvecs = np.linalg.eigh(self.A_dense)
+        self.U = eigvecs[:, :10]
+
+        self.preconditioners = [
+            linalg.JacobiPreconditioner(self.A),
+            linalg.IncompleteCholeskyPreconditioner(self.A),
+            linalg.DeflationPreconditioner(self.A, U=self.U),
+            linalg.DeflationPreconditioner(
+                self.A, U=self.U, M0=linalg.IncompleteCholeskyPreconditioner(self.A)
+            ),
+        ]
+
+    def test_symmetric_positive_definite(self):
+        """Preconditioners are symmetric positive definite."""
+        for M in self.preconditioners:
+            with self.subTest():
+                M_dense = M.todense()
+                self.assertAllClose(M_dense, M_dense.T, atol=1e-10)
+                self.assertTrue(np.all(np.linalg.eigvalsh(M_dense) > 0))
+                self.assertAllClose(M.T @ self.b, M @ self.b)
+
+    def test_incomplete_cholesky_pattern(self):
+        """The incomplete Cholesky factor reproduces A on its sparsity pattern."""
+        L = linalg.IncompleteCholeskyPreconditioner(self.A).L.toarray()
+        mask = self.A_dense != 0
+        self.assertAllClose(L, np.tril(L))
+        self.assertAllClose((L @ L.T)[mask], self.A_dense[mask])
+        self.assertTrue(np.all((L != 0) <= np.tril(mask)))
+
+    def test_incomplete_cholesky_irregular_pattern(self):
+        """The incomplete Cholesky factor of an irregular sparse matrix matches the column-wise recurrence."""
+        np.random.seed(42)
+        n = 50
+        B = scipy.sparse.random(n, n, density=0.05, random_state=42)
+        A = (B @ B.T + scipy.sparse.diags(np.full(n, 5.0))).toarray()
+        mask = np.tril(A != 0)
+        L_ref = np.tril(A)
+        for k in range(n):
+            L_ref[k, k] = np.sqrt(L_ref[k, k] - np.sum(L_ref[k, :k] ** 2))
+            for i in range(k + 1, n):
+                if mask[i, k]:
+                    L_ref[i, k] = (
+                        L_ref[i, k] - np.sum(L_ref[i, :k] * L_ref[k, :k])
+                    ) / L_ref[k, k]
+        M = linalg.IncompleteCholeskyPreconditioner(scipy.sparse.csr_matrix(A))
+        self.assertAllClose(M.L.toarray(), L_ref, rtol=1e-12, atol=1e-12)
+        X = np.random.normal(size=(n, 3))
+        self.assertAllClose(M @ X, np.linalg.solve(L_ref @ L_ref.T, X), rtol=1e-10)
+        self.assertAllClose(M @ X[:, 0], np.linalg.solve(L_ref @ L_ref.T, X[:, 0]))
+
+    def test_incomplete_cholesky_breakdown(self):
+        """Breakdown of the incomplete factorization is reported and avoided via a diagonal shift."""
+        A = np.array([[1.0, 2.0], [2.0, 1.0]])
+        with self.assertRaises(np.linalg.LinAlgError):
+            linalg.IncompleteCholeskyPreconditioner(A)
+        linalg.IncompleteCholeskyPreconditioner(A, shift=4.0)
+
+    def test_deflation(self):
+        """The deflation preconditioner inverts A on the deflation subspace."""
+        M = linalg.DeflationPreconditioner(self.A, U=self.U)
+        self.assertAllClose(M @ (self.A @ self.U), self.U, atol=1e-12)
+
+    def test_problinsolve_preconditioned(self):
+        """Preconditioning reduces the number of iterations and matches preconditioned CG."""
+        u = scipy.sparse.linalg.spsolve(self.A, self.b)
+        _, _, _, info = linalg.problinsolve(A=self.A, b=self.b)
+        for M in self.preconditioners[1:]:
+            with self.subTest():
+                x, Ahat, Ainvhat, info_precond = linalg.problinsolve(
+                    A=self.A, b=self.b, M=M
+                )
+                self.assertAllClose(x.mean(), u, rtol=1e-5)
+                self.assertLess(info_precond["iter"], info["iter"] / 2 + 1)
+
+                iters = []
+                scipy.sparse.linalg.cg(
+                    self.A, self.b, M=M, tol=1e-6, callback=lambda xk: iters.append(1)
+                )
+                self.assertLessEqual(abs(info_precond["iter"] - len(iters)), 1)
+
+    def test_dense_preconditioner(self):
+        """A preconditioner given as an array is inverted to obtain the prior mean of A."""
+        M = linalg.JacobiPreconditioner(self.A).todense()
+        x, Ahat, _, _ = linalg.problinsolve(A=self.A, b=self.b, M=M)
+        self.assertAllClose(
+            x.mean(), scipy.sparse.linalg.spsolve(self.A, self.b), rtol=1e-5
+        )
+
+    def test_preconditioner_inverse_dimension_mismatch_raises_error(self):
+        """The inverse of the preconditioner must match the dimensions of A."""
+
+        class _MismatchedPreconditioner(linalg.JacobiPreconditioner):
+            def inv(self):
+                n = self.shape[0] + 1
+                return linalg.linops.Identity(shape=n)
+
+        M = _MismatchedPreconditioner(self.A)
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=self.A, b=self.b, M=M)
+
+    def test_preconditioner_with_prior_raises_error(self):
+        M = self.preconditioners[0]
+        with self.assertRaises(ValueError):
+            linalg.problinsolve(A=self.A, b=self.b, Ainv0=M, M=M)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for batches of linear operators."""
+
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+
+from probnum.linalg import linops
+
+
+class BatchedLinearOperatorTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for batched linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.batch_shape = (4, 3)
+        self.A = np.random.normal(size=self.batch_shape + (2, 2)) + 3 * np.eye(2)
+        self.B = np.random.normal(size=self.batch_shape + (3, 3)) + 3 * np.eye(3)
+        self.ops = [
+            linops.BatchedIdentity(shape=6, batch_shape=self.batch_shape),
+            linops.BatchedScalarMult(
+                shape=(6, 6), scalar=np.random.uniform(1, 2, size=self.batch_shape)
+            ),
+            linops.BatchedMatrixMult(
+                A=np.random.normal(size=self.batch_shape + (6, 6)) + 4 * np.eye(6)
+            ),
+            linops.BatchedKronecker(A=self.A, B=self.B),
+        ]
+
+    def test_matvec_matmat(self):
+        """Batched products must match products with each linear operator in the batch."""
+        x = np.random.normal(size=self.batch_shape + (6,))
+        X = np.random.normal(size=self.batch_shape + (6, 5))
+        for op in self.ops:
+            with self.subTest():
+                dense = op.todense()
+                self.assertEqual(dense.shape, self.batch_shape + (6, 6))
+                self.assertAllClose(op @ X, np.matmul(dense, X))
+                self.assertAllClose(
+                    op.matvec(x), np.matmul(dense, x[..., None])[..., 0]
+                )
+                self.assertAllClose(op @ x[0, 0], np.matmul(dense, x[0, 0]))
+                self.assertAllClose(op.T.todense(), np.swapaxes(dense, -2, -1))
+
+    def test_indexing(self):
+        """Indexing into the batch returns (batched) linear operators."""
+        for op in self.ops:
+            with self.subTest():
+                self.assertIsInstance(op[1, 2], linops.LinearOperator)
+                self.assertAllClose(op[1, 2].todense(), op.todense()[1, 2])
+                self.assertAllClose(op[1].todense(), op.todense()[1])
+
+    def test_kronecker_factors(self):
+        """Batched Kronecker products of matrices."""
+        op = linops.BatchedKronecker(A=self.A, B=self.B)
+        self.assertAllClose(op.todense()[2, 1], np.kron(self.A[2, 1], self.B[2, 1]))
+
+    def test_kronecker_broadcast_indexing(self):
+        """Indexing into a batched Kronecker product with broadcast factors."""
+        ops = [
+            linops.BatchedKronecker(A=self.A[0, 0], B=self.B),
+            linops.BatchedKronecker(A=self.A, B=self.B[0, 0]),
+            linops.BatchedKronecker(A=self.A[:1], B=self.B),
+            linops.BatchedKronecker(
+                A=self.A[:, :1],
+                B=linops.BatchedScalarMult(shape=(3, 3), scalar=np.arange(1, 4)),
+            ),
+        ]
+        for op in ops:
+            with self.subTest():
+                dense = op.todense()
+                self.assertEqual(dense.shape[:-2], op.batch_shape)
+                self.assertIsInstance(op[1, 2], linops.LinearOperator)
+                self.assertAllClose(op[1, 2].todense(), dense[1, 2])
+                self.assertAllClose(op[1].todense(), dense[1])
+                self.assertAllClose(op[:, [0, 2]].todense(), dense[:, [0, 2]])
+                self.assertAllClose(op[1:] @ np.ones(6), dense[1:] @ np.ones(6))
+
+    def test_functions(self):
+        """Inverses, solutions, determinants, traces and diagonals of batched linear operators."""
+        b = np.random.normal(size=self.batch_shape + (6,))
+        for op in self.ops:
+            with self.subTest():
+                dense = op.todense()
+                _, logabsdet = np.linalg.slogdet(dense)
+                self.assertAllClose(op.inv().todense(), np.linalg.inv(dense))
+                self.assertAllClose(
+                    op.solve(b), np.linalg.solve(dense, b[..., None])[..., 0]
+                )
+                self.assertAllClose(op.logabsdet(), logabsdet)
+                self.assertAllClose(op.trace(), np.trace(dense, axis1=-2, axis2=-1))
+                self.assertAllClose(
+                    op.diagonal(), np.diagonal(dense, axis1=-2, axis2=-1)
+                )
@@ -0,0 +1,179 @@
+"""Tests for block-structured linear operators."""
+
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+import scipy.linalg
+
+from probnum.linalg import linops
+
+
+def _random_spd_matrix(n, random_state):
+    B = random_state.normal(size=(n, n))
+    return B @ B.T + n * np.eye(n)
+
+
+class BlockDiagonalTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for block-diagonal linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        self.rng = np.random.RandomState(42)
+        self.stacked_blocks = [_random_spd_matrix(3, self.rng) for _ in range(4)]
+        self.mixed_blocks = [
+            _random_spd_matrix(2, self.rng),
+            linops.MatrixMult(_random_spd_matrix(4, self.rng)),
+            linops.Kronecker(
+                A=_random_spd_matrix(2, self.rng), B=_random_spd_matrix(2, self.rng)
+            ),
+        ]
+        self.linops = [
+            linops.BlockDiagonal(*self.stacked_blocks),
+            linops.BlockDiagonal(*self.mixed_blocks),
+        ]
+
+    def test_stacked_storage(self):
+        """Dense blocks of identical shape are stored in a single stacked array."""
+        self.assertIsNotNone(self.linops[0]._stacked)
+        self.assertEqual(self.linops[0]._stacked.shape, (4, 3, 3))
+        self.assertIsNone(self.linops[1]._stacked)
+
+    def test_matvec_matmat(self):
+        """Products with block-diagonal operators."""
+        for A in self.linops:
+            with self.subTest():
+                A_dense = A.todense()
+                X = self.rng.normal(size=(A.shape[1], 3))
+                self.assertAllClose(A @ X, A_dense @ X)
+                self.assertAllClose(A @ X[:, 0], A_dense @ X[:, 0])
+                self.assertAllClose(A.T @ X, A_dense.T @ X)
+
+    def test_parallel_matmat(self):
+        """Blocks applied in parallel give the same result."""
+        A = self.linops[1]
+        X = self.rng.normal(size=(A.shape[1], 5))
+        with linops.parallel_execution(num_threads=3):
+            self.assertAllClose(A @ X, A.todense() @ X)
+
+    def test_todense(self):
+        """Dense representation is the block-diagonal matrix."""
+        self.assertAllClose(
+            self.linops[0].todense(), scipy.linalg.block_diag(*self.stacked_blocks)
+        )
+
+    def test_inv_solve(self):
+        """Inverse and solve of block-diagonal operators."""
+        for A in self.linops:
+            with self.subTest():
+                A_dense = A.todense()
+                B = self.rng.normal(size=(A.shape[0], 2))
+                self.assertAllClose(A.inv().todense(), np.linalg.inv(A_dense))
+                self.assertAllClose(A.solve(B), np.linalg.solve(A_dense, B))
+                self.assertAllClose(A.solve(B[:, 0]), np.linalg.solve(A_dense, B[:, 0]))
+
+    def test_det_trace_diagonal(self):
+        """Determinant, trace and diagonal are computed block-wise."""
+        for A in self.linops:
+            with self.subTest():
+                A_dense = A.todense()
+                self.assertApproxEqual(A.det(), np.linalg.det(A_dense), significant=7)
+                self.assertApproxEqual(
+                    A.logabsdet(), np.linalg.slogdet(A_dense)[1], significant=7
+                )
+                self.assertApproxEqual(A.trace(), np.trace(A_dense), significant=7)
+                self.assertAllClose(A.diagonal(), np.diag(A_dense))
+
+    def test_cholesky(self):
+        """Block-wise Cholesky factor is lower triangular and factorizes the operator."""
+        for A in self.linops:
+            with self.subTest():
+                L = A.cholesky()
+                self.assertIsInstance(L, linops.BlockDiagonal)
+                L_dense = L.todense()
+                self.assertAllClose(L_dense, np.tril(L_dense))
+                self.assertAllClose(L_dense @ L_dense.T, A.todense())
+
+    def test_rectangular_blocks(self):
+        """Block-diagonal operators with rectangular blocks."""
+        blocks = [self.rng.normal(size=(2, 3)), self.rng.normal(size=(4, 1))]
+        A = linops.BlockDiagonal(*blocks)
+        A_dense = scipy.linalg.block_diag(*blocks)
+        x = self.rng.normal(size=4)
+        self.assertEqual(A.shape, (6, 4))
+        self.assertAllClose(A @ x, A_dense @ x)
+        self.assertAllClose(A.diagonal(), np.diag(A_dense))
+
+    def test_no_blocks_raises_error(self):
+        with self.assertRaises(ValueError):
+            linops.BlockDiagonal()
+
+
+class BlockTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for linear operators with 2x2 block structure."""
+
+    def setUp(self):
+        """Resources for tests."""
+        self.rng = np.random.RandomState(1)
+        M = _random_spd_matrix(7, self.rng)
+        self.M = M
+        self.A = linops.Block(
+            A=M[:4, :4], B=M[:4, 4:], C=M[4:, :4], D=linops.MatrixMult(M[4:, 4:])
+        )
+
+    def test_matvec_matmat(self):
+        """Products with block operators."""
+        X = self.rng.normal(size=(7, 3))
+        self.assertAllClose(self.A @ X, self.M @ X)
+        self.assertAllClose(self.A @ X[:, 0], self.M @ X[:, 0])
+        self.assertAllClose(self.A.T @ X, self.M.T @ X)
+        with linops.parallel_execution(num_threads=2):
+            self.assertAllClose(self.A @ X, self.M @ X)
+
+    def test_todense(self):
+        self.assertAllClose(self.A.todense(), self.M)
+
+    def test_inv(self):
+        """Inverse via the Schur complement."""
+        Ainv = self.A.inv()
+        self.assertIsInstance(Ainv, linops.Block)
+        self.assertAllClose(Ainv.todense(), np.linalg.inv(self.M))
+
+    def test_det_trace_diagonal(self):
+        """Determinant via the Schur complement, trace and diagonal via the diagonal blocks."""
+        self.assertApproxEqual(self.A.det(), np.linalg.det(self.M), significant=7)
+        self.assertApproxEqual(
+            self.A.logabsdet(), np.linalg.slogdet(self.M)[1], significant=7
+        )
+        self.assertApproxEqual(self.A.trace(), np.trace(self.M), significant=7)
+        self.assertAllClose(self.A.diagonal(), np.diag(self.M))
+
+    def test_trace_diagonal_rectangular_diagonal_blocks(self):
+        """Trace and diagonal of a square block operator with rectangular diagonal blocks."""
+        A = linops.Block(
+            A=self.M[:4, :3], B=self.M[:4, 3:], C=self.M[4:, :3], D=self.M[4:, 3:]
+        )
+        self.assertAllClose(A.diagonal(), np.diag(self.M))
+        self.assertApproxEqual(A.trace(), np.trace(self.M), significant=7)
+
+    def test_cholesky(self):
+        """Block Cholesky factor coincides with the dense Cholesky factor."""
+        L = self.A.cholesky()
+        self.assertAllClose(L.todense(), np.linalg.cholesky(self.M))
+
+    def test_nested_blocks(self):
+        """Blocks can themselves be block-structured."""
+        D = linops.BlockDiagonal(self.M[4:6, 4:6], self.M[6:, 6:])
+        M = self.M.copy()
+        M[4:6, 6:] = 0.0
+        M[6:, 4:6] = 0.0
+        A = linops.Block(A=self.M[:4, :4], B=self.M[:4, 4:], C=self.M[4:, :4], D=D)
+        self.assertAllClose(A.todense(), M)
+        self.assertAllClose(A.cholesky().todense(), np.linalg.cholesky(M))
+
+    def test_dimension_mismatch_raises_error(self):
+        with self.assertRaises(ValueError):
+            linops.Block(A=np.eye(2), B=np.ones((3, 1)), C=np.ones((1, 2)), D=np.eye(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for stochastic estimators of functions of linear operators."""
+
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+
+from probnum.linalg import linops
+
+
+class StochasticEstimatorTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for stochastic trace and log-determinant estimators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.n = 40
+        Q, _ = np.linalg.qr(np.random.normal(size=(self.n, self.n)))
+        self.eigvals = np.exp(-0.2 * np.arange(self.n)) + 0.5
+        self.A = Q @ np.diag(self.eigvals) @ Q.T
+        self.U = np.random.normal(size=(self.n, 3))
+
+    def test_invalid_input(self):
+        """Non-square operators and invalid probe budgets should raise a ValueError."""
+        for estimator in [
+            linops.trace_hutchinson,
+            linops.trace_hutchpp,
+            linops.logdet_slq,
+        ]:
+            with self.subTest():
+                with self.assertRaises(ValueError):
+                    estimator(np.ones((3, 4)))
+                with self.assertRaises(ValueError):
+                    estimator(self.A, nprobes=0)
+
+    def test_seeded_estimates_reproducible(self):
+        """Estimates with identical random states must coincide."""
+        for estimator in [
+            linops.trace_hutchinson,
+            linops.trace_hutchpp,
+            linops.logdet_slq,
+        ]:
+            with self.subTest():
+                self.assertEqual(
+                    estimator(self.A, nprobes=9, random_state=1),
+                    estimator(self.A, nprobes=9, random_state=1),
+                )
+
+    def test_hutchinson(self):
+        """Hutchinson's estimator on a linear operator only given via its matvec."""
+        Aop = linops.LinearOperator(shape=self.A.shape, matvec=lambda x: self.A @ x)
+        trace = linops.trace_hutchinson(Aop, nprobes=2000, random_state=1)
+        self.assertApproxEqual(trace, np.trace(self.A), significant=2)
+
+    def test_hutchpp_exact_for_low_rank(self):
+        """Hutch++ is exact if the sketch captures the range of the linear operator."""
+        A = self.U @ self.U.T
+        trace = linops.trace_hutchpp(A, nprobes=12, random_state=1)
+        self.assertApproxEqual(trace, np.trace(A), significant=10)
+
+    def test_slq_logdet(self):
+        """Stochastic Lanczos quadrature estimate of the log-determinant."""
+        logdet = linops.logdet_slq(self.A, nprobes=500, nsteps=15, random_state=1)
+        _, logdet_true = np.linalg.slogdet(self.A)
+        self.assertApproxEqual(logdet, logdet_true, significant=1)
+
+    def test_slq_exact_for_identity(self):
+        """Lanczos terminates after a single step for the identity."""
+        logdet = linops.logdet_slq(
+            2.0 * np.eye(self.n), nprobes=3, nsteps=10, random_state=1
+        )
+        self.assertApproxEqual(logdet, self.n * np.log(2.0), significant=10)
@@ -1,6 +1,7 @@
 """Tests for linear operators."""
 
 import itertools
+import os
 
 import unittest
 from tests.testing import NumpyAssertions
@@ -86,6 +87,34 @@ class LinearOperatorArithmeticTestCase(LinearOperatorTestCase):
                     msg="Matrix-vector multiplication with (n,1) vector failed.",
                 )
 
+    def test_matmat(self):
+        """Matrix-matrix multiplication for linear operators."""
+        np.random.seed(1)
+        for op in self.ops:
+            with self.subTest():
+                A = op.todense()
+                X = np.random.normal(size=(op.shape[1], 3))
+
+                self.assertAllClose(A @ X, op @ X)
+
+    def test_kronecker_matmat(self):
+        """Batched multiplication with (symmetric) Kronecker products must match column-wise multiplication."""
+        np.random.seed(1)
+        n = 4
+        A = np.random.normal(size=(n, n))
+        B = np.random.normal(size=(n, n))
+        X = np.random.normal(size=(n * n, 5))
+        for op in [
+            linops.Kronecker(A=A, B=B),
+            linops.SymmetricKronecker(A=A, B=B),
+            linops.SymmetricKronecker(A=A),
+        ]:
+            with self.subTest():
+                self.assertAllClose(
+                    op @ X, np.hstack([op @ x[:, None] for x in X.T]), rtol=1e-12
+                )
+                self.assertAllClose(op.T @ X, op.todense().T @ X, rtol=1e-12)
+
     class LinearOperatorFunctionsTestCase(LinearOperatorTestCase):
         """Test linear operator functions."""
 
@@ -220,3 +249,327 @@ class LinearOperatorFunctionsTestCase(LinearOperatorTestCase):
                 self.assertApproxEqual(
                     A.trace(), np.trace(a=A.todense()), significant=7
                 )
+
+    def test_diagonal_computation(self):
+        """Check whether the diagonal of various linear operators is computed correctly."""
+        for A in self.ops:
+            with self.subTest():
+                self.assertAllClose(A.diagonal(), np.diag(A.todense()))
+
+    def test_structured_trace_diagonal(self):
+        """Trace and diagonal of composite linear operators must match their dense counterparts."""
+        np.random.seed(1)
+        n = 3
+        A = linops.MatrixMult(np.random.normal(size=(n, n)))
+        B = linops.MatrixMult(np.random.normal(size=(n, n)))
+        for op in [
+            A + linops.ScalarMult(shape=(n, n), scalar=2.5),
+            -3.0 * A,
+            A.T,
+            A @ B,
+            linops.Kronecker(A=A, B=B),
+            linops.SymmetricKronecker(A=A, B=B),
+            linops.SymmetricKronecker(A=A),
+            linops.Diagonal(Op=A),
+        ]:
+            with self.subTest():
+                self.assertAllClose(op.diagonal(), np.diag(op.todense()))
+                self.assertApproxEqual(
+                    op.trace(), np.trace(op.todense()), significant=7
+                )
+
+    def test_structured_logabsdet(self):
+        """Log-determinants of composite linear operators must match their dense counterparts."""
+        np.random.seed(1)
+        n = 3
+        A = linops.MatrixMult(np.random.normal(size=(n, n)) + n * np.eye(n))
+        B = linops.MatrixMult(np.random.normal(size=(n, n)) + n * np.eye(n))
+        for op in [
+            linops.ScalarMult(shape=(n, n), scalar=-2.5),
+            -3.0 * A,
+            A.T,
+            A @ B,
+            linops.Kronecker(A=A, B=B),
+            linops.SymmetricKronecker(A=A),
+            linops.Diagonal(Op=A),
+        ]:
+            with self.subTest():
+                _, logabsdet = np.linalg.slogdet(op.todense())
+                self.assertApproxEqual(op.logabsdet(), logabsdet, significant=7)
+
+
+class MatrixMultTestCase(unittest.TestCase, NumpyAssertions):
+    """Test factorization-based functions of matrix linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        n = 6
+        A = np.random.normal(size=(n, n))
+        self.B = np.random.normal(size=(n, 2))
+        self.matrices = [
+            (A, {}),
+            (A + A.T, {"symmetric": True}),
+            (A @ A.T + np.eye(n), {"positive_definite": True}),
+            (scipy.sparse.csr_matrix(A + n * np.eye(n)), {}),
+        ]
+
+    def test_solve_inv_det(self):
+        """Solutions, inverses and determinants must match their dense counterparts."""
+        for A, properties in self.matrices:
+            for cache_factorization in [False, True]:
+                with self.subTest():
+                    Aop = linops.MatrixMult(
+                        A, cache_factorization=cache_factorization, **properties
+                    )
+                    A_dense = Aop.todense()
+                    sign, logabsdet = np.linalg.slogdet(A_dense)
+                    self.assertAllClose(
+                        Aop.solve(self.B), np.linalg.solve(A_dense, self.B)
+                    )
+                    self.assertAllClose(Aop.inv().todense(), np.linalg.inv(A_dense))
+                    self.assertAllClose(
+                        Aop.inv().T @ self.B, np.linalg.inv(A_dense).T @ self.B
+                    )
+                    self.assertApproxEqual(Aop.logabsdet(), logabsdet, significant=7)
+                    self.assertApproxEqual(
+                        Aop.det(), sign * np.exp(logabsdet), significant=7
+                    )
+
+    def test_factorization_cache(self):
+        """The cached factorization is reused until the matrix is reassigned."""
+        A, properties = self.matrices[2]
+        Aop = linops.MatrixMult(A, cache_factorization=True, **properties)
+        factorization = Aop.factorize()
+        Aop.logabsdet()
+        Aop.solve(self.B)
+        self.assertIs(Aop.factorize(), factorization)
+
+        Aop.A = 2 * A
+        self.assertIsNot(Aop.factorize(), factorization)
+        self.assertAllClose(Aop.solve(self.B), np.linalg.solve(2 * A, self.B))
+
+    def test_factorization_not_cached_by_default(self):
+        """Factorizations are only cached if requested."""
+        Aop = linops.MatrixMult(self.matrices[0][0])
+        self.assertIsNot(Aop.factorize(), Aop.factorize())
+
+
+class SparseMatrixMultTestCase(unittest.TestCase, NumpyAssertions):
+    """Test linear operators defined via sparse matrices."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        fpath = os.path.join(os.path.dirname(__file__), "../../resources")
+        self.A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
+        self.A_dense = self.A.toarray()
+        self.B = np.random.normal(size=(self.A.shape[0], 3))
+
+    def test_aslinop_sparse(self):
+        """Sparse matrices are represented by sparse matrix linear operators preserving the sparse storage."""
+        for A in [self.A, self.A.tocsc(), self.A.tocoo()]:
+            with self.subTest():
+                Aop = linops.aslinop(A)
+                self.assertIsInstance(Aop, linops.SparseMatrixMult)
+                self.assertTrue(scipy.sparse.isspmatrix(Aop.A))
+                self.assertTrue(scipy.sparse.isspmatrix(Aop.T.A))
+                self.assertArrayEqual(Aop.todense(), self.A_dense)
+
+    def test_matmat_diagonal_trace(self):
+        """Products, diagonal and trace of sparse matrix linear operators."""
+        Aop = linops.SparseMatrixMult(self.A)
+        self.assertAllClose(Aop @ self.B, self.A_dense @ self.B)
+        self.assertAllClose(Aop @ self.B[:, 0], self.A_dense @ self.B[:, 0])
+        self.assertAllClose(Aop.T @ self.B, self.A_dense.T @ self.B)
+        self.assertAllClose(Aop.diagonal(), np.diag(self.A_dense))
+        self.assertApproxEqual(Aop.trace(), np.trace(self.A_dense), significant=10)
+
+    def test_solve_inv_logabsdet(self):
+        """Linear systems, inverse and determinant via sparse factorizations."""
+        _, logabsdet = np.linalg.slogdet(self.A_dense)
+        for properties in [{}, {"positive_definite": True}]:
+            with self.subTest():
+                Aop = linops.SparseMatrixMult(
+                    self.A, cache_factorization=True, **properties
+                )
+                self.assertAllClose(
+                    Aop.solve(self.B), np.linalg.solve(self.A_dense, self.B)
+                )
+                self.assertAllClose(
+                    Aop.inv() @ self.B[:, 0],
+                    np.linalg.solve(self.A_dense, self.B[:, 0]),
+                )
+                self.assertApproxEqual(Aop.logabsdet(), logabsdet, significant=7)
+
+
+class KroneckerEigendecompositionTestCase(unittest.TestCase, NumpyAssertions):
+    """Test functions of Kronecker products computed from factor-wise eigendecompositions."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.factors = []
+        for n in [3, 4, 3]:
+            B = np.random.normal(size=(n, n))
+            self.factors.append(B @ B.T + n * np.eye(n))
+        A, B, C = self.factors
+        self.linops = [
+            linops.Kronecker(A=A, B=B),
+            linops.Kronecker(A=linops.Identity(3), B=B),
+            linops.SymmetricKronecker(A=A),
+            linops.SymmetricKronecker(A=A, B=C),
+        ]
+        self.rhs = np.random.normal(size=(16, 2))
+
+    def test_inv_solve_logabsdet(self):
+        """Inverse, solve and log-determinant coincide with their dense counterparts."""
+        for Kop in self.linops:
+            with self.subTest():
+                K = Kop.todense()
+                b = self.rhs[: K.shape[0]]
+                self.assertAllClose(Kop.inv().todense(), np.linalg.inv(K))
+                self.assertAllClose(Kop.solve(b), np.linalg.solve(K, b))
+                self.assertAllClose(Kop.solve(b[:, 0]), np.linalg.solve(K, b[:, 0]))
+                self.assertApproxEqual(
+                    Kop.logabsdet(), np.linalg.slogdet(K)[1], significant=7
+                )
+
+    def test_eigvals_sqrtm(self):
+        """Eigenvalues and square roots of Kronecker products with symmetric positive definite factors."""
+        for Kop in self.linops[:3]:
+            with self.subTest():
+                K = Kop.todense()
+                self.assertAllClose(np.sort(Kop.eigvals()), np.linalg.eigvalsh(K))
+                S = Kop.sqrtm().todense()
+                self.assertAllClose(S, S.T)
+                self.assertAllClose(S @ S, K)
+
+    def test_eigendecomposition_cached(self):
+        """Factor eigendecompositions are computed once and reused."""
+        Kop = self.linops[0]
+        eigh = Kop._factor_eigendecompositions()
+        Kop.inv()
+        Kop.sqrtm()
+        self.assertIs(Kop._factor_eigendecompositions()[0], eigh[0])
+        self.assertIs(Kop.inv().A, Kop.inv().A)
+
+    def test_nonsymmetric_factors(self):
+        """The inverse of Kronecker products with non-symmetric factors is computed from the factor inverses."""
+        A = np.random.normal(size=(3, 3)) + 3 * np.eye(3)
+        Kop = linops.Kronecker(A=A, B=self.factors[1])
+        self.assertAllClose(
+            Kop.inv().todense(), np.linalg.inv(np.kron(A, self.factors[1]))
+        )
+        with self.assertRaises(NotImplementedError):
+            Kop.sqrtm()
+
+    def test_small_nonsymmetric_factors(self):
+        """Factors with small entries are only decomposed if they are exactly symmetric."""
+        A = 10 ** -9 * np.array([[1.0, 2.0], [0.0, 1.0]])
+        Kop = linops.Kronecker(A=linops.MatrixMult(A), B=self.factors[1])
+        self.assertIsNone(Kop._factor_eigendecompositions()[0])
+        K_inv = np.linalg.inv(np.kron(A, self.factors[1]))
+        self.assertAllClose(Kop.inv().todense(), K_inv, rtol=1e-10)
+
+    def test_structured_factors_not_decomposed(self):
+        """Only dense factors are eigendecomposed, other factors use their own methods."""
+        n = 50
+        A = scipy.sparse.diags([-1.0, 2.5, -1.0], [-1, 0, 1], shape=(n, n)).tocsr()
+        Kop = linops.Kronecker(A=linops.aslinop(A), B=linops.Identity(2))
+        self.assertEqual(Kop._factor_eigendecompositions(), (None, None))
+        x = np.random.normal(size=2 * n)
+        self.assertAllClose(
+            Kop.inv() @ x, np.linalg.solve(np.kron(A.toarray(), np.eye(2)), x)
+        )
+
+
+class MultiKroneckerTestCase(unittest.TestCase, NumpyAssertions):
+    """Test Kronecker products of more than two factors."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.factors = []
+        for n in [2, 3, 4]:
+            B = np.random.normal(size=(n, n))
+            self.factors.append(B @ B.T + n * np.eye(n))
+        self.Kop = linops.MultiKronecker(*self.factors)
+        self.K = np.kron(np.kron(*self.factors[:2]), self.factors[2])
+
+    def test_matvec_matmat(self):
+        """Mode-wise products coincide with products with the dense Kronecker product."""
+        factors = [np.random.normal(size=shape) for shape in [(2, 3), (4, 1), (3, 2)]]
+        Kop = linops.MultiKronecker(*factors)
+        K = np.kron(np.kron(*factors[:2]), factors[2])
+        X = np.random.normal(size=(Kop.shape[1], 5))
+        self.assertEqual(Kop.shape, K.shape)
+        self.assertAllClose(Kop @ X, K @ X)
+        self.assertAllClose(Kop @ X[:, 0], K @ X[:, 0])
+        Y = np.random.normal(size=(Kop.shape[0], 2))
+        self.assertAllClose(Kop.T @ Y, K.T @ Y)
+        self.assertAllClose(Kop.todense(), K)
+        with linops.parallel_execution(num_threads=2):
+            self.assertAllClose(Kop @ X, K @ X)
+
+    def test_two_factors_coincide_with_kronecker(self):
+        Kop = linops.Kronecker(*self.factors[:2])
+        MKop = linops.MultiKronecker(*self.factors[:2])
+        X = np.random.normal(size=(6, 3))
+        self.assertAllClose(MKop @ X, Kop @ X)
+
+    def test_factorwise_functions(self):
+        """Inverse, log-determinant, trace and diagonal are computed factor-wise."""
+        b = np.random.normal(size=self.K.shape[0])
+        self.assertAllClose(self.Kop.inv().todense(), np.linalg.inv(self.K))
+        self.assertAllClose(self.Kop.solve(b), np.linalg.solve(self.K, b))
+        self.assertApproxEqual(
+            self.Kop.logabsdet(), np.linalg.slogdet(self.K)[1], significant=7
+        )
+        self.assertApproxEqual(self.Kop.det(), np.linalg.det(self.K), significant=7)
+        self.assertApproxEqual(self.Kop.trace(), np.trace(self.K), significant=7)
+        self.assertAllClose(self.Kop.diagonal(), np.diag(self.K))
+        self.assertAllClose(np.sort(self.Kop.eigvals()), np.linalg.eigvalsh(self.K))
+
+    def test_no_factors_raises_error(self):
+        with self.assertRaises(ValueError):
+            linops.MultiKronecker()
+
+
+class LinearOperatorDtypeTestCase(unittest.TestCase, NumpyAssertions):
+    """Test propagation of data types through linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.A = np.random.normal(size=(4, 4))
+        self.x = np.random.normal(size=16).astype(np.float32)
+
+    def test_astype(self):
+        """Linear operators in single precision compute single precision products."""
+        linop_list = [
+            linops.MatrixMult(self.A),
+            linops.SparseMatrixMult(self.A),
+            linops.Identity(16),
+            linops.ScalarMult(shape=(16, 16), scalar=2.0),
+            linops.Kronecker(A=self.A, B=linops.Identity(4)),
+            linops.SymmetricKronecker(A=self.A),
+            linops.MultiKronecker(self.A, np.eye(2), np.eye(2)),
+            linops.LinearOperator(shape=(16, 16), matvec=lambda x: 2 * x),
+        ]
+        for Aop in linop_list:
+            with self.subTest():
+                Aop_single = Aop.astype(np.float32)
+                self.assertEqual(Aop_single.dtype, np.float32)
+                Ax = Aop_single @ self.x[: Aop.shape[1]]
+                self.assertEqual(Ax.dtype, np.float32)
+                self.assertAllClose(
+                    Ax, Aop @ self.x[: Aop.shape[1]], rtol=1e-5, atol=1e-5
+                )
+
+    def test_kronecker_dtype_from_factors(self):
+        """The data type of Kronecker products is determined by their factors."""
+        A_single = self.A.astype(np.float32)
+        self.assertEqual(linops.Kronecker(A=A_single, B=A_single).dtype, np.float32)
+        self.assertEqual(linops.SymmetricKronecker(A=A_single).dtype, np.float32)
+        self.assertEqual(linops.Kronecker(A=A_single, B=self.A).dtype, np.float64)
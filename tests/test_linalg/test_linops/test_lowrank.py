@@ -0,0 +1,102 @@
+"""Tests for low-rank updates of linear operators."""
+
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+
+from probnum.linalg import linops
+
+
+class LowRankUpdateTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for low-rank updates of linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.n = 8
+        self.A = np.random.normal(size=(self.n, self.n)) + self.n * np.eye(self.n)
+        self.U = np.random.normal(size=(self.n, 3))
+        self.V = np.random.normal(size=(self.n, 3))
+
+    def test_todense(self):
+        """Dense representation of a low-rank update."""
+        W = linops.LowRankUpdate(A=self.A, U=self.U, V=self.V)
+        self.assertAllClose(W.todense(), self.A + self.U @ self.V.T)
+
+    def test_matvec_matmat(self):
+        """Matrix-vector and matrix-matrix products with low-rank updates."""
+        W = linops.LowRankUpdate(A=self.A, U=self.U, V=self.V, maxrank=10)
+        W_dense = self.A + self.U @ self.V.T
+        x = np.random.normal(size=self.n)
+        X = np.random.normal(size=(self.n, 4))
+        self.assertAllClose(W @ x, W_dense @ x)
+        self.assertAllClose(W @ x[:, None], W_dense @ x[:, None])
+        self.assertAllClose(W @ X, W_dense @ X)
+
+    def test_successive_updates(self):
+        """Successive updates must be equivalent to a single update with all factors."""
+        W = linops.LowRankUpdate(A=linops.Identity(self.n), maxrank=2)
+        for i in range(self.U.shape[1]):
+            W = W.update(U=self.U[:, i], V=self.V[:, i])
+
+        self.assertEqual(W.update_rank, self.U.shape[1])
+        self.assertAllClose(W.todense(), np.eye(self.n) + self.U @ self.V.T)
+
+    def test_updates_do_not_modify_previous_operators(self):
+        """Previous iterates sharing the factor storage must remain unchanged by updates."""
+        W0 = linops.LowRankUpdate(A=self.A, maxrank=5)
+        W1 = W0.update(U=self.U[:, 0], V=self.V[:, 0])
+        W2 = W1.update(U=self.U[:, 1], V=self.V[:, 1])
+        W2_branch = W1.update(U=self.U[:, 2], V=self.V[:, 2])
+
+        self.assertAllClose(W0.todense(), self.A)
+        self.assertAllClose(W1.todense(), self.A + np.outer(self.U[:, 0], self.V[:, 0]))
+        self.assertAllClose(W2.todense(), self.A + self.U[:, :2] @ self.V[:, :2].T)
+        self.assertAllClose(
+            W2_branch.todense(), self.A + self.U[:, [0, 2]] @ self.V[:, [0, 2]].T
+        )
+
+    def test_no_nesting(self):
+        """Low-rank updates of low-rank updates should be flattened."""
+        W = linops.LowRankUpdate(
+            A=linops.LowRankUpdate(A=self.A, U=self.U[:, :1], V=self.V[:, :1]),
+            U=self.U[:, 1:],
+            V=self.V[:, 1:],
+        )
+        self.assertNotIsInstance(W.A, linops.LowRankUpdate)
+        self.assertAllClose(W.todense(), self.A + self.U @ self.V.T)
+
+    def test_transpose(self):
+        """Transpose of a low-rank update."""
+        W = linops.LowRankUpdate(A=self.A, U=self.U, V=self.V)
+        self.assertAllClose(W.T.todense(), (self.A + self.U @ self.V.T).T)
+
+    def test_inv(self):
+        """Inverse via the Woodbury identity."""
+        W = linops.LowRankUpdate(A=linops.Identity(self.n), U=self.U, V=self.V)
+        self.assertAllClose(
+            W.inv().todense(), np.linalg.inv(np.eye(self.n) + self.U @ self.V.T)
+        )
+
+    def test_trace_diagonal(self):
+        """Trace and diagonal computed from the factors of a low-rank update."""
+        W = linops.LowRankUpdate(A=self.A, U=self.U, V=self.V)
+        W_dense = self.A + self.U @ self.V.T
+        self.assertAllClose(W.diagonal(), np.diag(W_dense))
+        self.assertApproxEqual(W.trace(), np.trace(W_dense), significant=7)
+
+    def test_diagonal_rectangular(self):
+        """Diagonal of low-rank updates of rectangular matrices."""
+        for A, U, V in [
+            (self.A[:, :5], self.U, self.V[:5]),
+            (self.A[:5], self.U[:5], self.V),
+        ]:
+            with self.subTest():
+                W = linops.LowRankUpdate(A=A, U=U, V=V)
+                self.assertAllClose(W.diagonal(), np.diag(A + U @ V.T))
+
+    def test_logabsdet(self):
+        """Log-determinant via the matrix determinant lemma."""
+        W = linops.LowRankUpdate(A=linops.Identity(self.n), U=self.U, V=self.V)
+        _, logabsdet = np.linalg.slogdet(np.eye(self.n) + self.U @ self.V.T)
+        self.assertApproxEqual(W.logabsdet(), logabsdet, significant=7)
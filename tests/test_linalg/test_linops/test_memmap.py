@@ -0,0 +1,53 @@
+"""Tests for memory-mapped linear operators."""
+
+import os
+import tempfile
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+
+from probnum import linalg
+from probnum.linalg import linops
+
+
+class MemoryMappedMatrixMultTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for linear operators defined via memory-mapped matrices."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.fpath = os.path.join(self.tmpdir.name, "matrix.npy")
+        n = 50
+        B = np.random.normal(size=(n, n))
+        self.A = B @ B.T + n * np.eye(n)
+        np.save(self.fpath, self.A)
+        self.X = np.random.normal(size=(n, 3))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_matvec_matmat(self):
+        """Products with memory-mapped matrices for different block sizes and number of threads."""
+        for block_size, num_threads in [(7, None), (16, 3), (50, 2), (100, None)]:
+            with self.subTest():
+                Aop = linops.MemoryMappedMatrixMult(
+                    self.fpath, block_size=block_size, num_threads=num_threads
+                )
+                self.assertAllClose(Aop @ self.X, self.A @ self.X)
+                self.assertAllClose(Aop @ self.X[:, 0], self.A @ self.X[:, 0])
+                self.assertAllClose(Aop.T @ self.X, self.A.T @ self.X)
+                self.assertAllClose(Aop.diagonal(), np.diag(self.A))
+
+    def test_memmap_input(self):
+        """Memory maps can be passed directly."""
+        A_memmap = np.load(self.fpath, mmap_mode="r")
+        Aop = linops.MemoryMappedMatrixMult(A_memmap, block_size=8)
+        self.assertAllClose(Aop.todense(), self.A)
+
+    def test_problinsolve(self):
+        """The probabilistic linear solver only requires products with the memory-mapped matrix."""
+        Aop = linops.MemoryMappedMatrixMult(self.fpath, block_size=8, num_threads=2)
+        b = self.A @ self.X[:, 0]
+        x, _, _, _ = linalg.problinsolve(A=Aop, b=b)
+        self.assertAllClose(x.mean(), self.X[:, 0], rtol=1e-5, atol=1e-5)
@@ -0,0 +1,76 @@
+"""Tests for the multithreaded application of linear operators."""
+
+import threading
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+
+from probnum.linalg import linops
+
+
+class ParallelExecutionTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for the multithreaded application of linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.n = 4
+        self.A = np.random.normal(size=(self.n, self.n))
+        self.B = np.random.normal(size=(self.n, self.n))
+        self.thread_ids = set()
+
+        def mv(x):
+            self.thread_ids.add(threading.get_ident())
+            return self.A @ x
+
+        self.C = linops.LinearOperator(shape=(self.n, self.n), matvec=mv)
+        self.ops = [
+            self.C,
+            self.C
+            + linops.Kronecker(A=self.A[:2, :2], B=self.B[:2, :2])
+            - 2.0 * self.C,
+            linops.Kronecker(A=self.A, B=self.C),
+            linops.SymmetricKronecker(A=self.A, B=self.B),
+            linops.Kronecker(A=self.A, B=self.B) + linops.SymmetricKronecker(A=self.B),
+        ]
+
+    def test_parallel_matches_sequential(self):
+        """Results of the multithreaded application must match the sequential application."""
+        for op in self.ops:
+            with self.subTest():
+                X = np.random.normal(size=(op.shape[1], 7))
+                expected = op @ X
+                op.num_threads = 3
+                self.assertAllClose(op @ X, expected)
+                self.assertAllClose(op @ X[:, 0], expected[:, 0])
+
+    def test_custom_matvec_dispatched_to_threads(self):
+        """User-defined matrix-vector products are dispatched to several threads."""
+        self.C.num_threads = 4
+        self.C @ np.random.normal(size=(self.n, 8))
+        self.assertGreater(len(self.thread_ids), 1)
+
+    def test_context_manager_default(self):
+        """The context manager sets the default number of threads and restores it afterwards."""
+        op = linops.Kronecker(A=self.A, B=self.B)
+        self.assertEqual(op.num_threads, 1)
+        with linops.parallel_execution(num_threads=3):
+            self.assertEqual(op.num_threads, 3)
+            op.num_threads = 2
+            self.assertEqual(op.num_threads, 2)
+            op.num_threads = None
+            self.assertAllClose(
+                op @ np.ones(self.n ** 2),
+                np.kron(self.A, self.B) @ np.ones(self.n ** 2),
+            )
+        self.assertEqual(op.num_threads, 1)
+
+    def test_invalid_num_threads(self):
+        """The number of threads must be a positive integer."""
+        for num_threads in [0, -1, 1.5]:
+            with self.subTest():
+                with self.assertRaises(ValueError):
+                    self.C.num_threads = num_threads
+                with self.assertRaises(ValueError):
+                    with linops.parallel_execution(num_threads=num_threads):
+                        pass
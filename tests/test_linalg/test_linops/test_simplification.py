@@ -0,0 +1,126 @@
+"""Tests for the simplification of linear operator expressions."""
+
+import unittest
+from tests.testing import NumpyAssertions
+import numpy as np
+
+from probnum.linalg import linops
+
+
+class SimplificationTestCase(unittest.TestCase, NumpyAssertions):
+    """Test case for the simplification of linear operators."""
+
+    def setUp(self):
+        """Resources for tests."""
+        np.random.seed(42)
+        self.n = 5
+        self.A = np.random.normal(size=(self.n, self.n))
+        self.B = np.random.normal(size=(self.n, self.n))
+        self.U = np.random.normal(size=(self.n, 2))
+        self.V = np.random.normal(size=(self.n, 2))
+        self.C = linops.LinearOperator(
+            shape=(self.n, self.n),
+            matvec=lambda x: np.cumsum(x, axis=0),
+            rmatvec=lambda x: np.cumsum(x[::-1], axis=0)[::-1],
+        )
+        self.C_dense = np.tril(np.ones((self.n, self.n)))
+
+    def test_simplified_operators_equivalent(self):
+        """Simplified linear operators must represent the same linear map."""
+        A, B, C = linops.MatrixMult(self.A), linops.MatrixMult(self.B), self.C
+        Id = linops.Identity(self.n)
+        W = linops.LowRankUpdate(A=A, U=self.U, V=self.V)
+        for op in [
+            A - 2 * Id + 0.5 * (B + Id),
+            3.0 * (C + A) - C,
+            -(C + A) + W + W.T,
+            Id @ A @ (2 * Id) @ B,
+            (A @ C @ B) + 2.0 * (A @ C @ B),
+            (C + A).T,
+            A ** 3 - C ** 2,
+            A @ W,
+        ]:
+            with self.subTest():
+                dense = op.todense()
+                X = np.random.normal(size=(self.n, 3))
+                self.assertAllClose(linops.simplify(op).todense(), dense)
+                self.assertAllClose(op @ X, dense @ X)
+                self.assertAllClose(op @ X[:, 0], dense @ X[:, 0])
+
+    def test_dense_terms_merged(self):
+        """Dense matrices and scalar multiples of the identity in a sum are merged into a single matrix."""
+        A = linops.MatrixMult(self.A)
+        op = 2.0 * A - linops.Identity(self.n) + 0.5 * (linops.MatrixMult(self.B) + A)
+        simplified = linops.simplify(op)
+        self.assertIsInstance(simplified, linops.MatrixMult)
+        self.assertAllClose(
+            simplified.todense(), 2.5 * self.A + 0.5 * self.B - np.eye(self.n)
+        )
+
+    def test_dense_factors_fused(self):
+        """Products of square dense matrices and scalars are fused into a single matrix."""
+        op = (
+            linops.MatrixMult(self.A)
+            @ (2.0 * linops.Identity(self.n))
+            @ linops.MatrixMult(self.B)
+        )
+        simplified = linops.simplify(op)
+        self.assertIsInstance(simplified, linops.MatrixMult)
+        self.assertAllClose(simplified.todense(), 2.0 * self.A @ self.B)
+
+    def test_lowrank_terms_merged(self):
+        """Sums of low-rank updates are merged into a single low-rank update."""
+        W1 = linops.LowRankUpdate(A=self.A, U=self.U, V=self.V)
+        W2 = linops.LowRankUpdate(A=self.B, U=self.V, V=self.U)
+        simplified = linops.simplify(W1 - 2.0 * W2 + linops.Identity(self.n))
+        self.assertIsInstance(simplified, linops.LowRankUpdate)
+        self.assertIsInstance(simplified.A, linops.MatrixMult)
+        self.assertEqual(simplified.update_rank, 4)
+
+    def test_application_plan_cached(self):
+        """The flattened expression tree is computed on the first application and reused."""
+        A = linops.MatrixMult(self.A)
+        op = self.C + 2.0 * self.C - A
+        op @ np.ones(self.n)
+        plan = op._simplified
+        op @ np.ones(self.n)
+        self.assertIs(op._simplified, plan)
+        self.assertEqual(len(plan.terms), 2)
+        self.assertIs(plan.terms[1], A)
+
+    def test_application_reflects_inplace_changes(self):
+        """Applying an expression does not use copies of the matrices of its operands."""
+        M = np.ones((3, 3))
+        A = linops.MatrixMult(M)
+        for op, fun in [
+            (A + A, lambda M: 2 * M),
+            (3.0 * (A @ A), lambda M: 3 * M @ M),
+        ]:
+            with self.subTest():
+                M[:] = 1.0
+                x = np.ones(3)
+                self.assertAllClose(op @ x, fun(M) @ x)
+                M[0, 0] = 100.0
+                self.assertAllClose(op @ x, fun(M) @ x)
+                self.assertAllClose(linops.simplify(op) @ x, fun(M) @ x)
+
+    def test_simplification_invalidated_on_matrix_reassignment(self):
+        """Reassigning the matrix of an operand invalidates the cached simplification."""
+        A, B = linops.MatrixMult(self.A), linops.MatrixMult(self.B)
+        op = 2.0 * A + B @ (A + self.C)
+        x = np.ones(self.n)
+        op @ x
+        A.A = self.B
+        self.assertAllClose(
+            op @ x, (2.0 * self.B + self.B @ (self.B + self.C_dense)) @ x
+        )
+        self.assertAllClose(
+            linops.simplify(op).todense(),
+            2.0 * self.B + self.B @ (self.B + self.C_dense),
+        )
+
+    def test_leaves_unchanged(self):
+        """Linear operators without arithmetic structure are returned as is."""
+        for op in [linops.MatrixMult(self.A), self.C, linops.Identity(self.n)]:
+            with self.subTest():
+                self.assertIs(linops.simplify(op), op)
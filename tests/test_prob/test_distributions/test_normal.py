@@ -6,6 +6,7 @@ from tests.testing import NumpyAssertions
 
 import numpy as np
 import scipy.sparse
+import scipy.stats
 
 from probnum import prob
 from probnum.linalg import linops
@@ -125,6 +126,24 @@ class NormalTestCase(unittest.TestCase, NumpyAssertions):
                 dist = prob.Normal(mean=mean, cov=cov)
                 pass
 
+    def test_multivariate_pdf_factorization_reused(self):
+        """Repeated density evaluations of a multivariate normal must match scipy."""
+        A = np.random.normal(size=(4, 4))
+        mean, cov = np.arange(4.0), A @ A.T + np.eye(4)
+        dist = prob.Normal(mean=mean, cov=cov)
+        for x in np.random.normal(size=(3, 4)):
+            with self.subTest():
+                self.assertApproxEqual(
+                    dist.logpdf(x),
+                    scipy.stats.multivariate_normal.logpdf(x, mean=mean, cov=cov),
+                    significant=10,
+                )
+                self.assertApproxEqual(
+                    dist.pdf(x),
+                    scipy.stats.multivariate_normal.pdf(x, mean=mean, cov=cov),
+                    significant=10,
+                )
+
     def test_normal_cdf(self):
         """Evaluate cdf at random input."""
         pass